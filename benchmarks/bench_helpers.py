@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+'''
+*
+* bench_helpers.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Shared helpers for the benchmarks
+*
+'''
+#
+# Constants
+#
+BENCH_PASSWORD = "benchmark_password"
+BENCH_PREFIX = "bench_"
+
+# Item counts and value sizes to measure across
+ITEM_COUNTS = ( 10, 1000 )
+VALUE_SIZES = ( 64, 16384 )
+
+# The modes an item can be stored in (passed to 'register')
+MODES = {
+    "local": { "backing_store": "local", "by_reference": True },
+    "local_copy": { "backing_store": "local", "by_reference": False },
+    "local_encrypt": { "backing_store": "local", "encrypt": True },
+    "redis": { "backing_store": "redis" },
+    "redis_encrypt": { "backing_store": "redis", "encrypt": True },
+}
+
+
+###########################################################################
+#
+# Helpers
+#
+###########################################################################
+#
+# make_value
+#
+def make_value(mode="local", size=64):
+    '''
+    Create a value of (approximately) the given size for the mode
+
+    Parameters:
+        mode: The mode the value will be stored in
+        size: Approximate size of the value in bytes
+
+    Return Value:
+        value: A string for redis modes, a dict otherwise
+    '''
+    if MODES[mode]["backing_store"] == "redis":
+        return "x" * size
+
+    # A nested structure so deep copies have some work to do
+    _leaf = "x" * max(size // 8, 1)
+    return { f"key_{_idx}": { "value": _leaf } for _idx in range(8) }
+
+
+#
+# populate
+#
+def populate(config, mode="local", count=10, size=64):
+    '''
+    Register a number of items in the config
+
+    Parameters:
+        config: The ApplicationConfig instance
+        mode: The mode to store the items in
+        count: The number of items to register
+        size: Approximate size of each value in bytes
+
+    Return Value:
+        list: The names of the items registered
+    '''
+    _names = [ f"{BENCH_PREFIX}{mode}_{_idx}" for _idx in range(count) ]
+    _value = make_value(mode=mode, size=size)
+
+    for _name in _names:
+        config.register(name=_name, value=_value, overwrite=True, **MODES[mode])
+
+    return _names
+
+
+#
+# cleanup
+#
+def cleanup(config, names=None):
+    '''
+    Delete items created by a benchmark
+
+    Parameters:
+        config: The ApplicationConfig instance
+        names: The names of the items to delete
+
+    Return Value:
+        None
+    '''
+    for _name in names or []:
+        if config.has_item(name=_name):
+            config.delete(name=_name)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+'''
+*
+* conftest.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmark Config
+*
+* Run with:
+*   python -m pytest benchmarks --benchmark-json=bench_output.json
+*
+* Redis benchmarks use the server given by the BENCH_REDIS_HOST/BENCH_REDIS_PORT
+* environment variables.  If not set, a fakeredis TCP server is started locally
+* as a stand-in.
+*
+'''
+import pytest
+import os
+import socket
+import threading
+
+from src.application_config.application_config import ApplicationConfig
+from bench_helpers import BENCH_PASSWORD
+
+
+###########################################################################
+#
+# Fixtures
+#
+###########################################################################
+#
+# redis_server
+#
+@pytest.fixture(scope="session")
+def redis_server():
+    '''
+    Provide the (host, port) of a redis server to benchmark against
+    '''
+    _host = os.getenv("BENCH_REDIS_HOST", default="")
+    if _host:
+        yield (_host, int(os.getenv("BENCH_REDIS_PORT", default="6379")))
+        return
+
+    # Start a fakeredis server on a free port
+    fakeredis = pytest.importorskip("fakeredis")
+
+    with socket.socket() as _sock:
+        _sock.bind(("127.0.0.1", 0))
+        _port = _sock.getsockname()[1]
+
+    _server = fakeredis.TcpFakeServer(("127.0.0.1", _port), server_type="redis")
+    _thread = threading.Thread(target=_server.serve_forever, daemon=True)
+    _thread.start()
+
+    yield ("127.0.0.1", _port)
+
+    _server.shutdown()
+    _server.server_close()
+
+
+#
+# bench_config
+#
+@pytest.fixture(scope="session")
+def bench_config(redis_server):
+    '''
+    An ApplicationConfig instance with redis and encryption configured
+    '''
+    _host, _port = redis_server
+    _config = ApplicationConfig(password=BENCH_PASSWORD, redis_host=_host,
+            redis_port=_port)
+
+    return _config
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+'''
+* test_bench_app_config.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - single threaded
+*
+'''
+import pytest
+
+from bench_helpers import MODES, ITEM_COUNTS, VALUE_SIZES
+from bench_helpers import make_value, populate, cleanup
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("size", VALUE_SIZES)
+@pytest.mark.parametrize("count", ITEM_COUNTS)
+@pytest.mark.parametrize("mode", MODES.keys())
+class TestBenchAppConfig():
+    #
+    # Record the parameters with the results
+    #
+    def _extra_info(self, benchmark, mode="", count=0, size=0):
+        benchmark.group = f"{mode}-{count}-{size}"
+        benchmark.extra_info["mode"] = mode
+        benchmark.extra_info["count"] = count
+        benchmark.extra_info["size"] = size
+
+
+    #
+    # register
+    #
+    def test_register(self, benchmark, bench_config, mode, count, size):
+        self._extra_info(benchmark, mode=mode, count=count, size=size)
+        _names = populate(bench_config, mode=mode, count=count, size=size)
+        _value = make_value(mode=mode, size=size)
+
+        benchmark(bench_config.register, name=_names[0], value=_value, overwrite=True,
+                **MODES[mode])
+
+        cleanup(bench_config, names=_names)
+
+
+    #
+    # set
+    #
+    def test_set(self, benchmark, bench_config, mode, count, size):
+        self._extra_info(benchmark, mode=mode, count=count, size=size)
+        _names = populate(bench_config, mode=mode, count=count, size=size)
+        _value = make_value(mode=mode, size=size)
+
+        benchmark(bench_config.set, name=_names[0], value=_value)
+
+        cleanup(bench_config, names=_names)
+
+
+    #
+    # get
+    #
+    def test_get(self, benchmark, bench_config, mode, count, size):
+        self._extra_info(benchmark, mode=mode, count=count, size=size)
+        _names = populate(bench_config, mode=mode, count=count, size=size)
+
+        _value = benchmark(bench_config.get, name=_names[-1])
+        assert _value
+
+        cleanup(bench_config, names=_names)
+
+
+    #
+    # has_item
+    #
+    def test_has_item(self, benchmark, bench_config, mode, count, size):
+        self._extra_info(benchmark, mode=mode, count=count, size=size)
+        _names = populate(bench_config, mode=mode, count=count, size=size)
+
+        assert benchmark(bench_config.has_item, name=_names[-1])
+
+        cleanup(bench_config, names=_names)
+
+
+    #
+    # delete
+    #
+    def test_delete(self, benchmark, bench_config, mode, count, size):
+        self._extra_info(benchmark, mode=mode, count=count, size=size)
+        _names = populate(bench_config, mode=mode, count=count, size=size)
+        _value = make_value(mode=mode, size=size)
+
+        # Each round needs an item to delete
+        def _setup():
+            bench_config.register(name=_names[0], value=_value, overwrite=True,
+                    **MODES[mode])
+
+        benchmark.pedantic(bench_config.delete, kwargs={ "name": _names[0] },
+                setup=_setup, rounds=200)
+
+        cleanup(bench_config, names=_names)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+'''
+* test_bench_binary.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - binary values
+*
+'''
+import pytest
+import base64
+import os
+
+from bench_helpers import BENCH_PREFIX, cleanup
+
+#
+# Constants
+#
+# Note - the fakeredis stand-in is much slower with payloads that aren't valid UTF-8,
+# so compare the redis results against a real server (see conftest.py)
+BINARY_SIZES = ( 16384, 1024 * 1024 )
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("size", BINARY_SIZES)
+@pytest.mark.parametrize("backing_store", ( "local", "redis" ))
+class TestBenchBinary():
+    #
+    # set - binary items are stored as they are
+    #
+    def test_set_binary(self, benchmark, bench_config, backing_store, size):
+        benchmark.group = f"binary-set-{backing_store}-{size}"
+        _name = f"{BENCH_PREFIX}binary"
+        _value = os.urandom(size)
+        bench_config.register(name=_name, value=_value, binary=True,
+                backing_store=backing_store, overwrite=True)
+
+        benchmark(bench_config.set, name=_name, value=_value)
+
+        cleanup(bench_config, names=[ _name ])
+
+
+    #
+    # set - the value is base64 encoded to be stored as a string (for comparison)
+    #
+    def test_set_base64(self, benchmark, bench_config, backing_store, size):
+        benchmark.group = f"binary-set-{backing_store}-{size}"
+        _name = f"{BENCH_PREFIX}binary"
+        _value = os.urandom(size)
+        bench_config.register(name=_name, value="", backing_store=backing_store,
+                overwrite=True)
+
+        benchmark(lambda: bench_config.set(name=_name, value=base64.b64encode(_value).decode()))
+
+        cleanup(bench_config, names=[ _name ])
+
+
+    #
+    # get_buffer - a view of the bytes
+    #
+    def test_get_buffer(self, benchmark, bench_config, backing_store, size):
+        benchmark.group = f"binary-get-{backing_store}-{size}"
+        _name = f"{BENCH_PREFIX}binary"
+        bench_config.register(name=_name, value=os.urandom(size), binary=True,
+                backing_store=backing_store, overwrite=True)
+
+        benchmark(bench_config.get_buffer, name=_name)
+
+        cleanup(bench_config, names=[ _name ])
+
+
+    #
+    # get - the base64 string is decoded (for comparison)
+    #
+    def test_get_base64(self, benchmark, bench_config, backing_store, size):
+        benchmark.group = f"binary-get-{backing_store}-{size}"
+        _name = f"{BENCH_PREFIX}binary"
+        bench_config.register(name=_name, value=base64.b64encode(os.urandom(size)).decode(),
+                backing_store=backing_store, overwrite=True)
+
+        benchmark(lambda: base64.b64decode(bench_config.get(name=_name)))
+
+        cleanup(bench_config, names=[ _name ])
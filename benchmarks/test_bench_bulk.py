@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+'''
+* test_bench_bulk.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - bulk encrypted registration
+*
+'''
+import pytest
+
+from bench_helpers import BENCH_PREFIX, cleanup
+
+
+#
+# Constants
+#
+BULK_COUNT = 2000
+BULK_WORKERS = ( 1, 2, 4, 8 )
+VALUE_SIZE = 1024
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("workers", BULK_WORKERS)
+class TestBenchBulk():
+    #
+    # Register encrypted items (workers = 1 is the serial case)
+    #
+    def test_register_many_encrypted(self, benchmark, bench_config, workers):
+        benchmark.group = "register_many-encrypted"
+        _items = { f"{BENCH_PREFIX}bulk_{_idx}": "x" * VALUE_SIZE for _idx in range(BULK_COUNT) }
+
+        _result = benchmark.pedantic(bench_config.register_many,
+                kwargs={ "items": _items, "encrypt": True, "overwrite": True,
+                        "workers": workers }, rounds=5)
+
+        benchmark.extra_info["workers"] = workers
+        benchmark.extra_info["items_per_second"] = _result["items_per_second"]
+
+        cleanup(bench_config, names=list(_items.keys()))
+
+
+    #
+    # Get (and decrypt) encrypted items
+    #
+    def test_get_many_encrypted(self, benchmark, bench_config, workers):
+        benchmark.group = "get_many-encrypted"
+        _items = { f"{BENCH_PREFIX}bulk_{_idx}": "x" * VALUE_SIZE for _idx in range(BULK_COUNT) }
+        bench_config.register_many(items=_items, encrypt=True, overwrite=True)
+
+        benchmark.pedantic(bench_config.get_many,
+                kwargs={ "names": list(_items.keys()), "workers": workers }, rounds=5)
+
+        benchmark.extra_info["workers"] = workers
+
+        cleanup(bench_config, names=list(_items.keys()))
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+'''
+* test_bench_cipher.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - encryption ciphers
+*
+'''
+import pytest
+
+from bench_helpers import BENCH_PREFIX, VALUE_SIZES, cleanup
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("size", VALUE_SIZES)
+@pytest.mark.parametrize("backing_store", ( "local", "redis" ))
+@pytest.mark.parametrize("cipher", ( "fernet", "aes-gcm", "chacha20-poly1305" ))
+class TestBenchCipher():
+    #
+    # Register an encrypted item, and record the size it is stored as
+    #
+    def _register(self, config, name="", cipher="", backing_store="local", size=0):
+        config.register(name=name, value="x" * size, encrypt=cipher,
+                backing_store=backing_store, overwrite=True)
+
+        if backing_store == "redis": return len(config._get_redis(name=name))
+        return len(config._get_local(name=name))
+
+
+    #
+    # set (encrypt)
+    #
+    def test_set(self, benchmark, bench_config, cipher, backing_store, size):
+        benchmark.group = f"cipher-set-{backing_store}-{size}"
+        _name = f"{BENCH_PREFIX}cipher"
+        benchmark.extra_info["stored_size"] = self._register(bench_config, name=_name,
+                cipher=cipher, backing_store=backing_store, size=size)
+
+        _value = "y" * size
+        benchmark(bench_config.set, name=_name, value=_value)
+
+        cleanup(bench_config, names=[ _name ])
+
+
+    #
+    # get (decrypt)
+    #
+    def test_get(self, benchmark, bench_config, cipher, backing_store, size):
+        benchmark.group = f"cipher-get-{backing_store}-{size}"
+        _name = f"{BENCH_PREFIX}cipher"
+        benchmark.extra_info["stored_size"] = self._register(bench_config, name=_name,
+                cipher=cipher, backing_store=backing_store, size=size)
+
+        _value = benchmark(bench_config.get, name=_name)
+        assert len(_value) == size
+
+        cleanup(bench_config, names=[ _name ])
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+'''
+* test_bench_compression.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - compression
+*
+'''
+import pytest
+import json
+
+from bench_helpers import BENCH_PREFIX, cleanup
+
+#
+# Constants
+#
+# Typical sizes of large values (10 KB to 5 MB)
+COMPRESS_SIZES = ( 10 * 1024, 256 * 1024, 5 * 1024 * 1024 )
+
+
+###########################################################################
+#
+# Helpers
+#
+###########################################################################
+#
+# _make_blob
+#
+def _make_blob(size=0):
+    ''' A JSON blob of (about) the given size, with the repetition of real config '''
+    _hosts = []
+    _size = 0
+    while _size < size:
+        _host = { "name": f"host-{len(_hosts)}.example.com", "port": 8000 + len(_hosts) % 100,
+                "enabled": len(_hosts) % 3 != 0 }
+        _hosts.append(_host)
+        _size += len(json.dumps(_host)) + 2
+
+    return { "hosts": _hosts }
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("size", COMPRESS_SIZES)
+@pytest.mark.parametrize("algorithm", ( False, "zlib", "lzma", "zstd", "lz4" ))
+class TestBenchCompression():
+    #
+    # Register a compressed item, and record the size it is stored as
+    #
+    def _register(self, benchmark, config, name="", algorithm="", value=None):
+        if algorithm == "zstd": pytest.importorskip("zstandard")
+        if algorithm == "lz4": pytest.importorskip("lz4.frame")
+
+        config.register(name=name, value=value, compress=algorithm, overwrite=True)
+
+        benchmark.extra_info["value_size"] = len(json.dumps(value))
+        benchmark.extra_info["stored_size"] = len(json.dumps(value)) if not algorithm \
+                else len(config._get_local(name=name))
+
+
+    #
+    # set (compress)
+    #
+    def test_set(self, benchmark, bench_config, algorithm, size):
+        benchmark.group = f"compression-set-{size}"
+        _name = f"{BENCH_PREFIX}compression"
+        _value = _make_blob(size=size)
+        self._register(benchmark, bench_config, name=_name, algorithm=algorithm, value=_value)
+
+        benchmark(bench_config.set, name=_name, value=_value)
+
+        cleanup(bench_config, names=[ _name ])
+
+
+    #
+    # get (decompress)
+    #
+    def test_get(self, benchmark, bench_config, algorithm, size):
+        benchmark.group = f"compression-get-{size}"
+        _name = f"{BENCH_PREFIX}compression"
+        _value = _make_blob(size=size)
+        self._register(benchmark, bench_config, name=_name, algorithm=algorithm, value=_value)
+
+        assert benchmark(bench_config.get, name=_name) == _value
+
+        cleanup(bench_config, names=[ _name ])
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+'''
+* test_bench_expiry.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - expiry checks on each call
+*
+'''
+import pytest
+
+from bench_helpers import BENCH_PREFIX, cleanup
+
+
+#
+# Constants
+#
+PENDING_COUNTS = ( 0, 10000 )
+PENDING_TIMEOUT = 3600
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("pending", PENDING_COUNTS)
+class TestBenchExpiry():
+    #
+    # Get an item while other items are waiting to expire (every call checks for
+    # expired items first)
+    #
+    def test_get_with_pending_expiry(self, benchmark, bench_config, pending):
+        benchmark.group = "get-with-pending-expiry"
+        _names = [ f"{BENCH_PREFIX}expiry_{_idx}" for _idx in range(pending) ]
+        if _names:
+            bench_config.register_many(items={ _name: "value" for _name in _names },
+                    timeout=PENDING_TIMEOUT, overwrite=True)
+
+        bench_config.register(name=f"{BENCH_PREFIX}expiry_get", value="value", overwrite=True)
+
+        benchmark(bench_config.get, name=f"{BENCH_PREFIX}expiry_get")
+        benchmark.extra_info["pending"] = pending
+
+        cleanup(bench_config, names=_names + [ f"{BENCH_PREFIX}expiry_get" ])
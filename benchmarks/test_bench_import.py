@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+'''
+* test_bench_import.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - import (cold start) time
+*
+'''
+import os
+import subprocess
+import sys
+
+
+#
+# Constants
+#
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE = "src.application_config"
+
+
+###########################################################################
+#
+# Helpers
+#
+###########################################################################
+#
+# _import_times
+#
+def _import_times(code=f"import {MODULE}"):
+    '''
+    Run the code in a new interpreter with 'python -X importtime'
+
+    Parameters:
+        code: The code to run
+
+    Return Value:
+        dict: Cumulative import time (in microseconds) for each module imported
+    '''
+    _result = subprocess.run([ sys.executable, "-X", "importtime", "-c", code ],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    # Lines look like: 'import time:       123 |        456 | module.name'
+    _times = {}
+    for _line in _result.stderr.splitlines():
+        if not _line.startswith("import time:"): continue
+
+        _fields = _line[len("import time:"):].split("|")
+        if not _fields[1].strip().isdigit(): continue
+
+        _times[_fields[2].strip()] = int(_fields[1])
+
+    return _times
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+class TestBenchImport():
+    #
+    # Import the module in a new interpreter
+    #
+    def test_import(self, benchmark):
+        _times = _import_times()
+
+        benchmark.extra_info["cumulative_us"] = _times[MODULE]
+        benchmark.extra_info["modules"] = len(_times)
+
+        # The backing store and encryption modules should only be loaded when used
+        assert "redis" not in _times
+        assert "crypto_tools" not in _times
+
+        benchmark.pedantic(_import_times, rounds=10)
+
+
+    #
+    # Import the module and create an instance with a password (key not derived)
+    #
+    def test_import_with_password(self, benchmark):
+        _code = "; ".join([
+            f"from {MODULE} import ApplicationConfig",
+            "ApplicationConfig(password='benchmark_password')"
+        ])
+
+        benchmark.pedantic(_import_times, kwargs={ "code": _code }, rounds=10)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+'''
+* test_bench_layers.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - layered lookup
+*
+'''
+import pytest
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+class TestBenchLayers():
+    #
+    # Resolve an item (cached after the first lookup)
+    #
+    def test_resolve(self, benchmark, bench_config):
+        benchmark.group = "resolve"
+        bench_config.set_default(name="bench_layers", value="default_value")
+        bench_config.set(name="bench_layers", value="local_value")
+
+        assert benchmark(bench_config.resolve, name="bench_layers") == "local_value"
+
+        bench_config.delete(name="bench_layers")
+        bench_config.delete_default(name="bench_layers")
+
+
+    #
+    # The equivalent lookup done by hand at the call site
+    #
+    def test_manual_lookup(self, benchmark, bench_config):
+        benchmark.group = "resolve"
+        bench_config.set(name="bench_layers", value="local_value")
+
+        def _lookup():
+            _value = bench_config.getenv(name="BENCH_LAYERS")
+            if _value is None: _value = bench_config.get(name="bench_layers")
+            if _value is None: _value = "default_value"
+            return _value
+
+        assert benchmark(_lookup) == "local_value"
+
+        bench_config.delete(name="bench_layers")
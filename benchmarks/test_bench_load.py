@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+'''
+* test_bench_load.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - loading config files
+*
+'''
+import pytest
+import json
+
+
+#
+# Constants
+#
+ITEM_COUNTS = ( 1000, 100000 )
+FORMATS = ( "json", "ndjson" )
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("count", ITEM_COUNTS)
+@pytest.mark.parametrize("format", FORMATS)
+class TestBenchLoad():
+    #
+    # Load a file of items in to the local store
+    #
+    def test_load_file(self, benchmark, bench_config, tmp_path, format, count):
+        benchmark.group = f"load_file-{count}"
+        _items = { f"key_{_idx}": { "value": _idx, "name": f"item {_idx}" }
+                for _idx in range(count) }
+
+        _path = tmp_path / f"config.{format}"
+        if format == "json":
+            _path.write_text(json.dumps(_items))
+        else:
+            _path.write_text("\n".join([ json.dumps({ _name: _value })
+                    for _name, _value in _items.items() ]))
+
+        _result = benchmark.pedantic(bench_config.load_file,
+                kwargs={ "path": str(_path), "namespace": "bench_load" }, rounds=3)
+
+        benchmark.extra_info["items_per_second"] = _result["items_per_second"]
+
+        for _name in _items.keys():
+            bench_config.delete(name=f"bench_load.{_name}")
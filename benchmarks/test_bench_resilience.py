@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+'''
+* test_bench_resilience.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - redis resilience
+*
+'''
+import pytest
+
+import redis
+
+from bench_helpers import BENCH_PREFIX, cleanup
+from src.application_config.application_config import REDIS_FAILURE_THRESHOLD, \
+        REDIS_RESET_TIMEOUT
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+class TestBenchResilience():
+    #
+    # get - waiting on redis (for comparison)
+    #
+    def test_get(self, benchmark, bench_config):
+        benchmark.group = "resilience-get"
+        _name = f"{BENCH_PREFIX}resilience"
+        bench_config.register(name=_name, value="x" * 64, backing_store="redis",
+                overwrite=True)
+
+        benchmark(bench_config.get, name=_name)
+
+        cleanup(bench_config, names=[ _name ])
+
+
+    #
+    # get with a deadline - the call is handed to a thread
+    #
+    def test_get_deadline(self, benchmark, bench_config):
+        benchmark.group = "resilience-get"
+        _name = f"{BENCH_PREFIX}resilience"
+        bench_config.register(name=_name, value="x" * 64, backing_store="redis",
+                overwrite=True)
+
+        benchmark(bench_config.get, name=_name, deadline_ms=1000)
+
+        cleanup(bench_config, names=[ _name ])
+
+
+    #
+    # get while the breaker is open - the stale value is served without calling redis
+    #
+    def test_get_stale(self, benchmark, bench_config, monkeypatch):
+        benchmark.group = "resilience-get"
+        _name = f"{BENCH_PREFIX}resilience"
+
+        bench_config.configure_resilience(failure_threshold=1, serve_stale=True)
+        bench_config.register(name=_name, value="x" * 64, backing_store="redis",
+                overwrite=True)
+
+        def _broken_exists(self, *names):
+            raise redis.exceptions.ConnectionError("Redis is down")
+
+        monkeypatch.setattr(redis.Redis, "exists", _broken_exists)
+        bench_config.get(name=_name)
+        assert bench_config.resilience_stats()["state"] == "open"
+
+        benchmark(bench_config.get, name=_name)
+
+        # Close the breaker again
+        monkeypatch.undo()
+        bench_config.configure_resilience(failure_threshold=REDIS_FAILURE_THRESHOLD,
+                reset_timeout=0, serve_stale=False)
+        cleanup(bench_config, names=[ _name ])
+        bench_config.configure_resilience(reset_timeout=REDIS_RESET_TIMEOUT)
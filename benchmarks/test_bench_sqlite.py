@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+'''
+* test_bench_sqlite.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - SQLite backing store
+*
+'''
+import pytest
+
+from bench_helpers import BENCH_PREFIX, cleanup
+
+
+#
+# Constants
+#
+SET_COUNT = 500
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+class TestBenchSQLite():
+    #
+    # A burst of sets (a batch size of 1 commits every set on its own)
+    #
+    @pytest.mark.parametrize("batch_size", ( 1, SET_COUNT ))
+    def test_set_burst(self, benchmark, bench_config, tmp_path, batch_size):
+        benchmark.group = f"sqlite-set-{SET_COUNT}"
+        bench_config._init_sqlite(path=str(tmp_path / "bench.db"), batch_size=batch_size)
+
+        _names = [ f"{BENCH_PREFIX}sqlite_{_idx}" for _idx in range(SET_COUNT) ]
+        bench_config.register_many(items={ _name: "0" for _name in _names },
+                backing_store="sqlite", overwrite=True)
+        bench_config.flush()
+
+        def _apply():
+            for _name in _names:
+                bench_config.set(name=_name, value="1")
+
+            bench_config.flush()
+
+        benchmark.pedantic(_apply, rounds=5)
+
+        cleanup(bench_config, names=_names)
+        bench_config._close_sqlite()
+
+
+    #
+    # Reads are served from the cache
+    #
+    def test_get(self, benchmark, bench_config, tmp_path):
+        benchmark.group = f"sqlite-get-{SET_COUNT}"
+        bench_config._init_sqlite(path=str(tmp_path / "bench.db"))
+
+        _names = [ f"{BENCH_PREFIX}sqlite_{_idx}" for _idx in range(SET_COUNT) ]
+        bench_config.register_many(items={ _name: "0" for _name in _names },
+                backing_store="sqlite", overwrite=True)
+        bench_config.flush()
+
+        def _read():
+            for _name in _names:
+                bench_config.get(name=_name)
+
+        benchmark.pedantic(_read, rounds=5)
+
+        cleanup(bench_config, names=_names)
+        bench_config._close_sqlite()
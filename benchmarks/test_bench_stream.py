@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+'''
+* test_bench_stream.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - streams
+*
+'''
+import pytest
+import tracemalloc
+
+from bench_helpers import BENCH_PREFIX, cleanup
+
+#
+# Constants
+#
+# Note - the fakeredis stand-in can't send replies much larger than these, and as it
+# runs in this process the peak memory includes what it uses to hold the value.  Use
+# a real server for larger sizes (see conftest.py)
+STREAM_SIZES = ( 1024 * 1024, 4 * 1024 * 1024 )
+
+
+###########################################################################
+#
+# Helpers
+#
+###########################################################################
+#
+# _peak_memory
+#
+def _peak_memory(func):
+    ''' Run a function, and get the peak memory allocated while it ran '''
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+#
+# _pieces
+#
+def _pieces(size=0, piece_size=64 * 1024):
+    ''' Generate a value of the given size in pieces (as if read from a file) '''
+    for _offset in range(0, size, piece_size):
+        yield b"x" * min(piece_size, size - _offset)
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("size", STREAM_SIZES)
+class TestBenchStream():
+    #
+    # set_stream - sent in chunks, without the whole value in memory
+    #
+    def test_set_stream(self, benchmark, bench_config, size):
+        benchmark.group = f"stream-set-{size}"
+        _name = f"{BENCH_PREFIX}stream"
+
+        benchmark.extra_info["peak_memory"] = _peak_memory(
+                lambda: bench_config.set_stream(name=_name, data=_pieces(size=size)))
+        benchmark.pedantic(bench_config.set_stream,
+                kwargs={ "name": _name, "data": _pieces(size=size) }, rounds=3)
+
+        bench_config.delete_stream(name=_name)
+
+
+    #
+    # set - a single SET of the whole value (for comparison)
+    #
+    def test_set(self, benchmark, bench_config, size):
+        benchmark.group = f"stream-set-{size}"
+        _name = f"{BENCH_PREFIX}stream"
+        bench_config.register(name=_name, value=b"", binary=True, backing_store="redis",
+                overwrite=True)
+
+        benchmark.extra_info["peak_memory"] = _peak_memory(
+                lambda: bench_config.set(name=_name, value=b"".join(_pieces(size=size))))
+        benchmark.pedantic(lambda: bench_config.set(name=_name,
+                value=b"".join(_pieces(size=size))), rounds=3)
+
+        cleanup(bench_config, names=[ _name ])
+
+
+    #
+    # get_stream - read (and discard) a chunk at a time
+    #
+    def test_get_stream(self, benchmark, bench_config, size):
+        benchmark.group = f"stream-get-{size}"
+        _name = f"{BENCH_PREFIX}stream"
+        bench_config.set_stream(name=_name, data=_pieces(size=size))
+
+        def _read():
+            for _ in bench_config.get_stream(name=_name): pass
+
+        benchmark.extra_info["peak_memory"] = _peak_memory(_read)
+        benchmark.pedantic(_read, rounds=3)
+
+        bench_config.delete_stream(name=_name)
+
+
+    #
+    # get - a single GET of the whole value (for comparison)
+    #
+    def test_get(self, benchmark, bench_config, size):
+        benchmark.group = f"stream-get-{size}"
+        _name = f"{BENCH_PREFIX}stream"
+        bench_config.register(name=_name, value=b"".join(_pieces(size=size)), binary=True,
+                backing_store="redis", overwrite=True)
+
+        benchmark.extra_info["peak_memory"] = _peak_memory(
+                lambda: bench_config.get(name=_name))
+        benchmark.pedantic(bench_config.get, kwargs={ "name": _name }, rounds=3)
+
+        cleanup(bench_config, names=[ _name ])
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+'''
+* test_bench_threads.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - multithreaded
+*
+'''
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_helpers import MODES, make_value, populate, cleanup
+
+
+#
+# Constants
+#
+THREAD_COUNTS = ( 1, 4, 16 )
+OPS_PER_THREAD = 200
+ITEM_COUNT = 100
+VALUE_SIZE = 1024
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("threads", THREAD_COUNTS)
+@pytest.mark.parametrize("mode", MODES.keys())
+class TestBenchAppConfigThreads():
+    #
+    # Run a worker function in a number of threads
+    #
+    def _run_threads(self, benchmark, worker=None, threads=1):
+        _pool = ThreadPoolExecutor(max_workers=threads)
+
+        def _run():
+            _futures = [ _pool.submit(worker, _idx) for _idx in range(threads) ]
+            for _future in _futures: _future.result()
+
+        benchmark(_run)
+        _pool.shutdown()
+
+
+    #
+    # Concurrent reads
+    #
+    def test_threaded_get(self, benchmark, bench_config, mode, threads):
+        benchmark.group = f"threads-get-{mode}"
+        benchmark.extra_info["ops"] = threads * OPS_PER_THREAD
+        _names = populate(bench_config, mode=mode, count=ITEM_COUNT, size=VALUE_SIZE)
+
+        def _worker(idx):
+            for _op in range(OPS_PER_THREAD):
+                bench_config.get(name=_names[(idx + _op) % ITEM_COUNT])
+
+        self._run_threads(benchmark, worker=_worker, threads=threads)
+        cleanup(bench_config, names=_names)
+
+
+    #
+    # Mixed reads and writes (1 write for every 4 reads)
+    #
+    def test_threaded_mixed(self, benchmark, bench_config, mode, threads):
+        benchmark.group = f"threads-mixed-{mode}"
+        benchmark.extra_info["ops"] = threads * OPS_PER_THREAD
+        _names = populate(bench_config, mode=mode, count=ITEM_COUNT, size=VALUE_SIZE)
+        _value = make_value(mode=mode, size=VALUE_SIZE)
+
+        def _worker(idx):
+            for _op in range(OPS_PER_THREAD):
+                _name = _names[(idx + _op) % ITEM_COUNT]
+                if _op % 5 == 0:
+                    bench_config.set(name=_name, value=_value)
+                else:
+                    bench_config.get(name=_name)
+
+        self._run_threads(benchmark, worker=_worker, threads=threads)
+        cleanup(bench_config, names=_names)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+'''
+* test_bench_transaction.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - transactions
+*
+'''
+import pytest
+
+from bench_helpers import BENCH_PREFIX, cleanup
+
+
+#
+# Constants
+#
+CHANGE_COUNT = 500
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("backing_store", ( "local", "redis" ))
+class TestBenchTransaction():
+    #
+    # Register the items to be changed
+    #
+    def _register(self, config, backing_store="local"):
+        _names = [ f"{BENCH_PREFIX}txn_{_idx}" for _idx in range(CHANGE_COUNT) ]
+        config.register_many(items={ _name: "0" for _name in _names },
+                backing_store=backing_store, overwrite=True)
+
+        return _names
+
+
+    #
+    # Apply the change with individual sets
+    #
+    def test_set(self, benchmark, bench_config, backing_store):
+        benchmark.group = f"apply-{CHANGE_COUNT}-changes-{backing_store}"
+        _names = self._register(bench_config, backing_store=backing_store)
+
+        def _apply():
+            for _name in _names:
+                bench_config.set(name=_name, value="1")
+
+        benchmark.pedantic(_apply, rounds=5)
+
+        cleanup(bench_config, names=_names)
+
+
+    #
+    # Apply the change in a transaction
+    #
+    def test_transaction(self, benchmark, bench_config, backing_store):
+        benchmark.group = f"apply-{CHANGE_COUNT}-changes-{backing_store}"
+        _names = self._register(bench_config, backing_store=backing_store)
+
+        def _apply():
+            with bench_config.transaction() as _txn:
+                for _name in _names:
+                    _txn.set(name=_name, value="1")
+
+        benchmark.pedantic(_apply, rounds=5)
+
+        cleanup(bench_config, names=_names)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+'''
+* test_bench_watch.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - reloading config files
+*
+'''
+import pytest
+import itertools
+import json
+
+
+#
+# Constants
+#
+ITEM_COUNTS = ( 1000, 50000 )
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("count", ITEM_COUNTS)
+class TestBenchWatch():
+    #
+    # Write the file, with one item changed in each round
+    #
+    def _setup(self, path=None, count=0, rounds=None):
+        _items = { f"key_{_idx}": { "value": _idx, "name": f"item {_idx}" }
+                for _idx in range(count) }
+        _items["key_0"]["value"] = next(rounds)
+        path.write_text(json.dumps(_items))
+
+
+    #
+    # Reload the file (only the changed item is set)
+    #
+    def test_reload_file(self, benchmark, bench_config, tmp_path, count):
+        benchmark.group = f"reload-{count}"
+        _path = tmp_path / "config.json"
+        _rounds = itertools.count()
+
+        self._setup(path=_path, count=count, rounds=_rounds)
+        bench_config.watch_file(path=str(_path), namespace="bench_watch", interval=60)
+
+        _result = benchmark.pedantic(bench_config.reload_file, kwargs={ "path": str(_path) },
+                setup=lambda: self._setup(path=_path, count=count, rounds=_rounds), rounds=5)
+        assert _result == { "added": 0, "changed": 1, "removed": 0 }
+
+        bench_config.unwatch_file(path=str(_path))
+        for _idx in range(count):
+            bench_config.delete(name=f"bench_watch.key_{_idx}")
+
+
+    #
+    # Load the whole file again (for comparison)
+    #
+    def test_load_file(self, benchmark, bench_config, tmp_path, count):
+        benchmark.group = f"reload-{count}"
+        _path = tmp_path / "config.json"
+        _rounds = itertools.count()
+
+        benchmark.pedantic(bench_config.load_file,
+                kwargs={ "path": str(_path), "namespace": "bench_watch" },
+                setup=lambda: self._setup(path=_path, count=count, rounds=_rounds), rounds=5)
+
+        for _idx in range(count):
+            bench_config.delete(name=f"bench_watch.key_{_idx}")
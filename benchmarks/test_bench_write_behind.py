@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+'''
+* test_bench_write_behind.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Benchmarks for the application config class - write-behind for redis
+*
+'''
+import pytest
+
+from bench_helpers import BENCH_PREFIX, cleanup
+
+
+#
+# Constants
+#
+ITEM_COUNT = 100
+SET_COUNT = 2000
+
+
+###########################################################################
+#
+# The benchmarks...
+#
+###########################################################################
+@pytest.mark.parametrize("write_behind", ( False, True ))
+class TestBenchWriteBehind():
+    #
+    # Repeated sets of a small number of redis items (metrics style updates), with
+    # a flush at the end so the write-behind case includes sending the values
+    #
+    def test_set_redis(self, benchmark, bench_config, write_behind):
+        benchmark.group = "set-redis-repeated"
+        _names = [ f"{BENCH_PREFIX}wb_{_idx}" for _idx in range(ITEM_COUNT) ]
+        for _name in _names:
+            bench_config.register(name=_name, value="0", backing_store="redis",
+                    overwrite=True, write_behind=write_behind)
+
+        def _set_values():
+            for _idx in range(SET_COUNT):
+                bench_config.set(name=_names[_idx % ITEM_COUNT], value=str(_idx))
+            bench_config.flush()
+
+        benchmark.pedantic(_set_values, rounds=3)
+        benchmark.extra_info["write_behind"] = write_behind
+
+        cleanup(bench_config, names=_names)
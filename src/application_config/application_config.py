@@ -9,18 +9,118 @@
 * Application Config Info
 *
 '''
-from redis import Redis
-from threading import Lock
+from threading import Lock, Thread, Condition, Event, BoundedSemaphore
 import copy
+import functools
+import logging
 import os
-from datetime import datetime, timezone
+import sys
+from collections import OrderedDict, deque
 import json
+import hashlib
+import time
+import atexit
+import heapq
+import itertools
+import math
+import bisect
 
-import crypto_tools
+from . import loaders
+from . import compressors
+
+# NOTE: 'redis' and 'crypto_tools' are imported when first used rather than here,
+# to keep the import (and startup) time of this module down
 
 #
 # Constants
 #
+# Bulk encryption/decryption is only spread over a thread pool above this many values
+BULK_CRYPT_THRESHOLD = 64
+
+# Ciphers for encrypted items ('encrypt=True' is the same as "fernet").  The AEAD
+# ciphers are faster and add a fixed 34 bytes rather than around a third of the size
+CIPHERS = ( "fernet", "aes-gcm", "chacha20-poly1305" )
+
+# Compression algorithms for items registered with 'compress' ('compress=True' is the
+# algorithm set with 'configure_compression', "zlib" by default)
+COMPRESSORS = compressors.COMPRESSORS
+
+# Re-encryption with the newest key after 'rotate_key' - the number of items done at
+# a time, and the seconds between batches (so it doesn't hold up other work)
+REKEY_BATCH_SIZE = 100
+REKEY_INTERVAL = 0.1
+
+# Write-behind defaults - seconds between flushes, and the number of buffered writes
+# that trigger a flush before the interval is up
+WRITE_BEHIND_INTERVAL = 0.1
+WRITE_BEHIND_MAX_BATCH = 1000
+
+# The expiry heap keeps the entries of replaced (or cleared) deadlines until they come up.
+# It is rebuilt without them once it has more than this many entries, and more than this
+# many times the number of items with a deadline
+EXPIRY_COMPACT_SIZE = 1024
+EXPIRY_COMPACT_RATIO = 2
+
+# Redis sets of the names of redis items with each tag are kept in keys with this prefix
+TAG_KEY_PREFIX = "__tag__:"
+
+# Streams (see 'set_stream') - keys have this prefix, values are split in to chunks of
+# this many bytes, and this many chunks are sent (or fetched) in each request.  The
+# chunks of a replaced version are kept this many seconds for readers still using it
+STREAM_KEY_PREFIX = "__stream__:"
+STREAM_CHUNK_SIZE = 1024 * 1024
+STREAM_BATCH_CHUNKS = 8
+STREAM_GRACE_PERIOD = 60
+
+# Redis resilience (see 'configure_resilience') - the consecutive failures that open the
+# circuit breaker, the seconds before a call is let through to see if redis is back, and
+# the threads used to make calls with a deadline (the most that can be waiting on redis)
+REDIS_FAILURE_THRESHOLD = 5
+REDIS_RESET_TIMEOUT = 5
+REDIS_DEADLINE_WORKERS = 16
+
+# Stale copies of redis values (see 'configure_resilience') are limited to this many bytes
+# (the least recently updated are dropped first)
+REDIS_STALE_MAX_BYTES = 64 * 1024 * 1024
+
+# Eviction policies when the local store is over its memory budget (see 'configure_memory')
+EVICTION_POLICIES = ( "lru", "lfu" )
+
+# Reads of local items are recorded (for eviction) without the lock, and applied on the
+# next write.  At most this many are kept in between (older reads are dropped)
+MEMORY_PENDING_READS = 10000
+
+# What a forked child does with the local items it inherits (see 'configure_fork')
+FORK_LOCAL_STATES = ( "keep", "clear" )
+
+# Seconds to wait for each lock (other than the store lock) before a fork.  A lock still
+# held after this (such as one held by the thread forking) is left, rather than the fork
+# deadlocking
+FORK_LOCK_TIMEOUT = 1
+
+# The sources 'resolve' can look up a config item in (in the default order of precedence)
+LAYERS = ( "override", "redis", "sqlite", "env", "local", "default" )
+
+# Strings accepted as booleans in environment variables
+ENV_TRUE_VALUES = ( "1", "true", "yes", "on", "y", "t" )
+ENV_FALSE_VALUES = ( "0", "false", "no", "off", "n", "f", "" )
+
+# Header of AEAD encrypted values - a version byte (Fernet tokens start with 0x80),
+# the cipher, and the ID of the key.  The nonce and the ciphertext (with its tag) follow
+_AEAD_VERSION = 1
+_AEAD_CIPHER_IDS = { "aes-gcm": 1, "chacha20-poly1305": 2 }
+_AEAD_NONCE_SIZE = 12
+
+# Key IDs are the first bytes of the SHA256 of the key.  Fernet tokens are prefixed
+# with this, then the key ID in hex
+_KEY_ID_SIZE = 4
+_FERNET_KEY_PREFIX = "k"
+
+# Markers for values that aren't cached or don't exist
+_MISSING = object()
+_NOT_FOUND = object()
+
+_logger = logging.getLogger(__name__)
 
 
 ###########################################################################
@@ -40,7 +140,7 @@ class ConfigExpiryClass():
         Parameters:
             args: Unannamed arguments
             name: The name of the item
-            backing_store: Where the variable is stored (local or redis)
+            backing_store: Where the variable is stored (local, redis or sqlite)
             kwargs: Named arguments.
 
         Return Value:
@@ -65,17 +165,22 @@ class ConfigMetaClass():
     # __init__
     #
     def __init__(self, *args, backing_store="local", by_reference=True,
-                constant=False, encrypt=False, timeout=0, **kwargs):
+                constant=False, encrypt=False, timeout=0, write_behind=False, tags=None,
+                compress=False, binary=False, **kwargs):
         '''
         Class Constructor
 
         Parameters:
             args: Unannamed arguments
-            backing_store: Where the variable is stored (local or redis)
+            backing_store: Where the variable is stored (local, redis or sqlite)
             by_reference: Is a copy made of the value or is stored by reference
                 (if a redis value, it is always copied)
             constant: Is the item a constant (ie can't be changed)
-            timeout: Number of seconds before the value is expired (0 = no expiry)
+            timeout: Number of seconds before the value is expired (0 = no expiry, may be fractional)
+            write_behind: Are writes to redis buffered and sent in the background
+            tags: Tags for the item (a string, or a list of strings)
+            compress: Is the value compressed (True, or the algorithm)
+            binary: Is the value binary (bytes, or an object supporting the buffer protocol)
             kwargs: Named arguments.
 
         Return Value:
@@ -89,6 +194,10 @@ class ConfigMetaClass():
         self.by_reference = by_reference
         self.constant = constant
         self.encrypt = encrypt
+        self.write_behind = write_behind
+        self.tags = frozenset([ tags ]) if isinstance(tags, str) else frozenset(tags or ())
+        self.compress = compress
+        self.binary = binary
 
         if timeout >= 0:
             self.timeout = timeout
@@ -98,835 +207,6566 @@ class ConfigMetaClass():
 
 ###########################################################################
 #
-# ApplicationConfig Class
+# ConfigSnapshotClass Class
 #
 ###########################################################################
-class ApplicationConfig():
-    ''' Shared Application Config '''
-    # Private Class Attributes
-    __lock = Lock()
-    __lock_env = Lock()
-    __conf = {}
-    __conf_meta = {}
-    __conf_expiry = {}
-    __redis = None
-    __key = None
-
-    # Using a fixed salt so we always derive the same key from the password
-    __salt = b'a%Z\xe9\xc3N\x96\x82\xc5|#e\xfd1b&'
-
-
+class ConfigSnapshotClass():
+    ''' Class for a read only view of the local store at a generation '''
     #
     # __init__
     #
-    def __init__(self, *args, password="", **kwargs):
+    def __init__(self, *args, config=None, generation=0, **kwargs):
         '''
         Class Constructor
 
         Parameters:
             args: Unannamed arguments
-            password: A password used to derive an encryption key
-            kwargs: Named arguments.  Anything beginning with 'redis_' will be passed as an arg
-                to connect to Redis.  This allows the connection to Redis to be fully customised.
-                If 'redis_host' is set, an attempt will be made to connect to Redis, and redis will
-                be used as the backing store for the ApplicationConfig Module.
+            config: The ApplicationConfig class the snapshot is of
+            generation: The generation of the local store the snapshot is of
+            kwargs: Named arguments.
 
         Return Value:
             None
         '''
-        # Extract the args for the redis connection
-        _connect_to_redis = False
-        _redis_args = {}
-        _new_kwargs = {}
+        assert config
 
-        for _key, _value in kwargs.items():
-            if _key.find("redis_") == 0:
-                _new_key = _key.replace("redis_", "")
-                _redis_args[_new_key] = _value
+        # Call the parent class initiator 
+        super().__init__(*args, **kwargs)
 
-                # If we have a server specified, we can connect to redis
-                if _new_key == "host": _connect_to_redis = True
+        # Set the values
+        self.__config = config
+        self.__closed = False
+        self.generation = generation
 
-            else:
-                # Add this to the remaining kwargs
-                _new_kwargs[_key] = _value
 
-        # Pass the remaining arguments on to parent class initiator 
-        super().__init__(*args, **_new_kwargs)
+    #
+    # __enter__
+    #
+    def __enter__(self):
+        return self
 
-        # Initialise Encryption if a password was provided
-        if password:
-            _, __class__.__key = crypto_tools.fernet.derive_key(
-                    salt=__class__.__salt, password=password)
 
-        # Connect to redis if required
-        if _connect_to_redis:
-            self._init_redis(**_redis_args)
+    #
+    # __exit__
+    #
+    def __exit__(self, *args):
+        self.close()
 
 
     #
-    # _init_redis
+    # get
     #
-    @classmethod
-    def _init_redis(cls, **kwargs):
+    def get(self, name=None, default=None):
         '''
-        Initialise the connection to Redis
+        Get the value of an item as it was when the snapshot was taken
 
         Parameters:
-            kwargs: Named arguments - Passed directly to Redis
+            name: Name of the config item
+            default: Value to return if the item didn't exist
 
         Return Value:
-            None
+            value: The config item value
         '''
-        # Overwrite certain values for our use
-        if not "port" in kwargs: kwargs["port"] = 6379
-        kwargs["decode_responses"] = True
+        assert name
+        if self.__closed: raise RuntimeError("Snapshot has been closed")
 
-        cls.__redis = Redis(**kwargs)
+        _value = self.__config._get_snapshot(name=name, generation=self.generation)
+        if _value is _MISSING: return default
 
-        # Try an action on redis to see if connection works
-        # Should raise an exception if connection doesn't work
-        cls.__redis.exists("__connection_test__")
+        return _value
 
 
     #
-    # _init_encryption
+    # has_item
     #
-    @classmethod
-    def _init_encryption(cls, password=""):
+    def has_item(self, name=None):
         '''
-        Initialise the encryption component
+        Determine if an item existed when the snapshot was taken
 
         Parameters:
-            password: A password used to create the encryption key
+            name: Name of the config item
 
         Return Value:
-            None
+            Boolean: True if the item existed, False otherwise
         '''
-        _, cls.__key = crypto_tools.fernet.derive_key(salt=cls.__salt, password=password)
+        assert name
+        if self.__closed: raise RuntimeError("Snapshot has been closed")
+
+        return self.__config._get_snapshot(name=name, generation=self.generation) is not _MISSING
 
 
-    ###########################################################################
-    #
-    # Helper functions
-    #
-    ###########################################################################
     #
-    # __timestamp
+    # close
     #
-    @staticmethod
-    def __timestamp(offset=0):
+    def close(self):
         '''
-        Create a timestamp (in seconds) since the epoch to now
+        Close the snapshot (the history it needed can then be discarded)
 
         Parameters:
-            offset: Number of seconds to offset the timestamp by
+            None
 
         Return Value:
-            int: The number of seconds since the epoch to now, +/- offset
+            None
         '''
-        assert isinstance(offset, int)
-
-        # Get the current time
-        _now = datetime.now(timezone.utc)
+        if self.__closed: return
 
-        # Return the timestamp
-        return int(_now.timestamp()) + offset
+        self.__closed = True
+        self.__config._release_snapshot(generation=self.generation)
 
 
+###########################################################################
+#
+# ConfigTransactionClass Class
+#
+###########################################################################
+class ConfigTransactionClass():
+    ''' Class to stage changes to a number of items and apply them together '''
     #
-    # __item_maintenance
+    # __init__
     #
-    @classmethod
-    def __item_maintenance(cls):
+    def __init__(self, *args, config=None, **kwargs):
         '''
-        Perform maintenance on items (such as expiry)
+        Class Constructor
 
         Parameters:
-            None
+            args: Unannamed arguments
+            config: The ApplicationConfig class the changes are applied to
+            kwargs: Named arguments.
 
         Return Value:
             None
         '''
-        # Process the expiry list
-        _now = cls.__timestamp()
-        for _key in sorted(cls.__conf_expiry.keys()):
-            # Stop processing if the timestamps are in the future
-            if _now < _key: break
+        assert config
 
-            if cls.__conf_expiry[_key].backing_store == "local":
-                # Remove the item from the local store
-                cls._delete_local(name=cls.__conf_expiry[_key].name)
+        # Call the parent class initiator 
+        super().__init__(*args, **kwargs)
 
-            # Delete the metadata
-            if cls.__conf_expiry[_key].name in cls.__conf_meta:
-                del cls.__conf_meta[cls.__conf_expiry[_key].name]
+        # Set the values (staged changes are name -> value, or _MISSING for a delete)
+        self.__config = config
+        self.__changes = {}
+        self.__done = False
 
-            # Remove the expiry entry
-            cls.__lock.acquire()
-            del cls.__conf_expiry[_key]
 
-            cls.__lock.release()
+    #
+    # __enter__
+    #
+    def __enter__(self):
+        return self
 
 
     #
-    # to_json
-    # 
-    @staticmethod
-    def to_json(data=None):
+    # __exit__
+    #
+    def __exit__(self, exc_type, *args):
+        # Only apply the changes if the block completed
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+
+    #
+    # set
+    #
+    def set(self, name=None, value=None):
         '''
-        Convert the data to a JSON string
+        Stage setting a config item
 
         Parameters:
-            data: The data to be converted
+            name: Name of the config item
+            value: The config item value
 
         Return Value:
-            string: JSON representation of the data
+            None
         '''
-        if not data: return ""
-
-        # Is the data already a string?
-        if isinstance(data, str): return data
+        assert name
+        if self.__done: raise RuntimeError("Transaction has already been completed")
 
-        # This might fail if the data can't be formatted as JSON
-        try:
-            return json.dumps(data)
-        except:
-            return ""
+        self.__config._check_change(name=name, value=value)
+        self.__changes[name] = value
 
 
     #
-    # from_json
+    # delete
     #
-    @staticmethod
-    def from_json(data=None):
+    def delete(self, name=None):
         '''
-        Convert a JSON string to python data
+        Stage deleting a config item (items that don't exist are ignored)
 
         Parameters:
-            json_data: String containing the JSON Info
+            name: Name of the config item
 
         Return Value:
-            obj: The python representation of the data
+            None
         '''
-        if not data: return None
+        assert name
+        if self.__done: raise RuntimeError("Transaction has already been completed")
 
-        # This will fail if the data isn't in JSON format
-        try:
-            return json.loads(data)
-        except:
-            # Error converting - If data is a string just return it
-            if isinstance(data, str):
-                return data
-            else:
-                return None
+        self.__config._check_change(name=name, value=_MISSING)
+        self.__changes[name] = _MISSING
 
 
-    ###########################################################################
-    #
-    # Encryption functions
-    #
-    ###########################################################################
     #
-    # __encrypt
+    # commit
     #
-    @classmethod
-    def __encrypt(cls, data=""):
+    def commit(self):
         '''
-        Encrypt the data string
+        Apply the staged changes
 
         Parameters:
-            data: A string value to be encrypted
+            None
 
         Return Value:
-            string: The encrypted string
+            None
         '''
-        if not cls.__key: raise RuntimeError("Encryption Key has not been configured")
+        if self.__done: raise RuntimeError("Transaction has already been completed")
 
-        _encrypted_data = crypto_tools.fernet.encrypt(data=data, key=cls.__key).decode()
-
-        if not _encrypted_data:
-            return ""
-        else:
-            return _encrypted_data
+        self.__done = True
+        self.__config._commit_changes(changes=self.__changes)
 
 
     #
-    # __decrypt
+    # rollback
     #
-    @classmethod
-    def __decrypt(cls, data=""):
+    def rollback(self):
         '''
-        Decrypt the data string
+        Discard the staged changes
 
         Parameters:
-            data: A string value containing encrypted data
+            None
 
         Return Value:
-            string: The decrypted string
+            None
         '''
-        if not cls.__key: raise RuntimeError("Encryption Key has not been configured")
-    
-        _decrypted_data = crypto_tools.fernet.decrypt(data=data, key=cls.__key)
-
-        if not _decrypted_data:
-            return ""
-        else:
-            return _decrypted_data
+        self.__done = True
+        self.__changes = {}
 
 
-    ###########################################################################
-    #
-    # Access methods for local
-    #
-    ###########################################################################
+###########################################################################
+#
+# ConfigWatchClass Class
+#
+###########################################################################
+class ConfigWatchClass():
+    ''' Class to define a config file that is reloaded when it changes '''
     #
-    # _set_local
+    # __init__
     #
-    @classmethod
-    def _set_local(cls, name=None, value=None, by_reference=True, timeout=0):
+    def __init__(self, *args, path="", format=None, namespace="", backing_store="local",
+                 encrypt=False, on_error=None, **kwargs):
         '''
-        Set a value locally
+        Class Constructor
 
         Parameters:
-            name: Name of the config item
-            value: The config item value
-            by_reference: Store a reference to the object or a deep copy
-            timeout: Number of seconds before the item should be deleted (0 = never)
+            args: Unannamed arguments
+            path: Path of the config file
+            format: The format of the file (see load_file)
+            namespace: The prefix of the config item names (see load_file)
+            backing_store: Where the config items are stored
+            encrypt: Are the config items encrypted (True, or the cipher)
+            on_error: Function called (with the path and the exception) when a reload in
+                the background fails
+            kwargs: Named arguments.
 
         Return Value:
-            Boolean: True is successful, False Otherwise (exception will be raised)
+            None
         '''
-        assert name
-        assert timeout >= 0
+        # Call the parent class initiator 
+        super().__init__(*args, **kwargs)
 
-        cls.__lock.acquire()
+        # Set the values
+        self.path = path
+        self.format = format
+        self.namespace = namespace
+        self.backing_store = backing_store
+        self.encrypt = encrypt
+        self.on_error = on_error
 
-        if by_reference:
-            cls.__conf[name] = value
-        else:
-            cls.__conf[name] = copy.deepcopy(value)
+        # The items in the file when it was last loaded (name -> value)
+        self.items = {}
 
-        # Set the expiry for the value
-        if timeout:
-            _timestamp = cls.__timestamp(offset=timeout)
-            cls.__conf_expiry[_timestamp] = ConfigExpiryClass(name=name,
-                    backing_store="local")
 
-        cls.__lock.release()
+###########################################################################
+#
+# ApplicationConfig Class
+#
+###########################################################################
+class ApplicationConfig():
+    ''' Shared Application Config '''
+    # Private Class Attributes
+    __lock = Lock()
+    __lock_env = Lock()
+    __env_cache = {}
+    __conf = {}
+    __conf_meta = {}
+    __tags = {}
+    __conf_expiry = []
+    __expiry_deadlines = {}
+    __expiry_seq = itertools.count()
+    __redis = None
+    __redis_read = None
+    __redis_cluster = False
+    __sqlite = None
+    __key = None
+    __aead_cache = {}
+
+    # Binary items are read from redis with a connection that doesn't decode responses
+    # (created with the arguments to '_init_redis' when first needed)
+    __lock_redis_binary = Lock()
+    __redis_args = {}
+    __redis_binary = None
+
+    # Redis calls go through a circuit breaker (see 'configure_resilience').  It opens
+    # (monotonic time) after a number of consecutive failures, and lets a single trial
+    # call through once the reset timeout is up.  While it is open, or when a call fails,
+    # the last value read from (or written to) redis for an item can be served instead.
+    # The copies are kept as (value, size) tuples in least to most recently updated order
+    __lock_breaker = Lock()
+    __breaker_failures = 0
+    __breaker_opened_at = None
+    __breaker_trial = False
+    __breaker_threshold = REDIS_FAILURE_THRESHOLD
+    __breaker_reset = REDIS_RESET_TIMEOUT
+    __redis_deadline_ms = 0
+    __redis_executor = None
+    __redis_inflight = BoundedSemaphore(REDIS_DEADLINE_WORKERS)
+    __serve_stale = False
+    __lock_shadow = Lock()
+    __shadow = OrderedDict()
+    __shadow_bytes = 0
+    __shadow_max_bytes = REDIS_STALE_MAX_BYTES
+
+    # Compression of items registered with 'compress' (see 'configure_compression')
+    __compress_threshold = compressors.COMPRESS_THRESHOLD
+    __compress_algorithm = "zlib"
+
+    # Layered lookup (see 'resolve')
+    __lock_resolve = Lock()
+    __layers = LAYERS
+    __env_prefix = ""
+    __overrides = {}
+    __defaults = {}
+    __resolved = {}
+    __resolved_env = {}
+    __resolve_version = 0
+
+    # Generation of the local store (incremented on each write).  While snapshots are
+    # open, the value each write replaced is kept in the history (by name) as a list of
+    # (generation, old value, old registration) tuples
+    __generation = 0
+    __snapshots = {}
+    __history = {}
+
+    # Items being computed by 'get_or_compute' (an event set when done), when items
+    # with a 'stale' period should be computed again, and the error from the last
+    # background refresh of each item that failed
+    __lock_compute = Lock()
+    __computing = {}
+    __refresh_at = {}
+    __compute_errors = {}
+
+    # Write-behind buffer for redis items.  Writes waiting to be sent are in the buffer,
+    # and writes being sent are in 'inflight' (so reads can still see them)
+    __wb_condition = Condition()
+    __wb_flush_lock = Lock()
+    __wb_buffer = {}
+    __wb_inflight = {}
+    __wb_thread = None
+    __wb_interval = WRITE_BEHIND_INTERVAL
+    __wb_max_batch = WRITE_BEHIND_MAX_BATCH
+
+    # What a forked child does with the local items it inherits
+    __fork_local_state = "keep"
+
+    # Locks taken in the parent for a fork (released again after it)
+    __fork_held = []
+
+    # Memory accounting for the local store (see 'configure_memory').  The estimated
+    # size of each item is kept in least to most recently used order, with the number
+    # of reads of each item.  For LFU eviction, the items are also kept in a bucket for
+    # each number of reads (least to most recently used), with the sorted bucket counts.
+    # Reads waiting to be applied (under the lock) are in 'reads'
+    __mem_track = False
+    __mem_budget = 0
+    __mem_namespace_budgets = {}
+    __mem_policy = "lru"
+    __mem_sizes = OrderedDict()
+    __mem_hits = {}
+    __mem_freq = {}
+    __mem_freq_counts = []
+    __mem_reads = deque(maxlen=MEMORY_PENDING_READS)
+    __mem_namespaces = {}
+    __mem_total = 0
+    __mem_evictions = 0
+
+    # Key derivation is deferred until the key is first needed
+    __lock_key = Lock()
+    __password = None
+    __key_file = ""
+
+    # Derived keys, so the same password is only put through the KDF once per process
+    __key_cache = {}
+
+    # Keys that can decrypt values (by key ID, including the current key), and old
+    # passwords whose keys haven't been derived yet
+    __key_id = None
+    __decrypt_keys = {}
+    __old_passwords = []
+
+    # Items waiting to be re-encrypted with the current key, and the error from the
+    # last attempt for each item that couldn't be re-encrypted in the background
+    __lock_rekey = Lock()
+    __rekey_pending = set()
+    __rekey_errors = {}
+    __rekey_thread = None
+    __rekey_batch_size = REKEY_BATCH_SIZE
+    __rekey_interval = REKEY_INTERVAL
+
+    # Config files reloaded when they change (see 'watch_file') - path -> ConfigWatchClass,
+    # and the watcher (created when the first file is watched)
+    __lock_watch = Lock()
+    __watch_files = {}
+    __watcher = None
+
+    # Using a fixed salt so we always derive the same key from the password
+    __salt = b'a%Z\xe9\xc3N\x96\x82\xc5|#e\xfd1b&'
 
 
     #
-    # _get_redis
+    # __init__
     #
-    @classmethod
-    def _get_local(cls, name=None, by_reference=True):
+    def __init__(self, *args, password="", derive_in_background=False, key_file="",
+                 old_passwords=None, **kwargs):
         '''
-        Get a value from redis
+        Class Constructor
 
         Parameters:
-            name: Name of the config item
-            by_reference: Store a reference to the object or a deep copy
-
+            args: Unannamed arguments
+            password: A password used to derive an encryption key
+            derive_in_background: If True, start deriving the encryption key in a background
+                thread.  Otherwise the key is derived on the first encrypted operation
+            key_file: A file used to share derived keys between processes (see _init_encryption)
+            old_passwords: Passwords used before the current one (see _init_encryption)
+            kwargs: Named arguments.  Anything beginning with 'redis_' will be passed as an arg
+                to connect to Redis.  This allows the connection to Redis to be fully customised.
+                If 'redis_host' is set, an attempt will be made to connect to Redis, and redis will
+                be used as the backing store for the ApplicationConfig Module.
+                Set 'redis_cluster' to connect to a Redis Cluster, or 'redis_sentinels' to connect
+                using Sentinel (see _init_redis).
+                Similarly, anything beginning with 'sqlite_' is passed to _init_sqlite.  If
+                'sqlite_path' is set, the database is opened for the 'sqlite' backing store.
 
         Return Value:
-            value: The config item value (exception will be raised on error), None if not found
+            None
         '''
-        assert name
+        # Extract the args for the redis connection
+        _connect_to_redis = False
+        _redis_args = {}
+        _sqlite_args = {}
+        _new_kwargs = {}
 
-        _value = None
+        for _key, _value in kwargs.items():
+            if _key.find("redis_") == 0:
+                _new_key = _key.replace("redis_", "")
+                _redis_args[_new_key] = _value
 
-        # Get value from the local store
-        if name in cls.__conf:            
-            if by_reference:
-                _value = cls.__conf[name]
-            else:
-                _value = copy.deepcopy(cls.__conf[name])
+                # If we have a server specified, we can connect to redis
+                if _new_key in ( "host", "sentinels" ): _connect_to_redis = True
+
+            elif _key.find("sqlite_") == 0:
+                _sqlite_args[_key.replace("sqlite_", "")] = _value
+
+            else:
+                # Add this to the remaining kwargs
+                _new_kwargs[_key] = _value
+
+        # Pass the remaining arguments on to parent class initiator 
+        super().__init__(*args, **_new_kwargs)
+
+        # Initialise Encryption if a password was provided
+        if password:
+            self._init_encryption(password=password, background=derive_in_background,
+                    key_file=key_file, old_passwords=old_passwords)
+
+        # Connect to redis if required
+        if _connect_to_redis:
+            self._init_redis(**_redis_args)
+
+        # Open the SQLite database if required
+        if _sqlite_args.get("path", ""):
+            self._init_sqlite(**_sqlite_args)
+
+
+    #
+    # _init_redis
+    #
+    @classmethod
+    def _init_redis(cls, cluster=False, sentinels=None, service_name="mymaster",
+                    read_from_replicas=False, **kwargs):
+        '''
+        Initialise the connection to Redis
+
+        Parameters:
+            cluster: If True, connect to a Redis Cluster (using 'host' and 'port' as a
+                startup node)
+            sentinels: A list of (host, port) tuples for the Sentinels.  If set, the
+                master for 'service_name' is found using Sentinel
+            service_name: The name of the service monitored by Sentinel
+            read_from_replicas: If True, reads are sent to replicas (which may lag
+                slightly behind the master)
+            kwargs: Named arguments - Passed directly to Redis
+
+        Return Value:
+            None
+        '''
+        # Overwrite certain values for our use
+        if not sentinels and not "port" in kwargs: kwargs["port"] = 6379
+        kwargs["decode_responses"] = True
+
+        cls.__redis_args = dict(kwargs, cluster=cluster, sentinels=sentinels,
+                service_name=service_name, read_from_replicas=read_from_replicas)
+        cls.__redis, cls.__redis_read = cls.__connect_redis(**cls.__redis_args)
+        cls.__redis_binary = None
+        cls.__redis_cluster = bool(cluster)
+
+        # Try an action on redis to see if connection works
+        # Should raise an exception if connection doesn't work (made directly rather than
+        # through the circuit breaker, so a failure to connect is always raised)
+        cls.__redis.exists("__connection_test__")
+
+
+    #
+    # __connect_redis
+    #
+    @staticmethod
+    def __connect_redis(cluster=False, sentinels=None, service_name="mymaster",
+                        read_from_replicas=False, **kwargs):
+        '''
+        Create the redis clients (see _init_redis)
+
+        Parameters:
+            cluster: If True, connect to a Redis Cluster
+            sentinels: A list of (host, port) tuples for the Sentinels
+            service_name: The name of the service monitored by Sentinel
+            read_from_replicas: If True, reads are sent to replicas
+            kwargs: Named arguments - Passed directly to Redis
+
+        Return Value:
+            tuple: (the client for writes, the client for reads)
+        '''
+        if cluster:
+            from redis.cluster import RedisCluster
+
+            if read_from_replicas:
+                try:
+                    from redis.cluster import LoadBalancingStrategy
+                    kwargs["load_balancing_strategy"] = \
+                            LoadBalancingStrategy.ROUND_ROBIN_REPLICAS
+                except ImportError:
+                    kwargs["read_from_replicas"] = True
+
+            # Reads are routed to the replicas by the cluster client
+            _client = RedisCluster(**kwargs)
+            return ( _client, _client )
+
+        if sentinels:
+            from redis.sentinel import Sentinel
+
+            _sentinel = Sentinel(sentinels, **kwargs)
+            _client = _sentinel.master_for(service_name)
+            if read_from_replicas: return ( _client, _sentinel.slave_for(service_name) )
+
+            return ( _client, _client )
+
+        from redis import Redis
+
+        _client = Redis(**kwargs)
+        return ( _client, _client )
+
+
+    #
+    # __get_redis_binary
+    #
+    @classmethod
+    def __get_redis_binary(cls):
+        '''
+        Get the client for reading binary items from redis (responses aren't decoded,
+        so values are returned as bytes)
+
+        Parameters:
+            None
+
+        Return Value:
+            The redis client
+        '''
+        if cls.__redis_binary: return cls.__redis_binary
+
+        cls.__lock_redis_binary.acquire()
+        try:
+            if not cls.__redis_binary:
+                _, cls.__redis_binary = cls.__connect_redis(**dict(cls.__redis_args,
+                        decode_responses=False))
+
+        finally:
+            cls.__lock_redis_binary.release()
+
+        return cls.__redis_binary
+
+
+    #
+    # _init_sqlite
+    #
+    @classmethod
+    def _init_sqlite(cls, path="", batch_size=None, batch_interval=None):
+        '''
+        Open the SQLite database used for the 'sqlite' backing store
+
+        Writes are committed in batches (see SQLiteStore), so a burst of 'set' calls
+        costs a single transaction.  Any waiting writes are committed at exit, or when
+        'flush' is called.
+
+        Parameters:
+            path: Path of the database file (created if it doesn't exist)
+            batch_size: Number of writes committed together (None = the default)
+            batch_interval: Seconds a write may wait to be committed (None = the default)
+
+        Return Value:
+            None
+        '''
+        assert path
+
+        from .sqlite_store import SQLiteStore
+
+        _args = {}
+        if batch_size is not None: _args["batch_size"] = batch_size
+        if batch_interval is not None: _args["batch_interval"] = batch_interval
+
+        # Close any database opened earlier
+        cls._close_sqlite()
+
+        cls.__sqlite = SQLiteStore(path=path, **_args)
+        atexit.register(cls._close_sqlite)
+
+
+    #
+    # _init_encryption
+    #
+    @classmethod
+    def _init_encryption(cls, password="", background=False, key_file="", old_passwords=None):
+        '''
+        Initialise the encryption component
+
+        The key derivation is deliberately slow, so it is not done here.  The key is
+        derived on the first encrypted operation (or in a background thread).
+
+        Derived keys are cached in the process (and so are inherited by forked
+        children).  If 'key_file' is given, derived keys are also saved to that file
+        so other processes using the same file can skip the derivation.  The file is
+        created readable by the owner only, and is not used if anyone else can read it.
+
+        Values are encrypted with the key from 'password'.  Keys from 'old_passwords'
+        are only used to decrypt values encrypted before a 'rotate_key' (they are
+        derived when such a value is first read).
+
+        Parameters:
+            password: A password used to create the encryption key
+            background: If True, derive the key in a background thread now
+            key_file: Path of a file to share derived keys between processes
+            old_passwords: A list of passwords used before the current one
+
+        Return Value:
+            None
+        '''
+        cls.__lock_key.acquire()
+        cls.__decrypt_keys = {}
+        cls.__old_passwords = list(old_passwords or [])
+        cls.__key_file = key_file
+
+        _key = cls.__key_cache.get(cls.__key_cache_id(password=password), None)
+
+        # Nothing more to do if the key has already been derived
+        if _key:
+            cls.__set_current_key(key=_key)
+            cls.__password = None
+            background = False
+        else:
+            cls.__password = password
+            cls.__key = None
+            cls.__key_id = None
+
+        cls.__lock_key.release()
+
+        if background:
+            Thread(target=cls.__get_key, daemon=True).start()
+
+
+    #
+    # _clear_key_cache
+    #
+    @classmethod
+    def _clear_key_cache(cls):
+        '''
+        Clear the cache of derived keys (the key file is not changed)
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        cls.__lock_key.acquire()
+        cls.__key_cache.clear()
+        cls.__lock_key.release()
+
+
+    #
+    # __get_key
+    #
+    @classmethod
+    def __get_key(cls):
+        '''
+        Get the encryption key, deriving it from the password if required
+
+        Parameters:
+            None
+
+        Return Value:
+            bytes: The encryption key (None if encryption has not been configured)
+        '''
+        if cls.__key: return cls.__key
+
+        # Only one thread derives the key - any others wait for it
+        cls.__lock_key.acquire()
+        try:
+            if not cls.__key and cls.__password is not None:
+                cls.__set_current_key(key=cls.__derive_key(password=cls.__password))
+                cls.__password = None
+
+        finally:
+            cls.__lock_key.release()
+
+        return cls.__key
+
+
+    #
+    # __derive_key
+    #
+    @classmethod
+    def __derive_key(cls, password=""):
+        '''
+        Derive the key for a password (from the cache or key file if possible).  Must
+        be called with the key lock held
+
+        Parameters:
+            password: The password
+
+        Return Value:
+            bytes: The key
+        '''
+        _cache_id = cls.__key_cache_id(password=password)
+        _key = cls.__key_cache.get(_cache_id, None)
+        if _key: return _key
+
+        # Try the key file before doing the derivation
+        if cls.__key_file:
+            _key = cls.__read_key_file(path=cls.__key_file).get(_cache_id, None)
+
+        if _key:
+            _key = _key.encode()
+        else:
+            import crypto_tools
+            _, _key = crypto_tools.fernet.derive_key(salt=cls.__salt, password=password)
+
+            if cls.__key_file:
+                cls.__write_key_file(path=cls.__key_file, cache_id=_cache_id, key=_key)
+
+        cls.__key_cache[_cache_id] = _key
+        return _key
+
+
+    #
+    # __set_current_key
+    #
+    @classmethod
+    def __set_current_key(cls, key=b""):
+        '''
+        Make a key the one values are encrypted with.  Must be called with the key
+        lock held
+
+        Parameters:
+            key: The key
+
+        Return Value:
+            None
+        '''
+        assert key
+
+        _key_id = cls.__get_key_id(key=key)
+        cls.__decrypt_keys[_key_id] = key
+        cls.__key_id = _key_id
+        cls.__key = key
+
+
+    #
+    # __get_key_id
+    #
+    @staticmethod
+    def __get_key_id(key=b""):
+        '''
+        Get the ID of a key (stored with the values it encrypts)
+
+        Parameters:
+            key: The key
+
+        Return Value:
+            bytes: The key ID
+        '''
+        return hashlib.sha256(key).digest()[:_KEY_ID_SIZE]
+
+
+    #
+    # __decryption_key
+    #
+    @classmethod
+    def __decryption_key(cls, key_id=b""):
+        '''
+        Get the key to decrypt a value with
+
+        Parameters:
+            key_id: The ID of the key the value was encrypted with
+
+        Return Value:
+            bytes: The key
+        '''
+        if not cls.__get_key(): raise RuntimeError("Encryption Key has not been configured")
+
+        _key = cls.__decrypt_keys.get(key_id, None)
+        if _key: return _key
+
+        # Derive any old keys that haven't been yet
+        cls.__derive_old_keys()
+
+        _key = cls.__decrypt_keys.get(key_id, None)
+        if not _key: raise ValueError(f"Encryption key '{key_id.hex()}' is not available")
+
+        return _key
+
+
+    #
+    # __derive_old_keys
+    #
+    @classmethod
+    def __derive_old_keys(cls):
+        '''
+        Derive the keys for the old passwords
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        if not cls.__old_passwords: return
+
+        cls.__lock_key.acquire()
+        try:
+            while cls.__old_passwords:
+                _key = cls.__derive_key(password=cls.__old_passwords[0])
+                cls.__decrypt_keys.setdefault(cls.__get_key_id(key=_key), _key)
+                cls.__old_passwords.pop(0)
+
+        finally:
+            cls.__lock_key.release()
+
+
+    #
+    # __key_cache_id
+    #
+    @classmethod
+    def __key_cache_id(cls, password=""):
+        '''
+        Identify a derived key in the cache
+
+        Parameters:
+            password: The password the key is derived from
+
+        Return Value:
+            string: The ID for the (salt, password) combination
+        '''
+        return hashlib.sha256(cls.__salt + password.encode()).hexdigest()
+
+
+    #
+    # __read_key_file
+    #
+    @staticmethod
+    def __read_key_file(path=""):
+        '''
+        Read the derived keys saved in a key file
+
+        Parameters:
+            path: Path of the key file
+
+        Return Value:
+            dict: The keys in the file, indexed by the cache ID
+        '''
+        assert path
+
+        try:
+            _fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            return {}
+
+        with os.fdopen(_fd, "r") as _file:
+            # Don't trust a file others could have read (or written)
+            _stat = os.fstat(_file.fileno())
+            if _stat.st_mode & 0o077:
+                raise PermissionError(f"Key file '{path}' must only be accessible by its owner")
+
+            if hasattr(os, "getuid") and _stat.st_uid != os.getuid():
+                raise PermissionError(f"Key file '{path}' is not owned by the current user")
+
+            try:
+                _keys = json.load(_file)
+            except ValueError:
+                return {}
+
+        if not isinstance(_keys, dict): return {}
+        return _keys
+
+
+    #
+    # __write_key_file
+    #
+    @classmethod
+    def __write_key_file(cls, path="", cache_id="", key=b""):
+        '''
+        Save a derived key to a key file
+
+        Parameters:
+            path: Path of the key file
+            cache_id: The ID of the key
+            key: The derived key
+
+        Return Value:
+            None
+        '''
+        assert path
+        assert cache_id
+
+        _keys = cls.__read_key_file(path=path)
+        _keys[cache_id] = key.decode() if isinstance(key, bytes) else key
+
+        # Write to a temporary file (only accessible by the owner) and move it in to place
+        _tmp_path = f"{path}.{os.getpid()}.tmp"
+        _fd = os.open(_tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        if hasattr(os, "fchmod"): os.fchmod(_fd, 0o600)
+
+        with os.fdopen(_fd, "w") as _file:
+            json.dump(_keys, _file)
+
+        os.replace(_tmp_path, path)
+
+
+    ###########################################################################
+    #
+    # Helper functions
+    #
+    ###########################################################################
+    #
+    # __is_binary
+    #
+    @staticmethod
+    def __is_binary(value=None):
+        '''
+        Determine if a value is binary - bytes, bytearray, memoryview or any other
+        object supporting the buffer protocol (eg a NumPy array)
+
+        Parameters:
+            value: The value
+
+        Return Value:
+            Boolean: True if the value is binary, False otherwise
+        '''
+        if isinstance(value, (bytes, bytearray, memoryview)): return True
+        if isinstance(value, (str, int, float, list, dict)) or value is None: return False
+
+        try:
+            memoryview(value)
+        except TypeError:
+            return False
+
+        return True
+
+
+    #
+    # __to_buffer
+    #
+    @staticmethod
+    def __to_buffer(value=None):
+        '''
+        Get a flat view of the bytes of a binary value (without copying them, unless
+        the value isn't contiguous in memory)
+
+        Parameters:
+            value: The binary value
+
+        Return Value:
+            memoryview: The bytes of the value
+        '''
+        _view = memoryview(value)
+        if _view.format == "B" and _view.ndim == 1 and _view.c_contiguous: return _view
+        if _view.c_contiguous: return _view.cast("B")
+
+        return memoryview(_view.tobytes())
+
+
+    #
+    # __to_bytes
+    #
+    @classmethod
+    def __to_bytes(cls, value=None):
+        '''
+        Copy a binary value to bytes (for a store that keeps the value, so later
+        changes to a mutable buffer don't change it).  Other values are unchanged
+
+        Parameters:
+            value: The value
+
+        Return Value:
+            The value (bytes if it is binary)
+        '''
+        if isinstance(value, bytes) or not cls.__is_binary(value=value): return value
+
+        return cls.__to_buffer(value=value).tobytes()
+
+
+    #
+    # __deadline
+    #
+    @staticmethod
+    def __deadline(timeout=0):
+        '''
+        Get the deadline for a timeout, on the monotonic clock (so it isn't affected
+        by changes to the system time)
+
+        Parameters:
+            timeout: Number of seconds from now (may be fractional)
+
+        Return Value:
+            int: The deadline in nanoseconds (0 if there is no timeout)
+        '''
+        assert timeout >= 0
+        if not timeout: return 0
+
+        return time.monotonic_ns() + int(round(timeout * 1_000_000_000))
+
+
+    #
+    # __schedule_expiry
+    #
+    @classmethod
+    def __schedule_expiry(cls, name=None, backing_store="local", deadline=0):
+        '''
+        Set (or clear) the deadline for an item.  Must be called with the lock held
+
+        Only the latest deadline for an item counts - older entries in the expiry heap
+        are ignored when they come up (or dropped when the heap is compacted)
+
+        Parameters:
+            name: Name of the config item
+            backing_store: Where the item is stored (local, redis or sqlite)
+            deadline: The deadline from __deadline (0 = never expire)
+
+        Return Value:
+            None
+        '''
+        assert name
+
+        if not deadline:
+            cls.__expiry_deadlines.pop(name, None)
+            return
+
+        cls.__expiry_deadlines[name] = deadline
+        heapq.heappush(cls.__conf_expiry, ( deadline, next(cls.__expiry_seq),
+                ConfigExpiryClass(name=name, backing_store=backing_store) ))
+
+        # Items set again and again (with a long timeout) would otherwise grow the heap
+        if len(cls.__conf_expiry) > EXPIRY_COMPACT_SIZE and \
+                len(cls.__conf_expiry) > EXPIRY_COMPACT_RATIO * len(cls.__expiry_deadlines):
+            cls.__compact_expiry()
+
+
+    #
+    # __compact_expiry
+    #
+    @classmethod
+    def __compact_expiry(cls):
+        '''
+        Rebuild the expiry heap with only the latest deadline of each item.  Must be
+        called with the lock held
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        _latest = {}
+        for _entry in cls.__conf_expiry:
+            if cls.__expiry_deadlines.get(_entry[2].name, None) == _entry[0]:
+                _latest[_entry[2].name] = _entry
+
+        # A new list, as the fast path in '__item_maintenance' reads it without the lock
+        _heap = list(_latest.values())
+        heapq.heapify(_heap)
+        cls.__conf_expiry = _heap
+
+
+    #
+    # __item_maintenance
+    #
+    @classmethod
+    def __item_maintenance(cls):
+        '''
+        Perform maintenance on items (such as expiry)
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        # Nothing to do unless the earliest deadline has passed.  This is checked without
+        # the lock, so another thread may take the last entry off the heap in between
+        _now = time.monotonic_ns()
+        try:
+            if cls.__conf_expiry[0][0] > _now: return
+        except IndexError:
+            return
+
+        # Take the entries that are due off the heap
+        _expired = []
+        cls.__lock.acquire()
+        while cls.__conf_expiry and cls.__conf_expiry[0][0] <= _now:
+            _deadline, _, _expiry = heapq.heappop(cls.__conf_expiry)
+
+            # Skip entries replaced by a later deadline (or cleared)
+            if cls.__expiry_deadlines.get(_expiry.name, None) != _deadline: continue
+
+            del cls.__expiry_deadlines[_expiry.name]
+            _expired.append(_expiry)
+        cls.__lock.release()
+
+        # Expired rows are removed from the database with a single range delete
+        if cls.__sqlite and any(_expiry.backing_store == "sqlite" for _expiry in _expired):
+            cls.__sqlite.reap()
+
+        for _expiry in _expired:
+            if _expiry.backing_store == "local":
+                # Remove the item from the local store
+                cls._delete_local(name=_expiry.name)
+
+            # Delete the metadata
+            if _expiry.name in cls.__conf_meta:
+                cls.__lock.acquire()
+                cls.__drop_registration(name=_expiry.name)
+                cls.__lock.release()
+
+            cls.__invalidate(name=_expiry.name)
+
+
+    #
+    # to_json
+    # 
+    @staticmethod
+    def to_json(data=None):
+        '''
+        Convert the data to a JSON string
+
+        Parameters:
+            data: The data to be converted
+
+        Return Value:
+            string: JSON representation of the data
+        '''
+        if not data: return ""
+
+        # Is the data already a string?
+        if isinstance(data, str): return data
+
+        # This might fail if the data can't be formatted as JSON
+        try:
+            return json.dumps(data)
+        except:
+            return ""
+
+
+    #
+    # from_json
+    #
+    @staticmethod
+    def from_json(data=None):
+        '''
+        Convert a JSON string to python data
+
+        Parameters:
+            json_data: String containing the JSON Info
+
+        Return Value:
+            obj: The python representation of the data
+        '''
+        if not data: return None
+
+        # This will fail if the data isn't in JSON format
+        try:
+            return json.loads(data)
+        except:
+            # Error converting - If data is a string just return it
+            if isinstance(data, str):
+                return data
+            else:
+                return None
+
+
+    ###########################################################################
+    #
+    # Encryption functions
+    #
+    ###########################################################################
+    #
+    # __encrypt
+    #
+    @classmethod
+    def __encrypt(cls, data=""):
+        '''
+        Encrypt the data string
+
+        Parameters:
+            data: A string value to be encrypted
+
+        Return Value:
+            string: The encrypted string (prefixed with the ID of the key)
+        '''
+        _key = cls.__get_key()
+        if not _key: raise RuntimeError("Encryption Key has not been configured")
+
+        import crypto_tools
+        _encrypted_data = crypto_tools.fernet.encrypt(data=data, key=_key).decode()
+
+        if not _encrypted_data:
+            return ""
+        else:
+            return f"{_FERNET_KEY_PREFIX}{cls.__get_key_id(key=_key).hex()}{_encrypted_data}"
+
+
+    #
+    # __decrypt
+    #
+    @classmethod
+    def __decrypt(cls, data=""):
+        '''
+        Decrypt the data string
+
+        Parameters:
+            data: A string value containing encrypted data
+
+        Return Value:
+            string: The decrypted string
+        '''
+        import crypto_tools
+
+        if data.startswith(_FERNET_KEY_PREFIX):
+            _key_end = len(_FERNET_KEY_PREFIX) + _KEY_ID_SIZE * 2
+            _key = cls.__decryption_key(key_id=bytes.fromhex(
+                    data[len(_FERNET_KEY_PREFIX):_key_end]))
+            _decrypted_data = crypto_tools.fernet.decrypt(data=data[_key_end:], key=_key)
+
+        else:
+            # Tokens from before keys had IDs - try each key, newest first
+            if not cls.__get_key(): raise RuntimeError("Encryption Key has not been configured")
+            cls.__derive_old_keys()
+
+            _keys = [ cls.__key ] + [ _key for _key in cls.__decrypt_keys.values()
+                    if _key != cls.__key ]
+            for _idx, _key in enumerate(_keys):
+                try:
+                    _decrypted_data = crypto_tools.fernet.decrypt(data=data, key=_key)
+                    break
+                except Exception:
+                    if _idx == len(_keys) - 1: raise
+
+        if not _decrypted_data:
+            return ""
+        else:
+            return _decrypted_data
+
+
+    #
+    # __check_cipher
+    #
+    @staticmethod
+    def __check_cipher(encrypt=False):
+        '''
+        Check the value of an 'encrypt' argument
+
+        Parameters:
+            encrypt: False, True (the default cipher) or one of CIPHERS
+
+        Return Value:
+            None
+        '''
+        if encrypt is False or encrypt is True or encrypt in CIPHERS: return
+
+        raise ValueError(f"'encrypt' must be True, False or one of {CIPHERS}")
+
+
+    #
+    # __check_binary
+    #
+    @classmethod
+    def __check_binary(cls, encrypt=False, compress=False, values=None):
+        '''
+        Check the settings and values for binary items
+
+        Parameters:
+            encrypt: False, True (the default cipher) or one of CIPHERS
+            compress: False, True (the default algorithm) or one of COMPRESSORS
+            values: A list of the values
+
+        Return Value:
+            None
+        '''
+        if encrypt is True or encrypt == "fernet":
+            raise ValueError("Binary items can only be encrypted with an AEAD cipher")
+
+        if compress: raise ValueError("Binary items can't be compressed")
+
+        for _value in values or []:
+            if not cls.__is_binary(value=_value):
+                raise TypeError(f"Variable type not supported for a binary item: {type(_value)}")
+
+
+    #
+    # __aead
+    #
+    @classmethod
+    def __aead(cls, cipher="", key=b""):
+        '''
+        Get the AEAD object for a cipher and key.  The cipher key is derived (with
+        HKDF) from the encryption key, so each cipher uses a different key
+
+        Parameters:
+            cipher: The cipher (one of the AEAD ciphers in CIPHERS)
+            key: The encryption key
+
+        Return Value:
+            object: The AEAD object
+        '''
+        _aead = cls.__aead_cache.get(( cipher, key ), None)
+        if _aead: return _aead
+
+        import base64
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+
+        _cipher_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                info=f"application_config:{cipher}".encode()).derive(
+                base64.urlsafe_b64decode(key))
+
+        _aead = AESGCM(_cipher_key) if cipher == "aes-gcm" else ChaCha20Poly1305(_cipher_key)
+        cls.__aead_cache[( cipher, key )] = _aead
+
+        return _aead
+
+
+    #
+    # __encrypt_aead
+    #
+    @classmethod
+    def __encrypt_aead(cls, data="", cipher=""):
+        '''
+        Encrypt the data string with an AEAD cipher
+
+        Parameters:
+            data: A string (or bytes) to be encrypted
+            cipher: The cipher (one of the AEAD ciphers in CIPHERS)
+
+        Return Value:
+            bytes: The header, nonce and ciphertext
+        '''
+        _key = cls.__get_key()
+        if not _key: raise RuntimeError("Encryption Key has not been configured")
+
+        _nonce = os.urandom(_AEAD_NONCE_SIZE)
+        _header = bytes(( _AEAD_VERSION, _AEAD_CIPHER_IDS[cipher] )) + cls.__get_key_id(key=_key)
+
+        if isinstance(data, str): data = data.encode()
+
+        return _header + _nonce + cls.__aead(cipher=cipher, key=_key).encrypt(_nonce,
+                data, None)
+
+
+    #
+    # __decrypt_aead
+    #
+    @classmethod
+    def __decrypt_aead(cls, data=b""):
+        '''
+        Decrypt data encrypted with an AEAD cipher
+
+        Parameters:
+            data: The header, nonce and ciphertext
+
+        Return Value:
+            bytes: The decrypted data
+        '''
+        if data[0] != _AEAD_VERSION: raise ValueError("Unknown encrypted value format")
+
+        for _cipher, _cipher_id in _AEAD_CIPHER_IDS.items():
+            if _cipher_id == data[1]: break
+        else:
+            raise ValueError(f"Unknown cipher in encrypted value: {data[1]}")
+
+        _nonce_start = 2 + _KEY_ID_SIZE
+        _key = cls.__decryption_key(key_id=bytes(data[2:_nonce_start]))
+        _nonce = data[_nonce_start:_nonce_start + _AEAD_NONCE_SIZE]
+
+        return cls.__aead(cipher=_cipher, key=_key).decrypt(_nonce,
+                data[_nonce_start + _AEAD_NONCE_SIZE:], None)
+
+
+    #
+    # __encrypt_data
+    #
+    @classmethod
+    def __encrypt_data(cls, data="", cipher=True, binary=False):
+        '''
+        Encrypt a string with a cipher
+
+        Parameters:
+            data: A string value to be encrypted (or bytes, for the AEAD ciphers)
+            cipher: True (the default cipher) or one of CIPHERS
+            binary: If True, AEAD encrypted values are returned as bytes.  Otherwise
+                they are base64 encoded (for backing stores that only hold strings)
+
+        Return Value:
+            The encrypted value
+        '''
+        if cipher is True or cipher == "fernet":
+            return cls.__encrypt(data=data)
+
+        _encrypted = cls.__encrypt_aead(data=data, cipher=cipher)
+        if binary: return _encrypted
+
+        import base64
+        return base64.b64encode(_encrypted).decode()
+
+
+    #
+    # __decrypt_data
+    #
+    @classmethod
+    def __decrypt_data(cls, data=None):
+        '''
+        Decrypt a value.  The format of the value identifies the cipher - Fernet tokens
+        are strings starting with 'g' (the version byte 0x80) or the key prefix, AEAD
+        values are bytes or base64 strings
+
+        Parameters:
+            data: The encrypted value
+
+        Return Value:
+            The decrypted data (a string for Fernet, bytes for the AEAD ciphers)
+        '''
+        if isinstance(data, (bytes, bytearray)):
+            return cls.__decrypt_aead(data=data)
+
+        if data[0] != "g" and not data.startswith(_FERNET_KEY_PREFIX):
+            import base64
+            return cls.__decrypt_aead(data=base64.b64decode(data))
+
+        return cls.__decrypt(data=data)
+
+
+    #
+    # __encrypt_value
+    #
+    @classmethod
+    def __encrypt_value(cls, value=None, cipher=True, binary=False):
+        '''
+        Encrypt a config item value
+
+        Parameters:
+            value: The config item value
+            cipher: True (the default cipher) or one of CIPHERS
+            binary: If True, AEAD encrypted values are returned as bytes (see
+                __encrypt_data)
+
+        Return Value:
+            string: The encrypted value (unchanged if it can't be converted to a string)
+        '''
+        # Make sure we are dealing with a string (try to convert to JSON)
+        _json_value = cls.to_json(data=value)
+        if not _json_value: return value
+
+        return cls.__encrypt_data(data=_json_value, cipher=cipher, binary=binary)
+
+
+    #
+    # __decrypt_value
+    #
+    @classmethod
+    def __decrypt_value(cls, value=None, name=None, raw=False, compress=False):
+        '''
+        Decrypt a config item value
+
+        Parameters:
+            value: The encrypted config item value
+            name: Name of the config item (to re-encrypt it if it uses an old key)
+            raw: If True, the decrypted bytes are returned as they are (for binary items)
+            compress: Is the item registered with 'compress' (only then is the value
+                checked for compressed data)
+
+        Return Value:
+            The decrypted value
+        '''
+        if not value: return value
+
+        if name: cls.__check_key(name=name, value=value)
+
+        _decryped_data = cls.__decrypt_data(data=value)
+        if raw: return _decryped_data
+
+        # Compressed data may be bytes, or the text form (which Fernet returns as a string
+        # or as bytes)
+        if not compress or not compressors.is_compressed(data=_decryped_data):
+            if isinstance(_decryped_data, bytes): _decryped_data = _decryped_data.decode()
+
+        if compress and compressors.is_compressed(data=_decryped_data):
+            _data, _is_json = compressors.decompress(data=_decryped_data)
+            return json.loads(_data) if _is_json else _data
+
+        # Try to convert the value from JSON (if data is a string it will be untouched)
+        return cls.from_json(data=_decryped_data)
+
+
+    #
+    # __encode_value
+    #
+    @classmethod
+    def __encode_value(cls, value=None, encrypt=False, compress=False, binary=False):
+        '''
+        Compress and/or encrypt a config item value to be stored
+
+        Values at least as large as the compression threshold are converted to JSON
+        (unless they are strings) and compressed, before they are encrypted.  So they
+        aren't mistaken for compressed values when read, smaller strings that start
+        like one are compressed as well
+
+        Parameters:
+            value: The config item value
+            encrypt: False, True (the default cipher) or one of CIPHERS
+            compress: False, True (the default algorithm) or one of COMPRESSORS
+            binary: If True, the value can be stored as bytes.  Otherwise it must be a
+                string (for backing stores that only hold strings)
+
+        Return Value:
+            The value to store
+        '''
+        # Binary values are encrypted as they are (they aren't compressed - see 'register')
+        if cls.__is_binary(value=value):
+            if not encrypt: return value
+            if encrypt is True or encrypt == "fernet":
+                raise TypeError("Binary values can only be encrypted with an AEAD cipher")
+
+            return cls.__encrypt_data(data=bytes(cls.__to_buffer(value=value)), cipher=encrypt,
+                    binary=binary)
+
+        if not compress:
+            if encrypt: return cls.__encrypt_value(value=value, cipher=encrypt, binary=binary)
+            return value
+
+        # Backing stores that only hold strings can't convert other values
+        if not binary and not encrypt and not isinstance(value, str):
+            raise TypeError(f"Variable type not supported: {type(value)}")
+
+        _data = cls.to_json(data=value)
+        if not _data or ( len(_data) < cls.__compress_threshold
+                and not compressors.is_compressed(data=value) ):
+            if encrypt: return cls.__encrypt_value(value=value, cipher=encrypt, binary=binary)
+            return value
+
+        _compressed = compressors.compress(data=_data, is_json=not isinstance(value, str),
+                algorithm=cls.__compress_algorithm if compress is True else compress)
+
+        # Fernet works on strings, so use the text form
+        if encrypt is True or encrypt == "fernet":
+            return cls.__encrypt_data(data=compressors.to_text(data=_compressed),
+                    cipher=encrypt, binary=binary)
+
+        if encrypt: return cls.__encrypt_data(data=_compressed, cipher=encrypt, binary=binary)
+
+        return _compressed if binary else compressors.to_text(data=_compressed)
+
+
+    #
+    # __decode_value
+    #
+    @classmethod
+    def __decode_value(cls, value=None, conf_meta=None, name=None):
+        '''
+        Decrypt and/or decompress a stored config item value
+
+        Parameters:
+            value: The stored value
+            conf_meta: The metadata of the item (None if not registered)
+            name: Name of the config item (see __decrypt_value)
+
+        Return Value:
+            The config item value
+        '''
+        if not conf_meta: return value
+
+        if conf_meta.encrypt:
+            return cls.__decrypt_value(value=value, name=name, raw=conf_meta.binary,
+                    compress=conf_meta.compress)
+
+        if conf_meta.compress and compressors.is_compressed(data=value):
+            _data, _is_json = compressors.decompress(data=value)
+            return json.loads(_data) if _is_json else _data
+
+        return value
+
+
+    #
+    # __crypt_many
+    #
+    @classmethod
+    def __crypt_many(cls, func=None, values=None, workers=0):
+        '''
+        Encrypt or decrypt a list of values.  Large lists are spread over a pool of
+        threads (the cryptography work is done in C code which releases the GIL)
+
+        Parameters:
+            func: The function to apply to each value (__encrypt_value or __decrypt_value)
+            values: A list of values
+            workers: Number of threads to use (0 = number of CPUs)
+
+        Return Value:
+            list: The encrypted/decrypted values (in the same order)
+        '''
+        assert func
+        assert isinstance(values, list)
+
+        if not workers: workers = os.cpu_count() or 1
+
+        if len(values) < BULK_CRYPT_THRESHOLD or workers == 1:
+            return [ func(value=_value) for _value in values ]
+
+        # Derive the key before handing out the work
+        if not cls.__get_key(): raise RuntimeError("Encryption Key has not been configured")
+
+        # Hand out the values in chunks to keep the per task overhead down
+        _chunk_size = -(-len(values) // (workers * 4))
+        _chunks = [ values[_idx:_idx + _chunk_size]
+                for _idx in range(0, len(values), _chunk_size) ]
+
+        def _crypt_chunk(chunk):
+            return [ func(value=_value) for _value in chunk ]
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as _pool:
+            _results = list(_pool.map(_crypt_chunk, _chunks))
+
+        return [ _value for _chunk in _results for _value in _chunk ]
+
+
+    ###########################################################################
+    #
+    # Key rotation
+    #
+    ###########################################################################
+    #
+    # rotate_key
+    #
+    @classmethod
+    def rotate_key(cls, password=""):
+        '''
+        Start encrypting values with the key for a new password.  The current key is
+        kept to decrypt existing values, which are re-encrypted with the new key as
+        they are read (or by 'rekey').  Processes that start before every value has
+        been re-encrypted need the old password (see _init_encryption 'old_passwords')
+
+        Parameters:
+            password: The new password
+
+        Return Value:
+            None
+        '''
+        assert password
+
+        # The current key must be derived to keep it
+        if not cls.__get_key(): raise RuntimeError("Encryption Key has not been configured")
+
+        cls.__lock_key.acquire()
+        try:
+            cls.__set_current_key(key=cls.__derive_key(password=password))
+        finally:
+            cls.__lock_key.release()
+
+
+    #
+    # configure_rekey
+    #
+    @classmethod
+    def configure_rekey(cls, batch_size=None, interval=None):
+        '''
+        Configure how items are re-encrypted with the current key in the background
+
+        Parameters:
+            batch_size: Number of items re-encrypted at a time (None = don't change)
+            interval: Seconds to wait between batches (None = don't change)
+
+        Return Value:
+            None
+        '''
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("'batch_size' must be at least 1")
+
+        if interval is not None and interval < 0:
+            raise ValueError("'interval' must not be negative")
+
+        cls.__lock_rekey.acquire()
+        if batch_size is not None: cls.__rekey_batch_size = batch_size
+        if interval is not None: cls.__rekey_interval = interval
+        cls.__lock_rekey.release()
+
+
+    #
+    # rekey
+    #
+    @classmethod
+    def rekey(cls, background=True):
+        '''
+        Re-encrypt all encrypted items that aren't encrypted with the current key
+
+        Parameters:
+            background: If True, the items are re-encrypted in batches by a background
+                thread (see configure_rekey).  Otherwise they are re-encrypted now
+
+        Return Value:
+            int: The number of items queued (background), or re-encrypted
+        '''
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        _names = [ _name for _name, _conf_meta in list(cls.__conf_meta.items())
+                if _conf_meta.encrypt ]
+
+        if background:
+            cls.__queue_rekey(names=_names)
+            return len(_names)
+
+        _count = 0
+        for _name in _names:
+            if cls.__rekey_item(name=_name): _count += 1
+
+        return _count
+
+
+    #
+    # rekey_errors
+    #
+    @classmethod
+    def rekey_errors(cls):
+        '''
+        Get the items that couldn't be re-encrypted in the background (they are left
+        encrypted with the old key, and tried again when next read or with 'rekey')
+
+        Parameters:
+            None
+
+        Return Value:
+            dict: The error from the last attempt for each item, indexed by name
+        '''
+        cls.__lock_rekey.acquire()
+        _errors = dict(cls.__rekey_errors)
+        cls.__lock_rekey.release()
+
+        return _errors
+
+
+    #
+    # __stale_key
+    #
+    @classmethod
+    def __stale_key(cls, value=None):
+        '''
+        Was a value encrypted with a key other than the current key?
+
+        Parameters:
+            value: The encrypted value
+
+        Return Value:
+            Boolean: True if the value needs to be re-encrypted, False otherwise
+        '''
+        if not value: return False
+
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value[2:2 + _KEY_ID_SIZE]) != cls.__key_id
+
+        if value.startswith(_FERNET_KEY_PREFIX):
+            return value[len(_FERNET_KEY_PREFIX):len(_FERNET_KEY_PREFIX) + _KEY_ID_SIZE * 2] \
+                    != cls.__key_id.hex()
+
+        # Fernet tokens without a key ID
+        if value[0] == "g": return True
+
+        # Only decode enough of the base64 to get the header
+        import base64
+        return base64.b64decode(value[:8])[2:2 + _KEY_ID_SIZE] != cls.__key_id
+
+
+    #
+    # __check_key
+    #
+    @classmethod
+    def __check_key(cls, name=None, value=None):
+        '''
+        Queue an item that has just been read to be re-encrypted, if it isn't
+        encrypted with the current key (and old keys are in use)
+
+        Parameters:
+            name: Name of the config item
+            value: The encrypted value
+
+        Return Value:
+            None
+        '''
+        if len(cls.__decrypt_keys) < 2 and not cls.__old_passwords: return
+        if not cls.__key_id: return
+        if name in cls.__rekey_pending: return
+
+        if cls.__stale_key(value=value): cls.__queue_rekey(names=[ name ])
+
+
+    #
+    # __queue_rekey
+    #
+    @classmethod
+    def __queue_rekey(cls, names=None):
+        '''
+        Queue items to be re-encrypted by the background thread
+
+        Parameters:
+            names: A list of config item names
+
+        Return Value:
+            None
+        '''
+        assert names is not None
+
+        cls.__lock_rekey.acquire()
+        cls.__rekey_pending.update(names)
+
+        if cls.__rekey_pending and not cls.__rekey_thread:
+            cls.__rekey_thread = Thread(target=cls.__rekey_worker, daemon=True)
+            cls.__rekey_thread.start()
+        cls.__lock_rekey.release()
+
+
+    #
+    # __rekey_worker
+    #
+    @classmethod
+    def __rekey_worker(cls):
+        '''
+        Background thread to re-encrypt the queued items, a batch at a time
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        while True:
+            cls.__lock_rekey.acquire()
+            _batch = [ cls.__rekey_pending.pop() for _ in
+                    range(min(cls.__rekey_batch_size, len(cls.__rekey_pending))) ]
+            _interval = cls.__rekey_interval
+
+            if not _batch: cls.__rekey_thread = None
+            cls.__lock_rekey.release()
+
+            if not _batch: return
+
+            for _name in _batch:
+                # A failure leaves the item as it is (see 'rekey_errors')
+                try:
+                    cls.__rekey_item(name=_name)
+                    _error = None
+                except Exception as err:
+                    _error = err
+
+                cls.__lock_rekey.acquire()
+                if _error:
+                    cls.__rekey_errors[_name] = _error
+                else:
+                    cls.__rekey_errors.pop(_name, None)
+                cls.__lock_rekey.release()
+
+            time.sleep(_interval)
+
+
+    #
+    # __rekey_item
+    #
+    @classmethod
+    def __rekey_item(cls, name=None):
+        '''
+        Re-encrypt an item with the current key (unless it has been changed since it
+        was read, or is already encrypted with the current key).  Timeouts are kept
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True if the item was re-encrypted, False otherwise
+        '''
+        assert name
+
+        _conf_meta = cls.__conf_meta.get(name, None)
+        if not _conf_meta or not _conf_meta.encrypt: return False
+
+        _backing_store = _conf_meta.backing_store
+
+        def _reencrypt(raw):
+            return cls.__encrypt_data(data=cls.__decrypt_data(data=raw),
+                    cipher=_conf_meta.encrypt, binary=_backing_store == "local")
+
+        if _backing_store == "redis":
+            # A buffered write will replace the value (and uses the current key)
+            if cls.__wb_lookup(name=name) is not _MISSING: return False
+
+            from redis.exceptions import WatchError
+
+            # The same client as '_get_redis' reads the item with (encrypted values,
+            # binary or not, are stored as strings)
+            _client = cls.__get_redis_binary() if cls.__is_binary_item(name=name) \
+                    else cls.__redis
+
+            def _replace():
+                _pipeline = _client.pipeline(transaction=True)
+                try:
+                    _pipeline.watch(name)
+                    _raw = _pipeline.get(name)
+                    if not cls.__stale_key(value=_raw): return False
+
+                    _pipeline.multi()
+                    _pipeline.set(name, _reencrypt(_raw), keepttl=True)
+                    _pipeline.execute()
+
+                except WatchError:
+                    return False
+
+                finally:
+                    _pipeline.reset()
+
+                return True
+
+            # A write, so without a deadline
+            return cls.__call_redis(func=_replace, deadline_ms=0)
+
+        if _backing_store == "sqlite":
+            _raw = cls._get_sqlite(name=name)
+            if not cls.__stale_key(value=_raw): return False
+
+            return cls.__sqlite.replace(name=name, value=_reencrypt(_raw), expected=_raw)
+
+        _raw = cls.__conf.get(name, None)
+        if not cls.__stale_key(value=_raw): return False
+
+        _value = _reencrypt(_raw)
+
+        cls.__lock.acquire()
+        try:
+            if cls.__conf.get(name, None) is not _raw: return False
+
+            cls.__generation += 1
+            if cls.__snapshots: cls.__record_history(name=name)
+            cls.__conf[name] = _value
+            if cls.__mem_track:
+                cls.__mem_account(sizes=[ ( name, cls.__estimate_size(value=_value) ) ])
+
+        finally:
+            cls.__lock.release()
+
+        return True
+
+
+    ###########################################################################
+    #
+    # Compression
+    #
+    ###########################################################################
+    #
+    # configure_compression
+    #
+    @classmethod
+    def configure_compression(cls, threshold=None, algorithm=None):
+        '''
+        Configure how items registered with 'compress' are compressed.  Values already
+        stored are still decompressed after a change
+
+        Parameters:
+            threshold: Values smaller than this (in characters, once converted to JSON)
+                are stored uncompressed, unless they start like a compressed value
+                (None = don't change)
+            algorithm: The algorithm used when 'compress' is True - one of COMPRESSORS
+                (None = don't change)
+
+        Return Value:
+            None
+        '''
+        if threshold is not None and threshold < 0:
+            raise ValueError("'threshold' must not be negative")
+
+        if algorithm is not None: compressors.check_algorithm(algorithm=algorithm)
+
+        if threshold is not None: cls.__compress_threshold = threshold
+        if algorithm is not None: cls.__compress_algorithm = algorithm
+
+
+    ###########################################################################
+    #
+    # Access methods for local
+    #
+    ###########################################################################
+    #
+    # _set_local
+    #
+    @classmethod
+    def _set_local(cls, name=None, value=None, by_reference=True, timeout=0):
+        '''
+        Set a value locally
+
+        Parameters:
+            name: Name of the config item
+            value: The config item value
+            by_reference: Store a reference to the object or a deep copy
+            timeout: Number of seconds before the item should be deleted (0 = never)
+
+        Return Value:
+            Boolean: True is successful, False Otherwise (exception will be raised)
+        '''
+        assert name
+        assert timeout >= 0
+
+        if not by_reference: value = copy.deepcopy(value)
+        if cls.__mem_track: _size = cls.__check_size(name=name, value=value)
+
+        cls.__lock.acquire()
+        try:
+            cls.__generation += 1
+            if cls.__snapshots: cls.__record_history(name=name)
+            cls.__conf[name] = value
+
+            # Set the expiry for the value
+            cls.__schedule_expiry(name=name, backing_store="local",
+                    deadline=cls.__deadline(timeout=timeout))
+
+            _evicted = cls.__mem_update(sizes=[ ( name, _size ) ]) if cls.__mem_track else []
+
+        finally:
+            cls.__lock.release()
+
+        cls.__invalidate_many(names=[ name ] + _evicted)
+
+
+    #
+    # _set_local_many
+    #
+    @classmethod
+    def _set_local_many(cls, items=None, by_reference=True, timeout=0):
+        '''
+        Set a number of values locally (under a single lock acquisition)
+
+        Parameters:
+            items: A list of (name, value) tuples
+            by_reference: Store a reference to the object or a deep copy
+            timeout: Number of seconds before the items should be deleted (0 = never)
+
+        Return Value:
+            None
+        '''
+        assert items is not None
+        assert timeout >= 0
+
+        _deadline = cls.__deadline(timeout=timeout)
+
+        if not by_reference: items = [ (_name, copy.deepcopy(_value)) for _name, _value in items ]
+        if cls.__mem_track:
+            _sizes = [ ( _name, cls.__check_size(name=_name, value=_value) )
+                    for _name, _value in items ]
+
+        cls.__lock.acquire()
+        try:
+            # All of the items are written in the same generation
+            cls.__generation += 1
+            for _name, _value in items:
+                if cls.__snapshots: cls.__record_history(name=_name)
+                cls.__conf[_name] = _value
+
+            # Set the expiry for the values
+            if _deadline or cls.__expiry_deadlines:
+                for _name, _ in items:
+                    cls.__schedule_expiry(name=_name, backing_store="local",
+                            deadline=_deadline)
+
+            _evicted = cls.__mem_update(sizes=_sizes) if cls.__mem_track else []
+
+        finally:
+            cls.__lock.release()
+
+        cls.__invalidate_many(names=[ _name for _name, _ in items ] + _evicted)
+
+
+    #
+    # _get_local
+    #
+    @classmethod
+    def _get_local(cls, name=None, by_reference=True):
+        '''
+        Get a value from redis
+
+        Parameters:
+            name: Name of the config item
+            by_reference: Store a reference to the object or a deep copy
+
+
+        Return Value:
+            value: The config item value (exception will be raised on error), None if not found
+        '''
+        assert name
+
+        # Get value from the local store (in one lookup, as the item may be evicted or
+        # expired by another thread at any time)
+        _value = cls.__conf.get(name, _MISSING)
+        if _value is _MISSING: return None
+
+        if cls.__mem_track: cls.__mem_touch(name=name)
+
+        if not by_reference: _value = copy.deepcopy(_value)
+
+        return _value
+
+
+    #
+    # _delete_local
+    #
+    @classmethod
+    def _delete_local(cls, name=None):
+        '''
+        Delete a value from redis
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True is successful, False Otherwise (exception will be raised)
+        '''
+        assert name
+
+        # Delete the item
+        cls.__lock.acquire()
+        _deleted = name in cls.__conf
+        if _deleted:
+            cls.__generation += 1
+            if cls.__snapshots: cls.__record_history(name=name)
+            del cls.__conf[name]
+            cls.__expiry_deadlines.pop(name, None)
+            if cls.__mem_track: cls.__mem_account(sizes=[ ( name, None ) ])
+        cls.__lock.release()
+
+        if _deleted: cls.__invalidate(name=name)
+
+        return True
+
+
+    #
+    # _has_item_local
+    #
+    @classmethod
+    def _has_item_local(cls, name=None):
+        '''
+        Get a value in redis
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True is item exists, False Otherwise
+        '''
+        assert name
+
+        if name in cls.__conf:
+            return True
+        
+        return False
+
+
+    #
+    # __record_history
+    #
+    @classmethod
+    def __record_history(cls, name=None):
+        '''
+        Keep the current value of a local item (and the registration it is stored with)
+        for open snapshots, before either is changed.  Must be called with the lock held,
+        after incrementing the generation
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            None
+        '''
+        assert name
+
+        cls.__history.setdefault(name, []).append(( cls.__generation,
+                cls.__conf.get(name, _MISSING), cls.__conf_meta.get(name, None) ))
+
+
+    ###########################################################################
+    #
+    # Access methods for Redis
+    #
+    ###########################################################################
+    #
+    # _set_redis
+    #
+    @classmethod
+    def _set_redis(cls, name=None, value=None, timeout=0):
+        '''
+        Set a value in redis
+
+        Parameters:
+            name: Name of the config item
+            value: The config item value
+            timeout: Number of seconds before the item should be deleted (0 = never)
+
+        Return Value:
+            Boolean: True is successful, False Otherwise (exception will be raised)
+        '''
+        assert name
+        assert timeout >= 0
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        _deadline = cls.__deadline(timeout=timeout)
+
+        # Check the type of the value
+        if isinstance(value, str):
+            # String (with the expiry in milliseconds, in the same command)
+            cls.__call_redis(func=lambda: cls.__redis.set(name, value,
+                    px=cls.__redis_px(timeout=timeout)), deadline_ms=0)
+
+        elif cls.__is_binary(value=value):
+            # Binary - sent as it is (without a copy)
+            cls.__call_redis(func=lambda: cls.__redis.set(name, cls.__to_buffer(value=value),
+                    px=cls.__redis_px(timeout=timeout)), deadline_ms=0)
+
+        else:
+            raise TypeError(f"Variable type not supported: {type(value)}")
+
+        cls.__shadow_update(items=[ ( name, value ) ])
+        cls.__invalidate(name=name)
+
+        # Set metadata to expire
+        cls.__lock.acquire()
+        cls.__schedule_expiry(name=name, backing_store="redis", deadline=_deadline)
+        cls.__lock.release()
+
+
+    #
+    # _set_redis_many
+    #
+    @classmethod
+    def _set_redis_many(cls, items=None, timeout=0):
+        '''
+        Set a number of values in redis (in a single pipeline)
+
+        Parameters:
+            items: A list of (name, value) tuples
+            timeout: Number of seconds before the items should be deleted (0 = never)
+
+        Return Value:
+            None
+        '''
+        assert items is not None
+        assert timeout >= 0
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        # Check the type of the values before sending anything
+        for _, _value in items:
+            if not isinstance(_value, str) and not cls.__is_binary(value=_value):
+                raise TypeError(f"Variable type not supported: {type(_value)}")
+
+        items = [ ( _name, _value if isinstance(_value, str) else cls.__to_buffer(value=_value) )
+                for _name, _value in items ]
+
+        _deadline = cls.__deadline(timeout=timeout)
+
+        _pipeline = cls.__redis.pipeline(transaction=False)
+        if timeout:
+            _px = cls.__redis_px(timeout=timeout)
+            for _name, _value in items:
+                _pipeline.set(_name, _value, px=_px)
+
+        elif cls.__redis_cluster:
+            # Multi-key commands must be in a single slot in a cluster
+            _values = dict(items)
+            for _slot_names in cls._group_by_slot(names=list(_values.keys())).values():
+                _pipeline.mset({ _name: _values[_name] for _name in _slot_names })
+
+        elif items:
+            _pipeline.mset(dict(items))
+
+        cls.__call_redis(func=_pipeline.execute, deadline_ms=0)
+
+        cls.__shadow_update(items=items)
+        cls.__invalidate_many(names=[ _name for _name, _ in items ])
+
+        # Set metadata to expire
+        if _deadline or cls.__expiry_deadlines:
+            cls.__lock.acquire()
+            for _name, _ in items:
+                cls.__schedule_expiry(name=_name, backing_store="redis", deadline=_deadline)
+            cls.__lock.release()
+
+
+    #
+    # __redis_px
+    #
+    @staticmethod
+    def __redis_px(timeout=0):
+        '''
+        Convert a timeout to milliseconds for redis (PX)
+
+        Parameters:
+            timeout: Number of seconds (may be fractional)
+
+        Return Value:
+            int: The number of milliseconds (at least 1), or None if there is no timeout
+        '''
+        if not timeout: return None
+
+        return max(1, math.ceil(timeout * 1000))
+
+
+    #
+    # _get_redis
+    #
+    @classmethod
+    def _get_redis(cls, name=None, deadline_ms=None):
+        '''
+        Get a value from redis
+
+        Parameters:
+            name: Name of the config item
+            deadline_ms: Milliseconds to wait for redis (None = the default set with
+                'configure_resilience', 0 = no deadline)
+
+        Return Value:
+            value: The config item value (exception will be raised on error), None if not found
+                (bytes for items registered as 'binary')
+        '''
+        assert name
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        def _get():
+            # Check if the value exists
+            if not cls.__redis_read.exists(name): return None
+
+            # Check the type of the value
+            _value_type = cls.__redis_read.type(name)
+            if _value_type != "string":
+                raise TypeError(f"Redis variable type not supported: {_value_type}")
+
+            # String (or bytes)
+            if cls.__is_binary_item(name=name): return cls.__get_redis_binary().get(name)
+
+            return cls.__redis_read.get(name)
+
+        _value = cls.__call_redis(func=_get, deadline_ms=deadline_ms,
+                fallback=lambda: cls.__shadow_lookup(names=[ name ]).get(name, _MISSING))
+
+        cls.__shadow_update(items=[ ( name, _value ) ])
+        return _value
+
+
+    #
+    # _get_redis_many
+    #
+    @classmethod
+    def _get_redis_many(cls, names=None, deadline_ms=None):
+        '''
+        Get a number of values from redis (in a single request)
+
+        Parameters:
+            names: A list of config item names
+            deadline_ms: Milliseconds to wait for redis (None = the default set with
+                'configure_resilience', 0 = no deadline)
+
+        Return Value:
+            dict: The values, indexed by name (None if not found, bytes for items
+                registered as 'binary')
+        '''
+        assert names is not None
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        def _get():
+            _binary_names = [ _name for _name in names if cls.__is_binary_item(name=_name) ]
+            if not _binary_names: return cls.__mget(client=cls.__redis_read, names=names)
+
+            _values = cls.__mget(client=cls.__redis_read,
+                    names=[ _name for _name in names if not cls.__is_binary_item(name=_name) ])
+            _values.update(cls.__mget(client=cls.__get_redis_binary(), names=_binary_names))
+
+            return { _name: _values[_name] for _name in names }
+
+        # Stale values are only served if there is one for every name
+        def _stale():
+            _values = cls.__shadow_lookup(names=names)
+            return _values if len(_values) == len(names) else _MISSING
+
+        _values = cls.__call_redis(func=_get, deadline_ms=deadline_ms, fallback=_stale)
+
+        cls.__shadow_update(items=_values.items())
+        return _values
+
+
+    #
+    # __mget
+    #
+    @classmethod
+    def __mget(cls, client=None, names=None):
+        '''
+        Get a number of values from redis with a client (in a single request)
+
+        Parameters:
+            client: The redis client
+            names: A list of config item names
+
+        Return Value:
+            dict: The values, indexed by name (None if not found)
+        '''
+        assert client
+        assert names is not None
+
+        if not names: return {}
+
+        if not cls.__redis_cluster:
+            return dict(zip(names, client.mget(names)))
+
+        # Multi-key commands must be in a single slot in a cluster, so send an MGET for
+        # each slot (the pipeline sends the commands for each node together)
+        _slots = cls._group_by_slot(names=names)
+        _pipeline = client.pipeline()
+        for _slot_names in _slots.values():
+            _pipeline.mget(_slot_names)
+
+        _values = {}
+        for _slot_names, _slot_values in zip(_slots.values(), _pipeline.execute()):
+            _values.update(zip(_slot_names, _slot_values))
+
+        return _values
+
+
+    #
+    # _delete_redis
+    #
+    @classmethod
+    def _delete_redis(cls, name=None):
+        '''
+        Delete a value from redis
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True is successful, False Otherwise (exception will be raised)
+        '''
+        assert name
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        # 'delete' should raise an exception if there is a problem.  Check the number of
+        # keys deleted on the master (a replica may not have caught up yet)
+        _deleted = cls.__call_redis(func=lambda: cls.__redis.delete(name), deadline_ms=0)
+        cls.__shadow_update(items=[ ( name, _MISSING ) ])
+        if not _deleted: raise KeyError(f"'{name}' item does not exist in Redis")
+
+        cls.__lock.acquire()
+        cls.__expiry_deadlines.pop(name, None)
+        cls.__lock.release()
+
+        cls.__invalidate(name=name)
+        return True
+
+
+
+    #
+    # _has_item_redis
+    #
+    @classmethod
+    def _has_item_redis(cls, name=None):
+        '''
+        Get a value in redis
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True is item exists, False Otherwise
+        '''
+        assert name
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        # 'exists' returns a number and our return is boolen, so be explicit.  While
+        # redis is unavailable, an item with a stale value exists
+        return cls.__call_redis(func=lambda: bool(cls.__redis_read.exists(name)),
+                fallback=lambda: True if cls.__shadow_lookup(names=[ name ]) else _MISSING)
+
+
+    #
+    # __is_binary_item
+    #
+    @classmethod
+    def __is_binary_item(cls, name=None):
+        '''
+        Determine if an item is stored in redis as bytes (binary items that aren't
+        encrypted - encrypted values are strings)
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True if the item is stored as bytes, False otherwise
+        '''
+        _conf_meta = cls.__conf_meta.get(name, None)
+
+        return bool(_conf_meta and _conf_meta.binary and not _conf_meta.encrypt)
+
+
+    #
+    # _group_by_slot
+    #
+    @staticmethod
+    def _group_by_slot(names=None):
+        '''
+        Group names by their Redis Cluster hash slot
+
+        Parameters:
+            names: A list of config item names
+
+        Return Value:
+            dict: Lists of names (in their original order), indexed by hash slot
+        '''
+        assert names is not None
+        from redis.crc import key_slot
+
+        _slots = {}
+        for _name in names:
+            _slots.setdefault(key_slot(_name.encode()), []).append(_name)
+
+        return _slots
+
+
+    ###########################################################################
+    #
+    # Redis resilience
+    #
+    ###########################################################################
+    #
+    # configure_resilience
+    #
+    @classmethod
+    def configure_resilience(cls, failure_threshold=None, reset_timeout=None, deadline_ms=None,
+                             serve_stale=None, stale_max_bytes=None):
+        '''
+        Configure how calls to redis behave when redis is slow or unavailable
+
+        Calls that fail with a connection error or a timeout are counted, and once
+        'failure_threshold' fail in a row the circuit breaker opens - calls fail straight
+        away with ConnectionError rather than waiting on redis.  After 'reset_timeout'
+        seconds a single call is let through, and the breaker closes if it succeeds.
+
+        Parameters:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a call is tried
+            deadline_ms: Milliseconds reads wait for redis by default (0 = no deadline,
+                so the redis client's own socket timeout applies).  Writes don't have a
+                deadline, as one that timed out could still be applied afterwards.  A read
+                that misses its deadline still holds a thread until redis answers, and
+                reads fail straight away while REDIS_DEADLINE_WORKERS are waiting
+            serve_stale: If True, a copy is kept of the last value read from (or written
+                to) redis for each item, and reads return it instead of raising an error
+                while the breaker is open or when the call fails.  Setting it to False
+                drops the copies.  Copies are dropped when the item is deleted or expires
+            stale_max_bytes: The most memory used by the copies (the least recently
+                updated are dropped first)
+
+        Return Value:
+            None
+        '''
+        if failure_threshold is not None:
+            if failure_threshold < 1: raise ValueError("failure_threshold must be at least 1")
+            cls.__breaker_threshold = failure_threshold
+
+        if reset_timeout is not None:
+            if reset_timeout < 0: raise ValueError("reset_timeout must not be negative")
+            cls.__breaker_reset = reset_timeout
+
+        if deadline_ms is not None:
+            if deadline_ms < 0: raise ValueError("deadline_ms must not be negative")
+            cls.__redis_deadline_ms = deadline_ms
+
+        if stale_max_bytes is not None:
+            if stale_max_bytes < 0: raise ValueError("stale_max_bytes must not be negative")
+            cls.__shadow_max_bytes = stale_max_bytes
+
+        if serve_stale is not None: cls.__serve_stale = bool(serve_stale)
+
+        cls.__lock_shadow.acquire()
+        if not cls.__serve_stale:
+            cls.__shadow = OrderedDict()
+            cls.__shadow_bytes = 0
+
+        cls.__shadow_evict()
+        cls.__lock_shadow.release()
+
+
+    #
+    # resilience_stats
+    #
+    @classmethod
+    def resilience_stats(cls):
+        '''
+        Get the state of the redis circuit breaker
+
+        Parameters:
+            None
+
+        Return Value:
+            dict: The state ("closed", "open" or "half-open"), the consecutive failures,
+                and the number (and size) of the stale values that can be served
+        '''
+        cls.__lock_breaker.acquire()
+        if cls.__breaker_opened_at is None:
+            _state = "closed"
+        elif cls.__breaker_trial or \
+                time.monotonic() - cls.__breaker_opened_at >= cls.__breaker_reset:
+            _state = "half-open"
+        else:
+            _state = "open"
+
+        _stats = {
+            "state": _state,
+            "failures": cls.__breaker_failures,
+            "stale_items": len(cls.__shadow),
+            "stale_bytes": cls.__shadow_bytes,
+        }
+        cls.__lock_breaker.release()
+
+        return _stats
+
+
+    #
+    # __call_redis
+    #
+    @classmethod
+    def __call_redis(cls, func=None, deadline_ms=None, fallback=None):
+        '''
+        Make a call to redis through the circuit breaker
+
+        Parameters:
+            func: A function making the call (with no arguments)
+            deadline_ms: Milliseconds to wait for the call (None = the configured default,
+                0 = no deadline, which writes use).  The call is made in a pool of threads
+                if there is one
+            fallback: A function returning the stale value to serve instead of raising an
+                error (or _MISSING if there isn't one)
+
+        Return Value:
+            The value returned by the function (or the stale value)
+        '''
+        assert func
+        from redis.exceptions import ConnectionError as RedisConnectionError
+        from redis.exceptions import TimeoutError as RedisTimeoutError
+
+        if deadline_ms is None: deadline_ms = cls.__redis_deadline_ms
+
+        def _stale():
+            if not fallback or not cls.__serve_stale: return _MISSING
+            return fallback()
+
+        if not cls.__breaker_allow():
+            _value = _stale()
+            if _value is not _MISSING: return _value
+
+            raise ConnectionError("Redis is unavailable (the circuit breaker is open)")
+
+        try:
+            if deadline_ms:
+                from concurrent.futures import TimeoutError as FutureTimeoutError
+
+                # A call that misses its deadline can't be stopped, and holds its thread
+                # until redis answers.  Rather than queue behind those, calls fail straight
+                # away once every thread is busy
+                if not cls.__redis_inflight.acquire(blocking=False):
+                    raise TimeoutError("Too many redis calls waiting for a response")
+
+                try:
+                    _future = cls.__get_redis_executor().submit(func)
+                except Exception:
+                    cls.__redis_inflight.release()
+                    raise
+
+                _future.add_done_callback(lambda _: cls.__redis_inflight.release())
+
+                try:
+                    _result = _future.result(timeout=deadline_ms / 1000)
+                except FutureTimeoutError:
+                    raise TimeoutError(f"No response from redis within {deadline_ms}ms") from None
+
+            else:
+                _result = func()
+
+        except ( ConnectionError, TimeoutError, RedisConnectionError, RedisTimeoutError ):
+            cls.__breaker_record(success=False)
+
+            _value = _stale()
+            if _value is not _MISSING: return _value
+            raise
+
+        except Exception:
+            # Redis answered - the error isn't with the connection
+            cls.__breaker_record(success=True)
+            raise
+
+        cls.__breaker_record(success=True)
+        return _result
+
+
+    #
+    # __breaker_allow
+    #
+    @classmethod
+    def __breaker_allow(cls):
+        '''
+        Determine if a call to redis can be made.  Once the breaker has been open for
+        the reset timeout, a single trial call is allowed
+
+        Parameters:
+            None
+
+        Return Value:
+            Boolean: True if the call can be made, False otherwise
+        '''
+        if cls.__breaker_opened_at is None: return True
+
+        cls.__lock_breaker.acquire()
+        try:
+            if cls.__breaker_opened_at is None: return True
+            if cls.__breaker_trial: return False
+            if time.monotonic() - cls.__breaker_opened_at < cls.__breaker_reset: return False
+
+            cls.__breaker_trial = True
+            return True
+
+        finally:
+            cls.__lock_breaker.release()
+
+
+    #
+    # __breaker_record
+    #
+    @classmethod
+    def __breaker_record(cls, success=True):
+        '''
+        Record the result of a call to redis (opening or closing the breaker)
+
+        Parameters:
+            success: True if redis answered, False if the call failed
+
+        Return Value:
+            None
+        '''
+        if success and not cls.__breaker_failures and cls.__breaker_opened_at is None: return
+
+        cls.__lock_breaker.acquire()
+        if success:
+            cls.__breaker_failures = 0
+            cls.__breaker_opened_at = None
+
+        else:
+            cls.__breaker_failures += 1
+
+            # A failed trial opens it again straight away
+            if cls.__breaker_trial or cls.__breaker_failures >= cls.__breaker_threshold:
+                cls.__breaker_opened_at = time.monotonic()
+
+        cls.__breaker_trial = False
+        cls.__lock_breaker.release()
+
+
+    #
+    # __get_redis_executor
+    #
+    @classmethod
+    def __get_redis_executor(cls):
+        '''
+        Get the pool of threads used for calls to redis with a deadline (created when
+        first needed)
+
+        Parameters:
+            None
+
+        Return Value:
+            ThreadPoolExecutor: The pool of threads
+        '''
+        if cls.__redis_executor: return cls.__redis_executor
+
+        cls.__lock_breaker.acquire()
+        if not cls.__redis_executor:
+            from concurrent.futures import ThreadPoolExecutor
+            cls.__redis_executor = ThreadPoolExecutor(max_workers=REDIS_DEADLINE_WORKERS,
+                    thread_name_prefix="redis-deadline")
+        cls.__lock_breaker.release()
+
+        return cls.__redis_executor
+
+
+    #
+    # __shadow_update
+    #
+    @classmethod
+    def __shadow_update(cls, items=None):
+        '''
+        Keep a copy of values read from (or written to) redis, to serve if redis is
+        unavailable.  Nothing is kept unless 'serve_stale' is set
+
+        Parameters:
+            items: An iterable of (name, value) tuples (_MISSING removes the copy)
+
+        Return Value:
+            None
+        '''
+        if not cls.__serve_stale and not cls.__shadow: return
+
+        # Copy binary values before taking the lock
+        _items = [ ( _name, _value if _value is _MISSING or _value is None or
+                isinstance(_value, str) else cls.__to_bytes(value=_value) )
+                for _name, _value in items ]
+
+        cls.__lock_shadow.acquire()
+        for _name, _value in _items:
+            _old = cls.__shadow.pop(_name, None)
+            if _old: cls.__shadow_bytes -= _old[1]
+
+            if _value is _MISSING or not cls.__serve_stale: continue
+
+            _size = sys.getsizeof(_value)
+            cls.__shadow[_name] = ( _value, _size )
+            cls.__shadow_bytes += _size
+
+        cls.__shadow_evict()
+        cls.__lock_shadow.release()
+
+
+    #
+    # __shadow_evict
+    #
+    @classmethod
+    def __shadow_evict(cls):
+        '''
+        Drop the least recently updated copies until they are within 'stale_max_bytes'.
+        Must be called with the shadow lock held
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        while cls.__shadow and cls.__shadow_bytes > cls.__shadow_max_bytes:
+            _, ( _, _size ) = cls.__shadow.popitem(last=False)
+            cls.__shadow_bytes -= _size
+
+
+    #
+    # __shadow_lookup
+    #
+    @classmethod
+    def __shadow_lookup(cls, names=None):
+        '''
+        Get the stale copies of values
+
+        Parameters:
+            names: A list of config item names
+
+        Return Value:
+            dict: The values with a copy, indexed by name
+        '''
+        assert names is not None
+
+        cls.__lock_shadow.acquire()
+        _values = { _name: cls.__shadow[_name][0] for _name in names if _name in cls.__shadow }
+        cls.__lock_shadow.release()
+
+        return _values
+
+
+    ###########################################################################
+    #
+    # Access methods for SQLite
+    #
+    ###########################################################################
+    #
+    # _set_sqlite
+    #
+    @classmethod
+    def _set_sqlite(cls, name=None, value=None, timeout=0):
+        '''
+        Set a value in the SQLite database (committed with the next batch)
+
+        Parameters:
+            name: Name of the config item
+            value: The config item value
+            timeout: Number of seconds before the item should be deleted (0 = never)
+
+        Return Value:
+            None
+        '''
+        assert name
+        cls._set_sqlite_many(items=[ ( name, value ) ], timeout=timeout)
+
+
+    #
+    # _set_sqlite_many
+    #
+    @classmethod
+    def _set_sqlite_many(cls, items=None, timeout=0):
+        '''
+        Set a number of values in the SQLite database (committed with the next batch)
+
+        Parameters:
+            items: A list of (name, value) tuples
+            timeout: Number of seconds before the items should be deleted (0 = never)
+
+        Return Value:
+            None
+        '''
+        assert items is not None
+        assert timeout >= 0
+        if not cls.__sqlite: raise RuntimeError("SQLite database has not been configured")
+
+        _deadline = cls.__deadline(timeout=timeout)
+
+        # The store checks the type of the values before keeping any
+        cls.__sqlite.set_many(items=[ ( _name, cls.__to_bytes(value=_value) )
+                for _name, _value in items ], timeout=timeout)
+
+        cls.__invalidate_many(names=[ _name for _name, _ in items ])
+
+        # Set metadata to expire
+        if _deadline or cls.__expiry_deadlines:
+            cls.__lock.acquire()
+            for _name, _ in items:
+                cls.__schedule_expiry(name=_name, backing_store="sqlite", deadline=_deadline)
+            cls.__lock.release()
+
+
+    #
+    # _get_sqlite
+    #
+    @classmethod
+    def _get_sqlite(cls, name=None):
+        '''
+        Get a value from the SQLite database
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            value: The config item value, None if not found
+        '''
+        assert name
+        if not cls.__sqlite: raise RuntimeError("SQLite database has not been configured")
+
+        return cls.__sqlite.get(name=name)
+
+
+    #
+    # _get_sqlite_many
+    #
+    @classmethod
+    def _get_sqlite_many(cls, names=None):
+        '''
+        Get a number of values from the SQLite database
+
+        Parameters:
+            names: A list of config item names
+
+        Return Value:
+            dict: The values, indexed by name (None if not found)
+        '''
+        assert names is not None
+        if not cls.__sqlite: raise RuntimeError("SQLite database has not been configured")
+
+        return cls.__sqlite.get_many(names=names)
+
+
+    #
+    # _delete_sqlite
+    #
+    @classmethod
+    def _delete_sqlite(cls, name=None):
+        '''
+        Delete a value from the SQLite database (committed with the next batch)
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True is successful, False Otherwise (exception will be raised)
+        '''
+        assert name
+        if not cls.__sqlite: raise RuntimeError("SQLite database has not been configured")
+
+        if not cls.__sqlite.delete(name=name):
+            raise KeyError(f"'{name}' item does not exist in SQLite")
+
+        cls.__lock.acquire()
+        cls.__expiry_deadlines.pop(name, None)
+        cls.__lock.release()
+
+        cls.__invalidate(name=name)
+        return True
+
+
+    #
+    # _has_item_sqlite
+    #
+    @classmethod
+    def _has_item_sqlite(cls, name=None):
+        '''
+        Determine if an item exists in the SQLite database
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True is item exists, False Otherwise
+        '''
+        assert name
+        if not cls.__sqlite: raise RuntimeError("SQLite database has not been configured")
+
+        return cls.__sqlite.has_item(name=name)
+
+
+    #
+    # _close_sqlite
+    #
+    @classmethod
+    def _close_sqlite(cls):
+        '''
+        Commit any waiting writes and close the SQLite database
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        if not cls.__sqlite: return
+
+        cls.__sqlite.close()
+        cls.__sqlite = None
+
+
+    ###########################################################################
+    #
+    # Write-behind for Redis
+    #
+    ###########################################################################
+    #
+    # configure_write_behind
+    #
+    @classmethod
+    def configure_write_behind(cls, interval=None, max_batch=None):
+        '''
+        Configure how buffered writes are sent to redis (for items registered with
+        'write_behind')
+
+        Parameters:
+            interval: Seconds between flushes (None = don't change)
+            max_batch: Number of buffered items that trigger an early flush
+                (None = don't change)
+
+        Return Value:
+            None
+        '''
+        if interval is not None and interval <= 0:
+            raise ValueError("'interval' must be greater than 0")
+
+        if max_batch is not None and max_batch < 1:
+            raise ValueError("'max_batch' must be at least 1")
+
+        cls.__wb_condition.acquire()
+        if interval is not None: cls.__wb_interval = interval
+        if max_batch is not None: cls.__wb_max_batch = max_batch
+        cls.__wb_condition.notify_all()
+        cls.__wb_condition.release()
+
+
+    #
+    # flush
+    #
+    @classmethod
+    def flush(cls):
+        '''
+        Send any buffered writes to redis, and commit any writes waiting in the SQLite
+        database, now
+
+        Parameters:
+            None
+
+        Return Value:
+            int: The number of items written
+        '''
+        _count = cls.__sqlite.flush() if cls.__sqlite else 0
+
+        return _count + cls.__flush_redis()
+
+
+    #
+    # __flush_redis
+    #
+    @classmethod
+    def __flush_redis(cls):
+        '''
+        Send any buffered writes to redis
+
+        Parameters:
+            None
+
+        Return Value:
+            int: The number of items written
+        '''
+        cls.__wb_flush_lock.acquire()
+        try:
+            # Move the buffer to 'inflight' (reads still see the values until sent)
+            cls.__wb_condition.acquire()
+            cls.__wb_inflight = cls.__wb_buffer
+            cls.__wb_buffer = {}
+            cls.__wb_condition.release()
+
+            _items = cls.__wb_inflight
+            if not _items: return 0
+
+            try:
+                if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+                # Each name is only written once (with the latest value) however many
+                # times it was set
+                _pipeline = cls.__redis.pipeline(transaction=False)
+                _now = time.monotonic_ns()
+                for _name, ( _value, _deadline ) in _items.items():
+                    if not _deadline:
+                        _pipeline.set(_name, _value)
+
+                    elif _deadline > _now:
+                        # Only the time left before the item expires
+                        _pipeline.set(_name, _value,
+                                px=max(1, math.ceil((_deadline - _now) / 1_000_000)))
+
+                cls.__call_redis(func=_pipeline.execute, deadline_ms=0)
+                cls.__shadow_update(items=[ ( _name, _value )
+                        for _name, ( _value, _ ) in _items.items() ])
+
+            except Exception:
+                # Put the writes back in the buffer (unless set again since) to retry
+                cls.__wb_condition.acquire()
+                for _name, _item in _items.items():
+                    cls.__wb_buffer.setdefault(_name, _item)
+                cls.__wb_condition.release()
+                raise
+
+            finally:
+                cls.__wb_condition.acquire()
+                cls.__wb_inflight = {}
+                cls.__wb_condition.release()
+
+            cls.__invalidate_many(names=list(_items.keys()))
+            return len(_items)
+
+        finally:
+            cls.__wb_flush_lock.release()
+
+
+    #
+    # __wb_write
+    #
+    @classmethod
+    def __wb_write(cls, name=None, value=None, timeout=0):
+        '''
+        Buffer a write to redis
+
+        Parameters:
+            name: Name of the config item
+            value: The config item value
+            timeout: Number of seconds before the item should be deleted (0 = never)
+
+        Return Value:
+            None
+        '''
+        assert name
+        assert timeout >= 0
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        # Check the type of the value now, rather than when it is sent
+        if not isinstance(value, str) and not cls.__is_binary(value=value):
+            raise TypeError(f"Variable type not supported: {type(value)}")
+
+        # Binary values are copied (a buffer could change before it is sent)
+        value = cls.__to_bytes(value=value)
+
+        _deadline = cls.__deadline(timeout=timeout)
+
+        cls.__wb_condition.acquire()
+        cls.__wb_buffer[name] = ( value, _deadline )
+
+        if not cls.__wb_thread:
+            cls.__wb_thread = Thread(target=cls.__wb_flusher, daemon=True)
+            cls.__wb_thread.start()
+            atexit.register(cls.__flush_redis)
+
+        # Wake the flusher for the first write (to start the interval) or a full batch
+        if len(cls.__wb_buffer) in ( 1, cls.__wb_max_batch ): cls.__wb_condition.notify_all()
+        cls.__wb_condition.release()
+
+        cls.__invalidate(name=name)
+
+        # Set metadata to expire
+        cls.__lock.acquire()
+        cls.__schedule_expiry(name=name, backing_store="redis", deadline=_deadline)
+        cls.__lock.release()
+
+
+    #
+    # __wb_flusher
+    #
+    @classmethod
+    def __wb_flusher(cls):
+        '''
+        Background thread to send buffered writes to redis
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        while True:
+            cls.__wb_condition.acquire()
+            while not cls.__wb_buffer:
+                cls.__wb_condition.wait()
+
+            # Give more writes time to arrive (unless the batch is already full).  Being
+            # woken doesn't end the wait early, but a shorter interval does
+            _start = time.monotonic()
+            while cls.__wb_buffer and len(cls.__wb_buffer) < cls.__wb_max_batch:
+                _remaining = _start + cls.__wb_interval - time.monotonic()
+                if _remaining <= 0: break
+                cls.__wb_condition.wait(timeout=_remaining)
+
+            _interval = cls.__wb_interval
+            cls.__wb_condition.release()
+
+            try:
+                cls.__flush_redis()
+            except Exception:
+                # The writes are back in the buffer - wait before trying again
+                time.sleep(_interval)
+
+
+    #
+    # __wb_lookup
+    #
+    @classmethod
+    def __wb_lookup(cls, name=None):
+        '''
+        Get a value waiting to be written to redis
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            value: The value, or _MISSING if there is no buffered write for the item
+        '''
+        assert name
+
+        if not cls.__wb_buffer and not cls.__wb_inflight: return _MISSING
+
+        cls.__wb_condition.acquire()
+        _item = cls.__wb_buffer.get(name, None) or cls.__wb_inflight.get(name, None)
+        cls.__wb_condition.release()
+
+        return _item[0] if _item else _MISSING
+
+
+    #
+    # __wb_discard
+    #
+    @classmethod
+    def __wb_discard(cls, name=None):
+        '''
+        Remove any buffered write for an item (before it is written or deleted directly)
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True if there was a buffered write, False otherwise
+        '''
+        assert name
+
+        if not cls.__wb_buffer and not cls.__wb_inflight: return False
+
+        # Wait for any flush in progress, so it can't overwrite what comes next
+        cls.__wb_flush_lock.acquire()
+        cls.__wb_condition.acquire()
+        _item = cls.__wb_buffer.pop(name, None)
+        cls.__wb_condition.release()
+        cls.__wb_flush_lock.release()
+
+        return _item is not None
+
+
+    #
+    # __get_redis_value
+    #
+    @classmethod
+    def __get_redis_value(cls, name=None, deadline_ms=None):
+        '''
+        Get a value from redis, or the buffered write if it hasn't been sent yet
+
+        Parameters:
+            name: Name of the config item
+            deadline_ms: Milliseconds to wait for redis (None = the configured default)
+
+        Return Value:
+            value: The config item value, None if not found
+        '''
+        _value = cls.__wb_lookup(name=name)
+        if _value is not _MISSING: return _value
+
+        return cls._get_redis(name=name, deadline_ms=deadline_ms)
+
+
+    ###########################################################################
+    #
+    # Streams
+    #
+    ###########################################################################
+    #
+    # set_stream
+    #
+    @classmethod
+    def set_stream(cls, name=None, data=None, chunk_size=STREAM_CHUNK_SIZE, timeout=0):
+        '''
+        Store a large value in redis, as a number of chunks (each in its own key) and a
+        manifest listing them.  The chunks are sent a few at a time, so only those are
+        held in memory.  The manifest is replaced once all of the chunks are written, so
+        readers see either the old value or the new one.
+
+        Streams are kept apart from config items (the keys have STREAM_KEY_PREFIX), and
+        are bytes (strings are UTF-8 encoded) that aren't encrypted or compressed.
+
+        Parameters:
+            name: Name of the stream
+            data: The value - bytes, a string, an iterable of bytes/strings, or a file
+                object opened for reading
+            chunk_size: Number of bytes in each chunk
+            timeout: Number of seconds (from the call) before the stream is deleted
+                (0 = never)
+
+        Return Value:
+            int: The size of the value in bytes
+        '''
+        assert name
+        assert data is not None
+        assert timeout >= 0
+        if chunk_size < 1: raise ValueError("'chunk_size' must be at least 1")
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        # Each version of a stream has its own chunks
+        _version = os.urandom(8).hex()
+        _count = 0
+        _size = 0
+
+        # The chunks expire 'timeout' seconds after they are written, and the manifest
+        # at the deadline (so it never outlives a chunk it lists)
+        _deadline = cls.__deadline(timeout=timeout)
+        _px = cls.__redis_px(timeout=timeout)
+
+        _pipeline = cls.__redis.pipeline(transaction=False)
+        try:
+            for _chunk in cls.__iter_chunks(data=data, chunk_size=chunk_size):
+                _pipeline.set(cls.__stream_key(name=name, version=_version, index=_count),
+                        _chunk, px=_px)
+                _count += 1
+                _size += len(_chunk)
+
+                if _count % STREAM_BATCH_CHUNKS == 0:
+                    cls.__call_redis(func=_pipeline.execute, deadline_ms=0)
+
+            cls.__call_redis(func=_pipeline.execute, deadline_ms=0)
+
+            # Swap in the new manifest, getting the old one in the same transaction (GET
+            # and SET in a MULTI, rather than SET ... GET, which needs redis 6.2)
+            if _deadline:
+                _px = cls.__redis_px(timeout=max(0.001,
+                        (_deadline - time.monotonic_ns()) / 1_000_000_000))
+
+            def _swap():
+                _transaction = cls.__redis.pipeline(transaction=True)
+                _transaction.get(cls.__stream_key(name=name))
+                _transaction.set(cls.__stream_key(name=name),
+                        json.dumps({ "version": _version, "chunks": _count, "size": _size }),
+                        px=_px)
+                return _transaction.execute()[0]
+
+            _old_manifest = cls.__call_redis(func=_swap, deadline_ms=0)
+
+        except Exception:
+            # Don't leave the chunks of an incomplete version behind (if redis can't be
+            # reached, the error that stopped the write is raised rather than this one)
+            _pipeline.reset()
+            try:
+                cls.__delete_stream_chunks(name=name, manifest={ "version": _version,
+                        "chunks": _count })
+            except Exception:
+                pass
+
+            raise
+
+        # Readers may still be using the old version, so let its chunks expire shortly
+        if _old_manifest:
+            cls.__delete_stream_chunks(name=name, manifest=json.loads(_old_manifest),
+                    grace=STREAM_GRACE_PERIOD)
+
+        return _size
+
+
+    #
+    # get_stream
+    #
+    @classmethod
+    def get_stream(cls, name=None, batch_chunks=STREAM_BATCH_CHUNKS):
+        '''
+        Read a stream (see set_stream).  The chunks are fetched as they are needed,
+        'batch_chunks' at a time
+
+        Parameters:
+            name: Name of the stream
+            batch_chunks: Number of chunks fetched in each request
+
+        Return Value:
+            iterator: The chunks (bytes), or None if the stream doesn't exist.  A
+                KeyError is raised while iterating if the stream is replaced and the
+                chunks being read have expired
+        '''
+        assert name
+        if batch_chunks < 1: raise ValueError("'batch_chunks' must be at least 1")
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        _manifest = cls.__call_redis(func=lambda: cls.__redis_read.get(
+                cls.__stream_key(name=name)))
+        if _manifest is None: return None
+
+        return cls.__read_stream(name=name, manifest=json.loads(_manifest),
+                batch_chunks=batch_chunks)
+
+
+    #
+    # delete_stream
+    #
+    @classmethod
+    def delete_stream(cls, name=None):
+        '''
+        Delete a stream
+
+        Parameters:
+            name: Name of the stream
+
+        Return Value:
+            Boolean: True is successful, False Otherwise (exception will be raised)
+        '''
+        assert name
+        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
+
+        # GET and DEL in a MULTI (rather than GETDEL, which needs redis 6.2)
+        def _remove():
+            _transaction = cls.__redis.pipeline(transaction=True)
+            _transaction.get(cls.__stream_key(name=name))
+            _transaction.delete(cls.__stream_key(name=name))
+            return _transaction.execute()[0]
+
+        _manifest = cls.__call_redis(func=_remove, deadline_ms=0)
+        if _manifest is None: raise KeyError(f"'{name}' stream does not exist in Redis")
+
+        cls.__delete_stream_chunks(name=name, manifest=json.loads(_manifest))
+        return True
+
+
+    #
+    # __stream_key
+    #
+    @staticmethod
+    def __stream_key(name="", version="", index=None):
+        '''
+        Get the key of the manifest of a stream, or of one of its chunks.  The name is
+        a hash tag, so all of the keys of a stream are in the same cluster slot
+
+        Parameters:
+            name: Name of the stream
+            version: The version of the stream (for a chunk)
+            index: The number of the chunk (None = the manifest)
+
+        Return Value:
+            string: The key
+        '''
+        _key = f"{STREAM_KEY_PREFIX}{{{name}}}"
+        if index is None: return _key
+
+        return f"{_key}:{version}:{index}"
+
+
+    #
+    # __iter_chunks
+    #
+    @classmethod
+    def __iter_chunks(cls, data=None, chunk_size=STREAM_CHUNK_SIZE):
+        '''
+        Split a value in to chunks.  Large pieces are split without copying them
+
+        Parameters:
+            data: The value (see set_stream)
+            chunk_size: Number of bytes in each chunk
+
+        Return Value:
+            iterator: The chunks (bytes or memoryviews), each 'chunk_size' bytes except
+                the last
+        '''
+        if hasattr(data, "read"):
+            _file = data
+            data = iter(lambda: _file.read(chunk_size) or None, None)
+
+        elif isinstance(data, str) or cls.__is_binary(value=data):
+            data = [ data ]
+
+        _buffer = bytearray()
+        for _piece in data:
+            _view = memoryview(_piece.encode()) if isinstance(_piece, str) \
+                    else cls.__to_buffer(value=_piece)
+            _offset = 0
+
+            # Fill up a part chunk first
+            if _buffer:
+                _offset = chunk_size - len(_buffer)
+                _buffer += _view[:_offset]
+                if len(_buffer) < chunk_size: continue
+
+                yield bytes(_buffer)
+                _buffer = bytearray()
+
+            while len(_view) - _offset >= chunk_size:
+                yield _view[_offset:_offset + chunk_size]
+                _offset += chunk_size
+
+            _buffer += _view[_offset:]
+
+        if _buffer: yield bytes(_buffer)
+
+
+    #
+    # __read_stream
+    #
+    @classmethod
+    def __read_stream(cls, name=None, manifest=None, batch_chunks=STREAM_BATCH_CHUNKS):
+        '''
+        Fetch the chunks of a version of a stream
+
+        Parameters:
+            name: Name of the stream
+            manifest: The manifest of the version
+            batch_chunks: Number of chunks fetched in each request
+
+        Return Value:
+            iterator: The chunks (bytes)
+        '''
+        _client = cls.__get_redis_binary()
+
+        for _start in range(0, manifest["chunks"], batch_chunks):
+            _keys = [ cls.__stream_key(name=name, version=manifest["version"], index=_index)
+                    for _index in range(_start, min(_start + batch_chunks, manifest["chunks"])) ]
+
+            for _chunk in cls.__call_redis(func=lambda: _client.mget(_keys)):
+                if _chunk is None:
+                    raise KeyError(f"'{name}' stream was replaced while it was being read")
+
+                yield _chunk
+
+
+    #
+    # __delete_stream_chunks
+    #
+    @classmethod
+    def __delete_stream_chunks(cls, name=None, manifest=None, grace=0):
+        '''
+        Delete the chunks of a version of a stream
+
+        Parameters:
+            name: Name of the stream
+            manifest: The manifest of the version
+            grace: If set, the chunks are deleted after this many seconds rather than now
+
+        Return Value:
+            None
+        '''
+        _pipeline = cls.__redis.pipeline(transaction=False)
+        for _index in range(manifest["chunks"]):
+            _key = cls.__stream_key(name=name, version=manifest["version"], index=_index)
+            if grace:
+                _pipeline.expire(_key, grace)
+            else:
+                _pipeline.delete(_key)
+
+        cls.__call_redis(func=_pipeline.execute, deadline_ms=0)
+
+
+    ###########################################################################
+    #
+    # Memory budget for the local store
+    #
+    ###########################################################################
+    #
+    # configure_memory
+    #
+    @classmethod
+    def configure_memory(cls, budget=0, namespace_budgets=None, policy="lru", track=True):
+        '''
+        Track the (estimated) memory used by items in the local store, and optionally
+        limit it.  When a budget is exceeded, items are evicted (deleted) until it
+        isn't.  Constants, and the items being set, are never evicted.
+
+        The namespace of an item is the part of its name before the first "." (items
+        without a "." are in the "" namespace).  Sizes are estimates (from
+        sys.getsizeof over the value and its contents).
+
+        Parameters:
+            budget: Maximum bytes for all local items (0 = no limit)
+            namespace_budgets: A dict of namespace -> maximum bytes for its items
+            policy: Which items are evicted first - "lru" (least recently used) or
+                "lfu" (least frequently used)
+            track: If False, stop tracking (and limiting) memory use
+
+        Return Value:
+            None
+        '''
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"'policy' must be one of {EVICTION_POLICIES}")
+
+        if budget < 0: raise ValueError("'budget' must not be negative")
+
+        cls.__lock.acquire()
+
+        cls.__mem_budget = budget if track else 0
+        cls.__mem_namespace_budgets = dict(namespace_budgets or {}) if track else {}
+        cls.__mem_policy = policy
+
+        # Start from the items currently in the store
+        cls.__mem_sizes = OrderedDict()
+        cls.__mem_hits = {}
+        cls.__mem_freq = {}
+        cls.__mem_freq_counts = []
+        cls.__mem_reads.clear()
+        cls.__mem_namespaces = {}
+        cls.__mem_total = 0
+        cls.__mem_track = track
+
+        _evicted = []
+        if track:
+            _evicted = cls.__mem_update(sizes=[ ( _name, cls.__estimate_size(value=_value) )
+                    for _name, _value in cls.__conf.items() ])
+
+        cls.__lock.release()
+
+        cls.__invalidate_many(names=_evicted)
+
+
+    #
+    # memory_stats
+    #
+    @classmethod
+    def memory_stats(cls):
+        '''
+        Report the memory used by items in the local store
+
+        Parameters:
+            None
+
+        Return Value:
+            dict: "tracking", "bytes", "items", "budget", "policy", "evictions", and
+                "namespaces" (a dict of namespace -> "bytes", "items", "budget")
+        '''
+        cls.__lock.acquire()
+
+        _stats = {
+            "tracking": cls.__mem_track,
+            "bytes": cls.__mem_total,
+            "items": len(cls.__mem_sizes),
+            "budget": cls.__mem_budget,
+            "policy": cls.__mem_policy,
+            "evictions": cls.__mem_evictions,
+            "namespaces": { _namespace: {
+                    "bytes": _usage[0],
+                    "items": _usage[1],
+                    "budget": cls.__mem_namespace_budgets.get(_namespace, 0),
+                } for _namespace, _usage in cls.__mem_namespaces.items() },
+        }
+
+        cls.__lock.release()
+
+        return _stats
+
+
+    #
+    # __namespace
+    #
+    @staticmethod
+    def __namespace(name=""):
+        '''
+        Get the namespace of an item (the part of the name before the first ".")
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            string: The namespace ("" if the name has no ".")
+        '''
+        return name.partition(".")[0] if "." in name else ""
+
+
+    #
+    # __estimate_size
+    #
+    @staticmethod
+    def __estimate_size(value=None):
+        '''
+        Estimate the memory used by a value (including the contents of containers, and
+        the attributes of objects)
+
+        Parameters:
+            value: The value
+
+        Return Value:
+            int: The estimated size in bytes
+        '''
+        _size = 0
+        _seen = set()
+        _pending = [ value ]
+
+        while _pending:
+            _value = _pending.pop()
+            if id(_value) in _seen: continue
+            _seen.add(id(_value))
+
+            _size += sys.getsizeof(_value)
+
+            if isinstance(_value, memoryview):
+                # The size of a view doesn't include the memory it refers to
+                _size += _value.nbytes
+
+            elif isinstance(_value, dict):
+                _pending.extend(_value.keys())
+                _pending.extend(_value.values())
+
+            elif isinstance(_value, (list, tuple, set, frozenset)):
+                _pending.extend(_value)
+
+            elif hasattr(_value, "__dict__") and not isinstance(_value, type):
+                _pending.append(vars(_value))
+
+        return _size
+
+
+    #
+    # __check_size
+    #
+    @classmethod
+    def __check_size(cls, name=None, value=None):
+        '''
+        Estimate the size of an item, and make sure it fits in its budget at all
+
+        Parameters:
+            name: Name of the config item
+            value: The config item value
+
+        Return Value:
+            int: The estimated size in bytes
+        '''
+        assert name
+
+        _size = cls.__estimate_size(value=value)
+
+        for _budget in ( cls.__mem_budget,
+                cls.__mem_namespace_budgets.get(cls.__namespace(name=name), 0) ):
+            if _budget and _size > _budget:
+                raise ValueError(f"'{name}' ({_size} bytes) is larger than the memory budget")
+
+        return _size
+
+
+    #
+    # __mem_update
+    #
+    @classmethod
+    def __mem_update(cls, sizes=None):
+        '''
+        Update the memory used by items, then evict items if over budget.  Must be
+        called with the lock held
+
+        Parameters:
+            sizes: A list of (name, size) tuples (size None if the item was deleted)
+
+        Return Value:
+            list: The names of the items evicted
+        '''
+        assert sizes is not None
+
+        cls.__mem_account(sizes=sizes)
+        cls.__mem_apply_reads()
+
+        if not cls.__mem_budget and not cls.__mem_namespace_budgets: return []
+
+        return cls.__mem_evict(protect={ _name for _name, _ in sizes })
+
+
+    #
+    # __mem_account
+    #
+    @classmethod
+    def __mem_account(cls, sizes=None):
+        '''
+        Update the memory used by items.  Must be called with the lock held
+
+        Parameters:
+            sizes: A list of (name, size) tuples (size None if the item was deleted)
+
+        Return Value:
+            None
+        '''
+        assert sizes is not None
+
+        _lfu = cls.__mem_policy == "lfu"
+        for _name, _size in sizes:
+            _namespace = cls.__namespace(name=_name)
+            _usage = cls.__mem_namespaces.setdefault(_namespace, [ 0, 0 ])
+
+            _old_size = cls.__mem_sizes.pop(_name, None)
+            if _old_size is not None:
+                cls.__mem_total -= _old_size
+                _usage[0] -= _old_size
+                _usage[1] -= 1
+
+            if _size is None:
+                _hits = cls.__mem_hits.pop(_name, None)
+                if _lfu and _hits is not None: cls.__mem_freq_move(name=_name, old=_hits)
+                if not _usage[1]: del cls.__mem_namespaces[_namespace]
+                continue
+
+            # Most recently used
+            cls.__mem_sizes[_name] = _size
+            _hits = cls.__mem_hits.setdefault(_name, 0)
+            if _lfu:
+                cls.__mem_freq_move(name=_name,
+                        old=None if _old_size is None else _hits, new=_hits)
+            cls.__mem_total += _size
+            _usage[0] += _size
+            _usage[1] += 1
+
+
+    #
+    # __mem_touch
+    #
+    @classmethod
+    def __mem_touch(cls, name=None):
+        '''
+        Record a read of an item (for eviction).  The read is queued rather than taking
+        the lock, to keep reads fast, and applied on the next write (see
+        '__mem_apply_reads')
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            None
+        '''
+        cls.__mem_reads.append(name)
+
+
+    #
+    # __mem_apply_reads
+    #
+    @classmethod
+    def __mem_apply_reads(cls):
+        '''
+        Apply the queued reads to the order and counts used for eviction.  Must be
+        called with the lock held
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        _lfu = cls.__mem_policy == "lfu"
+
+        # Readers only append, so the queue can't empty under us
+        while cls.__mem_reads:
+            _name = cls.__mem_reads.popleft()
+
+            # The item may have been deleted since
+            _hits = cls.__mem_hits.get(_name, None)
+            if _hits is None: continue
+
+            cls.__mem_sizes.move_to_end(_name)
+            cls.__mem_hits[_name] = _hits + 1
+            if _lfu: cls.__mem_freq_move(name=_name, old=_hits, new=_hits + 1)
+
+
+    #
+    # __mem_freq_move
+    #
+    @classmethod
+    def __mem_freq_move(cls, name=None, old=None, new=None):
+        '''
+        Move an item between the LFU buckets (to the most recently used end of the new
+        one).  Must be called with the lock held
+
+        Parameters:
+            name: Name of the config item
+            old: The number of reads it was bucketed under (None if not bucketed)
+            new: The number of reads to bucket it under (None to remove it)
+
+        Return Value:
+            None
+        '''
+        assert name
+
+        if old is not None:
+            _bucket = cls.__mem_freq[old]
+            del _bucket[name]
+            if not _bucket:
+                del cls.__mem_freq[old]
+                del cls.__mem_freq_counts[bisect.bisect_left(cls.__mem_freq_counts, old)]
+
+        if new is not None:
+            _bucket = cls.__mem_freq.get(new, None)
+            if _bucket is None:
+                _bucket = cls.__mem_freq[new] = OrderedDict()
+                bisect.insort(cls.__mem_freq_counts, new)
+
+            _bucket[name] = None
+
+
+    #
+    # __mem_evict
+    #
+    @classmethod
+    def __mem_evict(cls, protect=None):
+        '''
+        Evict items until the local store is within its budgets.  Must be called with
+        the lock held
+
+        Parameters:
+            protect: A set of names that must not be evicted
+
+        Return Value:
+            list: The names of the items evicted
+        '''
+        _evicted = []
+
+        # Namespace budgets first (evicting those items counts towards the total)
+        _over = [ ( _namespace, _budget )
+                for _namespace, _budget in cls.__mem_namespace_budgets.items()
+                if _budget and cls.__mem_namespaces.get(_namespace, [ 0 ])[0] > _budget ]
+        if cls.__mem_budget and cls.__mem_total > cls.__mem_budget:
+            _over.append(( None, cls.__mem_budget ))
+
+        for _namespace, _budget in _over:
+            while True:
+                if _namespace is None:
+                    if cls.__mem_total <= _budget: break
+                elif cls.__mem_namespaces.get(_namespace, [ 0 ])[0] <= _budget:
+                    break
+
+                _victim = cls.__mem_victim(namespace=_namespace, protect=protect)
+                if not _victim: break
+
+                # As for expiry - the item and its registration are removed
+                if not _evicted: cls.__generation += 1
+                if cls.__snapshots: cls.__record_history(name=_victim)
+                del cls.__conf[_victim]
+                cls.__drop_registration(name=_victim)
+                cls.__mem_account(sizes=[ ( _victim, None ) ])
+
+                cls.__mem_evictions += 1
+                _evicted.append(_victim)
+
+        return _evicted
+
+
+    #
+    # __mem_victim
+    #
+    @classmethod
+    def __mem_victim(cls, namespace=None, protect=None):
+        '''
+        Choose the next item to evict
+
+        Parameters:
+            namespace: Only choose from this namespace (None = any)
+            protect: A set of names that must not be evicted
+
+        Return Value:
+            string: The name of the item to evict (None if there is nothing to evict)
+        '''
+        if cls.__mem_policy == "lfu":
+            # Least frequently read (the least recently used of those) - the buckets in
+            # order, rather than looking at the count of every item
+            _names = ( _name for _count in cls.__mem_freq_counts
+                    for _name in cls.__mem_freq[_count] )
+        else:
+            _names = iter(cls.__mem_sizes)
+
+        # The order (and the buckets) only change with the lock held, so don't change
+        # while being looked through
+        return next(( _name for _name in _names
+                if _name not in protect
+                and (namespace is None or cls.__namespace(name=_name) == namespace)
+                and not (_name in cls.__conf_meta and cls.__conf_meta[_name].constant) ),
+                None)
+
+
+    ###########################################################################
+    #
+    # Process forking
+    #
+    ###########################################################################
+    #
+    # configure_fork
+    #
+    @classmethod
+    def configure_fork(cls, local_state="keep"):
+        '''
+        Configure what a forked child process does with the config it inherits.  In
+        either case the child gets new locks and redis connections, and writes the
+        parent buffered for redis (write-behind) are left for the parent to send.
+
+        Parameters:
+            local_state: "keep" - the child starts with the parent's local items
+                "clear" - the child starts with no local items (redis items stay
+                registered)
+
+        Return Value:
+            None
+        '''
+        if local_state not in FORK_LOCAL_STATES:
+            raise ValueError(f"'local_state' must be one of {FORK_LOCAL_STATES}")
+
+        cls.__fork_local_state = local_state
+
+
+    #
+    # _before_fork
+    #
+    @classmethod
+    def _before_fork(cls):
+        '''
+        Called in the parent before a fork.  Takes the locks the child recreates (in
+        a fixed order), so the child doesn't inherit anything part way through a change.
+        The store lock is always taken, as the child can't be given a half changed store.
+        Any other lock that can't be taken within FORK_LOCK_TIMEOUT (such as one already
+        held by the thread forking) is left and logged, so the fork can't deadlock
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        _locks = [ ( "watch", cls.__lock_watch ), ( "write behind flush", cls.__wb_flush_lock ),
+                ( "rekey", cls.__lock_rekey ), ( "compute", cls.__lock_compute ),
+                ( "key", cls.__lock_key ), ( "store", cls.__lock ),
+                ( "resolve", cls.__lock_resolve ), ( "env", cls.__lock_env ),
+                ( "write behind", cls.__wb_condition ),
+                ( "redis binary", cls.__lock_redis_binary ), ( "breaker", cls.__lock_breaker ),
+                ( "shadow", cls.__lock_shadow ) ]
+
+        cls.__fork_held = []
+        for _name, _lock in _locks:
+            if _lock is cls.__lock:
+                _lock.acquire()
+            elif not _lock.acquire(timeout=FORK_LOCK_TIMEOUT):
+                _logger.warning("The %s lock is still held after %ss - forking without it",
+                        _name, FORK_LOCK_TIMEOUT)
+                continue
+
+            cls.__fork_held.append(_lock)
+
+
+    #
+    # _after_fork_in_parent
+    #
+    @classmethod
+    def _after_fork_in_parent(cls):
+        '''
+        Called in the parent after a fork
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        for _lock in reversed(cls.__fork_held): _lock.release()
+        cls.__fork_held = []
+
+
+    #
+    # _after_fork_in_child
+    #
+    @classmethod
+    def _after_fork_in_child(cls):
+        '''
+        Called in the child after a fork.  Only the thread that forked exists in the
+        child, so locks held by other threads in the parent would never be released.
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        cls.__fork_held = []
+        cls.__lock = Lock()
+        cls.__lock_env = Lock()
+        cls.__lock_resolve = Lock()
+        cls.__lock_key = Lock()
+
+        # Items being computed in other threads never will be in the child
+        cls.__lock_compute = Lock()
+        cls.__computing = {}
+
+        # The re-encryption thread doesn't exist in the child (the parent carries on)
+        cls.__lock_rekey = Lock()
+        cls.__rekey_pending = set()
+        cls.__rekey_thread = None
+
+        # The flusher thread doesn't exist in the child, and the parent sends its own
+        # buffered writes
+        cls.__wb_condition = Condition()
+        cls.__wb_flush_lock = Lock()
+        cls.__wb_buffer = {}
+        cls.__wb_inflight = {}
+        cls.__wb_thread = None
+
+        # The watcher thread doesn't exist in the child (it starts its own)
+        cls.__lock_watch = Lock()
+        if cls.__watcher: cls.__watcher.after_fork()
+
+        # Connections are shared with the parent - the redis-py pools notice they are in
+        # a new process, and create new ones
+        cls.__lock_redis_binary = Lock()
+
+        # The threads making calls with a deadline don't exist in the child.  The breaker
+        # is left as it was (the child is talking to the same redis)
+        cls.__lock_breaker = Lock()
+        cls.__breaker_trial = False
+        cls.__redis_executor = None
+        cls.__redis_inflight = BoundedSemaphore(REDIS_DEADLINE_WORKERS)
+        cls.__lock_shadow = Lock()
+
+        # A SQLite connection can't be used in more than one process
+        if cls.__sqlite: cls.__sqlite.after_fork()
+
+        if cls.__fork_local_state == "clear":
+            for _name, _conf_meta in list(cls.__conf_meta.items()):
+                if _conf_meta.backing_store == "local": cls.__drop_registration(name=_name)
+
+            cls.__conf = {}
+            cls.__conf_expiry = [ _entry for _entry in cls.__conf_expiry
+                    if _entry[2].backing_store != "local" ]
+            heapq.heapify(cls.__conf_expiry)
+            cls.__expiry_deadlines = { _entry[2].name: _entry[0] for _entry in cls.__conf_expiry
+                    if cls.__expiry_deadlines.get(_entry[2].name, None) == _entry[0] }
+
+            cls.__snapshots = {}
+            cls.__history = {}
+            cls.__mem_sizes = OrderedDict()
+            cls.__mem_hits = {}
+            cls.__mem_freq = {}
+            cls.__mem_freq_counts = []
+            cls.__mem_reads.clear()
+            cls.__mem_namespaces = {}
+            cls.__mem_total = 0
+            cls.__invalidate_all()
+
+
+    ###########################################################################
+    #
+    # Access methods for config data
+    #
+    ###########################################################################
+    #
+    # register
+    #
+    @classmethod
+    def register(cls, name=None, value=None, by_reference=True, overwrite=False,
+                 constant=False, timeout=0, encrypt=False, backing_store="local",
+                 write_behind=False, tags=None, compress=False, binary=False):
+        '''
+        Register complex data types to identify how to handle them
+
+        Parameters:
+            name: Name of the config item
+            value: The config item value
+            by_reference: Store a reference to the object or a deep copy
+                When backing store is redis or sqlite, this is ignored (always a copy)
+            overwrite: Allow overwrite of existing config item if it exists
+            constant: Can the value be overwritten at any time?
+            timeout: Number of seconds before the item is deleted (may be fractional, eg 0.25)
+            encrypt: If true, the item is encrypted on set, and decrypted on get.  May be
+                the name of a cipher (one of CIPHERS - True is "fernet").  Locally stored
+                items encrypted with an AEAD cipher are kept as bytes
+            backing_store: Allow the data to be store in an alternate backing store
+                Valid Values: local, redis, sqlite
+            write_behind: If true, 'set' updates a local buffer which is sent to redis in
+                the background (see configure_write_behind).  Only valid for redis items.
+                The registration itself is written immediately.
+            tags: A tag, or list of tags, to find the item by (see 'find').  For redis
+                items, the tags are also kept in redis (so other processes can find them)
+            compress: If true, values at least as large as the threshold (see
+                configure_compression) are compressed, before being encrypted.  May be
+                the name of an algorithm (one of COMPRESSORS).  Values other than strings
+                are converted to JSON to be compressed (as for encrypted values)
+            binary: If true, the value is binary - bytes, bytearray, memoryview or any
+                object supporting the buffer protocol (eg a NumPy array).  It is stored
+                without any conversion (bytes in redis and sqlite, read from redis with a
+                connection that doesn't decode responses), and 'get_buffer' returns a view
+                of it.  Binary items can't be compressed, and can only be encrypted with
+                an AEAD cipher
+
+        Return Value:
+            Boolean: True is successful, False Otherwise (exception will be raised)
+        '''
+        assert name
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        _valid_backing_stores = ( "local", "redis", "sqlite" )
+        if backing_store not in _valid_backing_stores:
+            raise ValueError(f"'backing_store' must be one of {_valid_backing_stores}")
+
+        if name in cls.__conf_meta:
+            if cls.__conf_meta[name].constant:
+                raise TypeError(f"'{name}' is defined as a constant")
+
+        if name in cls.__conf and not overwrite:
+            raise KeyError(f"'{name}' already exists")
+
+        if write_behind and backing_store != "redis":
+            raise ValueError("'write_behind' is only valid for the redis backing store")
+
+        cls.__check_cipher(encrypt=encrypt)
+        if compress and compress is not True: compressors.check_algorithm(algorithm=compress)
+        if binary: cls.__check_binary(encrypt=encrypt, compress=compress, values=[ value ])
+
+        # Variable cannot be stored by reference in Redis or SQLite
+        if backing_store in ( "redis", "sqlite" ): by_reference = False
+
+        # Update the meta info
+        cls.__lock.acquire()
+        _old_meta = cls.__set_registration(name=name, conf_meta=ConfigMetaClass(
+                backing_store=backing_store, by_reference=by_reference, constant=constant,
+                encrypt=encrypt, timeout=timeout, write_behind=write_behind, tags=tags,
+                compress=compress, binary=binary))
+        cls.__lock.release()
+
+        if encrypt or compress:
+            value = cls.__encode_value(value=value, encrypt=encrypt, compress=compress,
+                    binary=backing_store == "local")
+
+        if backing_store == "redis":
+            # Store tha value in Redis (replacing any buffered write)
+            cls.__wb_discard(name=name)
+            cls._set_redis(name=name, value=value, timeout=timeout)
+
+        elif backing_store == "sqlite":
+            # Store the value in the SQLite database
+            cls._set_sqlite(name=name, value=value, timeout=timeout)
+        
+        else:
+            # Store the value locally
+            cls._set_local(name=name, value=value, by_reference=by_reference, timeout=timeout)
+
+        # Keep the tags of redis items in redis
+        _old_tags = _old_meta.tags if _old_meta and _old_meta.backing_store == "redis" \
+                else frozenset()
+        _tags = cls.__conf_meta[name].tags if backing_store == "redis" else frozenset()
+        if _tags or _old_tags:
+            cls.__set_redis_tags(names=[ name ], old_tags=_old_tags, tags=_tags)
+
+        return True
+
+
+    #
+    # register_many
+    #
+    @classmethod
+    def register_many(cls, items=None, by_reference=True, overwrite=False, constant=False,
+                      timeout=0, encrypt=False, backing_store="local", workers=0, tags=None,
+                      compress=False, binary=False):
+        '''
+        Register a number of items with the same settings
+
+        All items are checked before any are registered.  Values to be encrypted are
+        encrypted using a pool of threads, and the items are then stored under a single
+        lock acquisition (or a single pipeline for redis).
+
+        Parameters:
+            items: A dict (or iterable of (name, value) tuples) of the config items
+            by_reference: Store a reference to the object or a deep copy
+                When backing store is redis or sqlite, this is ignored (always a copy)
+            overwrite: Allow overwrite of existing config items if they exist
+            constant: Can the values be overwritten at any time?
+            timeout: Number of seconds before the items are deleted (may be fractional)
+            encrypt: If true, the items are encrypted on set, and decrypted on get (or
+                the name of a cipher - see 'register')
+            backing_store: Allow the data to be store in an alternate backing store
+                Valid Values: local, redis, sqlite
+            workers: Number of threads used to encrypt the values (0 = number of CPUs)
+            tags: A tag, or list of tags, for all of the items (see 'register')
+            compress: If true, the items are compressed (see 'register')
+            binary: If true, the values are binary (see 'register')
+
+        Return Value:
+            dict: 'count' - The number of items registered, 'seconds' - The time taken,
+                'items_per_second' - The throughput
+        '''
+        assert items is not None
+
+        _start = time.perf_counter()
+
+        if isinstance(items, dict): items = items.items()
+        _items = list(items)
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        _valid_backing_stores = ( "local", "redis", "sqlite" )
+        if backing_store not in _valid_backing_stores:
+            raise ValueError(f"'backing_store' must be one of {_valid_backing_stores}")
+
+        cls.__check_cipher(encrypt=encrypt)
+        if compress and compress is not True: compressors.check_algorithm(algorithm=compress)
+        if binary:
+            cls.__check_binary(encrypt=encrypt, compress=compress,
+                    values=[ _value for _, _value in _items ])
+
+        for _name, _ in _items:
+            assert _name
+
+            if _name in cls.__conf_meta:
+                if cls.__conf_meta[_name].constant:
+                    raise TypeError(f"'{_name}' is defined as a constant")
+
+            if _name in cls.__conf and not overwrite:
+                raise KeyError(f"'{_name}' already exists")
+
+        # Variable cannot be stored by reference in Redis or SQLite
+        if backing_store in ( "redis", "sqlite" ): by_reference = False
+
+        if encrypt or compress:
+            _values = cls.__crypt_many(func=functools.partial(cls.__encode_value,
+                    encrypt=encrypt, compress=compress, binary=backing_store == "local"),
+                    values=[ _value for _, _value in _items ], workers=workers)
+            _items = [ (_name, _value) for (_name, _), _value in zip(_items, _values) ]
+
+        # Update the meta info
+        _old_tags = set()
+        cls.__lock.acquire()
+        for _name, _ in _items:
+            _old_meta = cls.__set_registration(name=_name, conf_meta=ConfigMetaClass(
+                    backing_store=backing_store, by_reference=by_reference,
+                    constant=constant, encrypt=encrypt, timeout=timeout, tags=tags,
+                    compress=compress, binary=binary))
+            if _old_meta and _old_meta.backing_store == "redis": _old_tags |= _old_meta.tags
+        cls.__lock.release()
+
+        if backing_store == "redis":
+            # Store the values in Redis (replacing any buffered writes)
+            for _name, _ in _items: cls.__wb_discard(name=_name)
+            cls._set_redis_many(items=_items, timeout=timeout)
+
+        elif backing_store == "sqlite":
+            # Store the values in the SQLite database (committed in one batch)
+            cls._set_sqlite_many(items=_items, timeout=timeout)
+
+        else:
+            # Store the values locally
+            cls._set_local_many(items=_items, by_reference=by_reference, timeout=timeout)
+
+        # Keep the tags of redis items in redis
+        _tags = ConfigMetaClass(tags=tags).tags if backing_store == "redis" else frozenset()
+        if _tags or _old_tags:
+            cls.__set_redis_tags(names=[ _name for _name, _ in _items ],
+                    old_tags=frozenset(_old_tags), tags=_tags)
+
+        _seconds = time.perf_counter() - _start
+        return {
+            "count": len(_items),
+            "seconds": _seconds,
+            "items_per_second": len(_items) / _seconds if _seconds else 0
+        }
+
+
+    #
+    # load_file
+    #
+    @classmethod
+    def load_file(cls, path="", format=None, namespace="", backing_store="local",
+                  overwrite=True, encrypt=False, batch_size=10000):
+        '''
+        Register the top level items in a config file as config items
+
+        Supported formats are JSON, NDJSON, TOML, YAML and .env.  JSON and NDJSON
+        files are streamed rather than read whole.  Items are registered in batches
+        (see register_many), each stored under a single lock acquisition (or a single
+        pipeline for redis).
+
+        Parameters:
+            path: Path of the config file
+            format: The format of the file - json, ndjson, toml, yaml or env
+                (None = determine from the file name)
+            namespace: If set, config item names are prefixed with '<namespace>.'
+            backing_store: Where the config items are stored (see register)
+            overwrite: Allow overwrite of existing config items
+            encrypt: If true, the items are encrypted on set, and decrypted on get (or
+                the name of a cipher - see 'register')
+            batch_size: Number of items registered at a time
+
+        Return Value:
+            dict: 'count' - The number of items registered, 'seconds' - The time taken,
+                'items_per_second' - The throughput
+        '''
+        assert path
+        assert batch_size > 0
+
+        _start = time.perf_counter()
+        _count = 0
+        _batch = []
+
+        for _name, _value in loaders.iter_items(path=path, format=format):
+            if namespace: _name = f"{namespace}.{_name}"
+            _batch.append((_name, _value))
+
+            if len(_batch) >= batch_size:
+                _count += cls.register_many(items=_batch, overwrite=overwrite, encrypt=encrypt,
+                        backing_store=backing_store)["count"]
+                _batch = []
+
+        if _batch:
+            _count += cls.register_many(items=_batch, overwrite=overwrite, encrypt=encrypt,
+                    backing_store=backing_store)["count"]
+
+        _seconds = time.perf_counter() - _start
+        return {
+            "count": _count,
+            "seconds": _seconds,
+            "items_per_second": _count / _seconds if _seconds else 0
+        }
+
+
+    #
+    # get_registration
+    #
+    @classmethod
+    def get_registration(cls, name=None):
+        '''
+        Register complex data types to identify how to handle them
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            ConfigMetaClass: The registration info for the variable (None if not registered)
+        '''
+        assert name
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        if name in cls.__conf_meta:
+            return cls.__conf_meta[name]
+        else:
+            return None
+
+
+    #
+    # set
+    #
+    @classmethod
+    def set(cls, name=None, value=None):
+        '''
+        Set a config item
+        Note - Complex data types are copied by reference
+        User the 'register' method to make a copy of objects
+
+        Parameters:
+            name: Name of the config item
+            value: The config item value
+
+        Return Value:
+            None
+        '''
+        assert name
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        _conf_meta = cls.get_registration(name=name)
+        if _conf_meta:
+            # Is this a constant?
+            if _conf_meta.constant: raise TypeError(f"'{name}' is defined as a constant")
+
+            _backing_store = _conf_meta.backing_store
+            _by_reference = _conf_meta.by_reference
+            _timeout = _conf_meta.timeout
+            _encrypt = _conf_meta.encrypt
+            _compress = _conf_meta.compress
+            _write_behind = _conf_meta.write_behind
+            if _conf_meta.binary: cls.__check_binary(values=[ value ])
+        else:
+            _backing_store = "local"
+            _by_reference = True
+            _timeout = 0
+            _encrypt = False
+            _compress = False
+            _write_behind = False
+
+        if _encrypt or _compress:
+            value = cls.__encode_value(value=value, encrypt=_encrypt, compress=_compress,
+                    binary=_backing_store == "local")
+
+        if _backing_store == "redis" and _write_behind:
+            # Value is buffered and sent to redis in the background
+            cls.__wb_write(name=name, value=value, timeout=_timeout)
+
+        elif _backing_store == "redis":
+            # Value is stored in redis
+            cls._set_redis(name=name, value=value, timeout=_timeout)
+
+        elif _backing_store == "sqlite":
+            # Value is stored in the SQLite database
+            cls._set_sqlite(name=name, value=value, timeout=_timeout)
+        
+        else:
+            # Value stored in the local store
+            cls._set_local(name=name, value=value, by_reference=_by_reference, timeout=_timeout)
+
+
+    #
+    # get
+    #
+    @classmethod
+    def get(cls, name=None, default=None, deadline_ms=None):
+        '''
+        Get a config item
+
+        Parameters:
+            name: Name of the config item
+            default: The default value to use if the item doesn't exist
+            deadline_ms: Milliseconds to wait for redis items (None = the default set with
+                'configure_resilience', 0 = no deadline).  TimeoutError is raised when
+                the deadline passes (unless a stale value is served)
+
+        Return Value:
+            The config item value
+        '''
+        assert name
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        _conf_meta = cls.get_registration(name=name)
+        if _conf_meta:
+            _backing_store = _conf_meta.backing_store
+            _by_reference = _conf_meta.by_reference
+        else:
+            _backing_store = "local"
+            _by_reference = True
+
+        # Get the value
+        if _backing_store == "redis":
+            # Value is stored in redis (or waiting to be written to it)
+            _value = cls.__get_redis_value(name=name, deadline_ms=deadline_ms)
+
+        elif _backing_store == "sqlite":
+            # Value is stored in the SQLite database
+            _value = cls._get_sqlite(name=name)
+
+        else:
+            # Value is stored locally
+            _value = cls._get_local(name=name, by_reference=_by_reference)
+
+        if _conf_meta: _value = cls.__decode_value(value=_value, conf_meta=_conf_meta, name=name)
+
+        # Return the default if value not found
+        if not _value: _value = default
+        return _value
+
+
+    #
+    # get_buffer
+    #
+    @classmethod
+    def get_buffer(cls, name=None, default=None):
+        '''
+        Get a binary config item as a memoryview of its bytes.  For local items this
+        is a view of the stored value (so nothing is copied), and for redis items a view
+        of the bytes returned by redis
+
+        Parameters:
+            name: Name of the config item
+            default: The value to return if the item doesn't exist
+
+        Return Value:
+            memoryview: The bytes of the value (flat, with the format 'B')
+        '''
+        assert name
+
+        _value = cls.get(name=name)
+        if _value is None: return default
+
+        if not cls.__is_binary(value=_value):
+            raise TypeError(f"'{name}' is not a binary value: {type(_value)}")
+
+        return cls.__to_buffer(value=_value)
+
+
+    #
+    # get_many
+    #
+    @classmethod
+    def get_many(cls, names=None, default=None, workers=0, deadline_ms=None):
+        '''
+        Get a number of config items
+
+        Redis items are fetched in a single request, and encrypted values are
+        decrypted using a pool of threads.
+
+        Parameters:
+            names: A list of config item names
+            default: The default value to use for items that don't exist
+            workers: Number of threads used to decrypt the values (0 = number of CPUs)
+            deadline_ms: Milliseconds to wait for the redis items (None = the default set
+                with 'configure_resilience', 0 = no deadline)
+
+        Return Value:
+            dict: The config item values, indexed by name
+        '''
+        assert names is not None
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        _values = {}
+        _redis_names = []
+        _sqlite_names = []
+        _encrypted_names = []
+        _compressed_names = []
+
+        for _name in names:
+            assert _name
+
+            _conf_meta = cls.__conf_meta.get(_name, None)
+            if _conf_meta and _conf_meta.encrypt:
+                _encrypted_names.append(( _name, _conf_meta ))
+            elif _conf_meta and _conf_meta.compress:
+                _compressed_names.append(_name)
+
+            if _conf_meta and _conf_meta.backing_store == "redis":
+                # Value is stored in redis
+                _redis_names.append(_name)
+
+            elif _conf_meta and _conf_meta.backing_store == "sqlite":
+                # Value is stored in the SQLite database
+                _sqlite_names.append(_name)
+
+            else:
+                # Value is stored locally
+                _values[_name] = cls._get_local(name=_name,
+                        by_reference=_conf_meta.by_reference if _conf_meta else True)
+
+        if _redis_names:
+            _values.update(cls._get_redis_many(names=_redis_names, deadline_ms=deadline_ms))
+
+            # Writes waiting to be sent to redis take precedence
+            if cls.__wb_buffer or cls.__wb_inflight:
+                for _name in _redis_names:
+                    _value = cls.__wb_lookup(name=_name)
+                    if _value is not _MISSING: _values[_name] = _value
+
+        if _sqlite_names:
+            _values.update(cls._get_sqlite_many(names=_sqlite_names))
+
+        if _encrypted_names:
+            for _name, _ in _encrypted_names: cls.__check_key(name=_name, value=_values[_name])
+
+            _decrypted = cls.__crypt_many(
+                    func=lambda value: cls.__decode_value(value=value[0], conf_meta=value[1]),
+                    values=[ ( _values[_name], _conf_meta )
+                            for _name, _conf_meta in _encrypted_names ],
+                    workers=workers)
+            _values.update(zip([ _name for _name, _ in _encrypted_names ], _decrypted))
+
+        for _name in _compressed_names:
+            _values[_name] = cls.__decode_value(value=_values[_name],
+                    conf_meta=cls.__conf_meta.get(_name, None))
+
+        # Use the default if value not found
+        return { _name: _values[_name] if _values[_name] else default for _name in names }
+
+
+    #
+    # get_path
+    #
+    @classmethod
+    def get_path(cls, path=None, default=None, separator="."):
+        '''
+        Get a value from within a config item containing nested dicts/lists
+        eg 'service.db.pool.size' gets ['db']['pool']['size'] from the 'service' item
+        (or ['pool']['size'] from a 'service.db' item - the longest matching item
+        name is used)
+
+        Only the requested part of the value is copied (for items not stored by
+        reference).  Encrypted, redis and sqlite items must still be decoded in full.
+
+        Parameters:
+            path: The item name followed by the keys/list indexes within it
+            default: The value to use if the path doesn't exist
+            separator: The separator between the parts of the path
+
+        Return Value:
+            The value at the path
+        '''
+        assert path
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        # Find the item the path refers to (a dict lookup for each part of the path at
+        # most, so not worth keeping for arbitrary paths)
+        _entry = cls.__find_path_item(path=path, separator=separator)
+        if not _entry: return default
+
+        _name, _keys = _entry
+        _conf_meta = cls.__conf_meta.get(_name, None)
+        _backing_store = _conf_meta.backing_store if _conf_meta else "local"
+        _decode = _conf_meta and ( _conf_meta.encrypt or _conf_meta.compress )
+        _copy = False
+
+        if _backing_store in ( "redis", "sqlite" ):
+            if _backing_store == "redis":
+                _value = cls.__get_redis_value(name=_name)
+            else:
+                _value = cls._get_sqlite(name=_name)
+            if _value is None: return default
+
+            _value = cls.__decode_value(value=_value, conf_meta=_conf_meta, name=_name)
+            if not _conf_meta or not _conf_meta.encrypt: _value = cls.from_json(data=_value)
+
+        elif _decode:
+            _value = cls.__decode_value(value=cls._get_local(name=_name), conf_meta=_conf_meta,
+                    name=_name)
+
+        else:
+            # Walk the stored value, and only copy the part returned
+            _value = cls.__conf.get(_name, None)
+            _copy = _conf_meta and not _conf_meta.by_reference
+
+        for _key in _keys:
+            try:
+                if isinstance(_value, dict):
+                    _value = _value[_key]
+                elif isinstance(_value, (list, tuple)):
+                    _value = _value[int(_key)]
+                else:
+                    return default
+
+            except (KeyError, IndexError, ValueError):
+                return default
+
+        if _copy: _value = copy.deepcopy(_value)
+        return _value
+
+
+    #
+    # __find_path_item
+    #
+    @classmethod
+    def __find_path_item(cls, path="", separator="."):
+        '''
+        Find the config item a path refers to (the longest matching item name)
+
+        Parameters:
+            path: The item name followed by the keys/list indexes within it
+            separator: The separator between the parts of the path
+
+        Return Value:
+            tuple: (item name, tuple of keys within the item) or None if not found
+        '''
+        _parts = path.split(separator)
+
+        for _idx in range(len(_parts), 0, -1):
+            _name = separator.join(_parts[:_idx])
+            if cls.__path_item_exists(name=_name):
+                return (_name, tuple(_parts[_idx:]))
+
+        return None
+
+
+    #
+    # __path_item_exists
+    #
+    @classmethod
+    def __path_item_exists(cls, name=""):
+        '''
+        Check if a config item exists (without a request to redis)
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True if the item is stored locally or registered, False otherwise
+        '''
+        return name in cls.__conf or name in cls.__conf_meta
+
+
+    #
+    # delete
+    #
+    @classmethod
+    def delete(cls, name=None):
+        '''
+        Delete an item
+
+        Parameters:
+            name: Name of the config item to be deleted
+
+        Return Value:
+            None
+        '''
+        assert name
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        _conf_meta = cls.get_registration(name=name)
+        if _conf_meta:
+            _backing_store = _conf_meta.backing_store
+        else:
+            _backing_store = "local"
+
+        if _backing_store == "redis":
+            # Value is stored in redis.  A buffered write may not have been sent yet
+            _buffered = cls.__wb_discard(name=name)
+            try:
+                cls._delete_redis(name=name)
+            except KeyError:
+                if not _buffered: raise
+
+        elif _backing_store == "sqlite":
+            cls._delete_sqlite(name=name)
+
+        else:
+            cls._delete_local(name=name)
+
+        # Delete the item meta information if it exists
+        if name in cls.__conf_meta:
+            cls.__lock.acquire()
+            _old_meta = cls.__drop_registration(name=name)
+            cls.__lock.release()
+
+            if _old_meta and _old_meta.backing_store == "redis" and _old_meta.tags:
+                cls.__set_redis_tags(names=[ name ], old_tags=_old_meta.tags)
+
+
+    #
+    # has_item
+    #
+    @classmethod
+    def has_item(cls, name=None):
+        '''
+        Determine if an item exists
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True if exists exists, False otherwise
+        '''
+        assert name
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        _conf_meta = cls.get_registration(name=name)
+        if _conf_meta:
+            _backing_store = _conf_meta.backing_store
+        else:
+            _backing_store = "local"
+
+        if _backing_store == "redis":
+            # Value is stored in redis (or waiting to be written to it)
+            if cls.__wb_lookup(name=name) is not _MISSING: return True
+            return cls._has_item_redis(name=name)
+
+        elif _backing_store == "sqlite":
+            # Value is stored in the SQLite database
+            return cls._has_item_sqlite(name=name)
+        
+        else:
+            # Value is stored locally
+            return cls._has_item_local(name=name)
+
+
+    ###########################################################################
+    #
+    # Reloading config files
+    #
+    ###########################################################################
+    #
+    # watch_file
+    #
+    @classmethod
+    def watch_file(cls, path="", format=None, namespace="", backing_store="local",
+                   encrypt=False, interval=None, on_error=None):
+        '''
+        Load a config file (see load_file), and reload it whenever it changes.  Only
+        the items that changed in the file are changed in the config (see reload_file)
+
+        A background thread notices the changes - with inotify if the 'inotify_simple'
+        package is installed, otherwise by checking the file every 'interval' seconds.
+        A reload that fails is tried again at each check until it succeeds.
+
+        Parameters:
+            path: Path of the config file
+            format: The format of the file - json, ndjson, toml, yaml or env
+                (None = determine from the file name)
+            namespace: If set, config item names are prefixed with '<namespace>.'
+            backing_store: Where the config items are stored (see register)
+            encrypt: If true, the items are encrypted on set, and decrypted on get (or
+                the name of a cipher - see 'register')
+            interval: Seconds between checks of the watched files (None = don't change)
+            on_error: Function called (with the path and the exception) when a reload in
+                the background fails, once for each version of the file (None = log the
+                error with the 'application_config.watcher' logger)
+
+        Return Value:
+            dict: The number of items 'added', 'changed' and 'removed' (see reload_file)
+        '''
+        assert path
+        if interval is not None and interval <= 0:
+            raise ValueError("'interval' must be greater than 0")
+
+        from .watcher import FileWatcher, WATCH_INTERVAL
+
+        _path = os.path.abspath(path)
+
+        cls.__lock_watch.acquire()
+        cls.__watch_files[_path] = ConfigWatchClass(path=_path, format=format,
+                namespace=namespace, backing_store=backing_store, encrypt=encrypt,
+                on_error=on_error)
+
+        if not cls.__watcher:
+            cls.__watcher = FileWatcher(callback=cls.reload_file,
+                    interval=interval or WATCH_INTERVAL, on_error=cls.__watch_error)
+        elif interval is not None:
+            cls.__watcher.interval = interval
+        cls.__lock_watch.release()
+
+        # Watch the file before loading it, so no change can be missed
+        cls.__watcher.add(path=_path)
+
+        try:
+            return cls.reload_file(path=_path)
+
+        except Exception:
+            cls.unwatch_file(path=_path)
+            raise
+
+
+    #
+    # __watch_error
+    #
+    @classmethod
+    def __watch_error(cls, path="", error=None):
+        '''
+        Report a watched file that couldn't be reloaded in the background
+
+        Parameters:
+            path: Path of the config file
+            error: The exception raised by reload_file
+
+        Return Value:
+            None
+        '''
+        from .watcher import log_error
+
+        _watch = cls.__watch_files.get(path, None)
+        if _watch and _watch.on_error:
+            _watch.on_error(path, error)
+        else:
+            log_error(path=path, error=error)
+
+
+    #
+    # unwatch_file
+    #
+    @classmethod
+    def unwatch_file(cls, path=""):
+        '''
+        Stop reloading a config file when it changes (its items are left as they are)
+
+        Parameters:
+            path: Path of the config file
+
+        Return Value:
+            Boolean: True if the file was being watched, False otherwise
+        '''
+        assert path
+
+        _path = os.path.abspath(path)
+
+        cls.__lock_watch.acquire()
+        _watched = cls.__watch_files.pop(_path, None) is not None
+        if cls.__watcher: cls.__watcher.remove(path=_path)
+        cls.__lock_watch.release()
+
+        return _watched
+
+
+    #
+    # reload_file
+    #
+    @classmethod
+    def reload_file(cls, path=""):
+        '''
+        Reload a watched config file now.  The file is compared, item by item, with
+        what was in it when it was last loaded:
+            - New items (and items in the file that are no longer registered) are
+              registered
+            - Changed items are set
+            - Items no longer in the file are deleted
+            - Items that haven't changed aren't touched
+        All of these are applied in a single transaction, so readers see either the
+        old config or the new one.  If the transaction fails part way (after the redis
+        items are written), the values the redis items had are put back.
+
+        Parameters:
+            path: Path of the config file
+
+        Return Value:
+            dict: The number of items 'added', 'changed' and 'removed'
+        '''
+        assert path
+
+        _path = os.path.abspath(path)
+
+        # Only one reload at a time, so each sees the result of the one before
+        cls.__lock_watch.acquire()
+        try:
+            _watch = cls.__watch_files.get(_path, None)
+            if not _watch: raise KeyError(f"'{path}' is not being watched")
+
+            _items = {}
+            for _name, _value in loaders.iter_items(path=_path, format=_watch.format):
+                if _watch.namespace: _name = f"{_watch.namespace}.{_name}"
+                _items[_name] = _value
+
+            _added = []
+            _changed = {}
+            for _name, _value in _items.items():
+                if _name not in _watch.items or _name not in cls.__conf_meta:
+                    _added.append(( _name, _value ))
+                elif _watch.items[_name] != _value:
+                    _changed[_name] = _value
+
+            _removed = [ _name for _name in _watch.items.keys() if _name not in _items ]
+
+            # New items are registered in the same transaction (as 'register_many' would)
+            _changes = dict(_changed)
+            _changes.update(_added)
+            _changes.update({ _name: _MISSING for _name in _removed })
+            _registrations = { _name: ConfigMetaClass(backing_store=_watch.backing_store,
+                    by_reference=_watch.backing_store == "local", encrypt=_watch.encrypt)
+                    for _name, _ in _added }
+
+            # The redis items are written first, so keep the values they have as stored
+            # (to put back if the rest fails)
+            _saved = cls.__save_redis_values(names=[ _name for _name in _changes
+                    if ( _registrations.get(_name, None) or cls.__conf_meta.get(_name, None)
+                    or ConfigMetaClass() ).backing_store == "redis" ])
+
+            try:
+                cls._commit_changes(changes=_changes, registrations=_registrations)
+            except Exception:
+                cls.__undo_reload(saved=_saved)
+                raise
+
+            _watch.items = _items
+
+        finally:
+            cls.__lock_watch.release()
+
+        return {
+            "added": len(_added),
+            "changed": len(_changed),
+            "removed": len(_removed)
+        }
+
+
+    #
+    # __save_redis_values
+    #
+    @classmethod
+    def __save_redis_values(cls, names=None):
+        '''
+        Get the values of redis items as they are stored (encrypted, compressed, etc),
+        to put back if a reload fails (see '__undo_reload')
+
+        Parameters:
+            names: A list of config item names
+
+        Return Value:
+            dict: The stored values, indexed by name (None if not in redis)
+        '''
+        assert names is not None
+
+        if not names or not cls.__redis: return {}
+
+        return cls._get_redis_many(names=names, deadline_ms=0)
+
+
+    #
+    # __undo_reload
+    #
+    @classmethod
+    def __undo_reload(cls, saved=None):
+        '''
+        Put back the stored values of redis items after a reload that failed part way.
+        The registrations and local items are only changed once everything else has
+        worked, so don't need to be put back
+
+        Parameters:
+            saved: The stored values from '__save_redis_values'
+
+        Return Value:
+            None
+        '''
+        assert saved is not None
+
+        for _name, _value in saved.items():
+            try:
+                _conf_meta = cls.__conf_meta.get(_name, None)
+                _timeout = _conf_meta.timeout \
+                        if _conf_meta and _conf_meta.backing_store == "redis" else 0
+
+                if _value is None:
+                    cls.__call_redis(func=lambda: cls.__redis.delete(_name), deadline_ms=0)
+                    cls.__shadow_update(items=[ ( _name, _MISSING ) ])
+                else:
+                    cls._set_redis(name=_name, value=_value, timeout=_timeout)
+
+            except Exception:
+                # Carry on with the rest (the error from the reload is raised)
+                pass
+
+
+    ###########################################################################
+    #
+    # Tags
+    #
+    ###########################################################################
+    #
+    # find
+    #
+    @classmethod
+    def find(cls, tag=None):
+        '''
+        Find the items with a tag (including redis items tagged by other processes)
+
+        Parameters:
+            tag: The tag
+
+        Return Value:
+            list: The names of the items with the tag (sorted)
+        '''
+        assert tag
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        cls.__lock.acquire()
+        _names = set(cls.__tags.get(tag, ()))
+        cls.__lock.release()
+
+        return sorted(_names | cls.__find_redis(tag=tag, known=_names))
+
+
+    #
+    # get_by_tag
+    #
+    @classmethod
+    def get_by_tag(cls, tag=None, default=None):
+        '''
+        Get the items with a tag
+
+        Redis items tagged by other processes (and not registered in this one) are
+        returned as stored in redis
+
+        Parameters:
+            tag: The tag
+            default: The default value to use for items that don't exist
+
+        Return Value:
+            dict: The values, indexed by name
+        '''
+        assert tag
+
+        _names = cls.find(tag=tag)
+        _registered = [ _name for _name in _names if _name in cls.__conf_meta ]
+        _unregistered = [ _name for _name in _names if _name not in cls.__conf_meta ]
+
+        _values = cls.get_many(names=_registered, default=default)
+        if _unregistered:
+            for _name, _value in cls._get_redis_many(names=_unregistered).items():
+                _values[_name] = default if _value is None else _value
+
+        return _values
+
+
+    #
+    # delete_by_tag
+    #
+    @classmethod
+    def delete_by_tag(cls, tag=None):
+        '''
+        Delete the items with a tag (including redis items tagged by other processes)
+
+        Parameters:
+            tag: The tag
+
+        Return Value:
+            int: The number of items deleted
+        '''
+        assert tag
+
+        _names = cls.find(tag=tag)
+
+        for _name in _names:
+            if _name not in cls.__conf_meta: continue
+
+            try:
+                cls.delete(name=_name)
+            except KeyError:
+                # Already expired in redis
+                pass
+
+        # Redis items only registered in other processes
+        _unregistered = [ _name for _name in _names if _name not in cls.__conf_meta ]
+        if cls.__redis:
+            _pipeline = cls.__redis.pipeline(transaction=False)
+            for _name in _unregistered: _pipeline.delete(_name)
+            _pipeline.delete(f"{TAG_KEY_PREFIX}{tag}")
+            cls.__call_redis(func=_pipeline.execute, deadline_ms=0)
+
+        cls.__invalidate_many(names=_unregistered)
+
+        return len(_names)
+
+
+    #
+    # __set_registration
+    #
+    @classmethod
+    def __set_registration(cls, name=None, conf_meta=None):
+        '''
+        Set the registration of an item (and update the tag index).  Must be called
+        with the lock held
+
+        Parameters:
+            name: Name of the config item
+            conf_meta: The new registration (ConfigMetaClass)
+
+        Return Value:
+            ConfigMetaClass: The previous registration (None if not registered)
+        '''
+        assert name
+        assert conf_meta
+
+        # The stored value is decoded with the new registration from now on (a change to
+        # the local store, so open snapshots keep the old one)
+        if name in cls.__conf:
+            cls.__generation += 1
+            if cls.__snapshots: cls.__record_history(name=name)
+
+        _old_meta = cls.__drop_registration(name=name)
+
+        cls.__conf_meta[name] = conf_meta
+        for _tag in conf_meta.tags:
+            cls.__tags.setdefault(_tag, set()).add(name)
+
+        return _old_meta
+
+
+    #
+    # __drop_registration
+    #
+    @classmethod
+    def __drop_registration(cls, name=None):
+        '''
+        Remove the registration of an item (and remove it from the tag index).  Must
+        be called with the lock held
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            ConfigMetaClass: The registration removed (None if not registered)
+        '''
+        assert name
+
+        _old_meta = cls.__conf_meta.pop(name, None)
+        if not _old_meta: return None
+
+        if _old_meta.backing_store == "redis": cls.__shadow_update(items=[ ( name, _MISSING ) ])
+
+        # A computed item is computed again when next wanted, and an error re-encrypting
+        # the old value no longer applies
+        cls.__refresh_at.pop(name, None)
+        cls.__compute_errors.pop(name, None)
+        cls.__rekey_errors.pop(name, None)
+
+        for _tag in _old_meta.tags:
+            _names = cls.__tags.get(_tag, None)
+            if _names is None: continue
+
+            _names.discard(name)
+            if not _names: del cls.__tags[_tag]
+
+        return _old_meta
+
+
+    #
+    # __set_redis_tags
+    #
+    @classmethod
+    def __set_redis_tags(cls, names=None, old_tags=frozenset(), tags=frozenset()):
+        '''
+        Update the redis sets of the names of the items with each tag
+
+        Parameters:
+            names: A list of config item names
+            old_tags: Tags the items had
+            tags: Tags the items have now
+
+        Return Value:
+            None
+        '''
+        assert names is not None
+        if not cls.__redis: return
+
+        _pipeline = cls.__redis.pipeline(transaction=False)
+        for _tag in old_tags - tags:
+            _pipeline.srem(f"{TAG_KEY_PREFIX}{_tag}", *names)
+
+        for _tag in tags:
+            _pipeline.sadd(f"{TAG_KEY_PREFIX}{_tag}", *names)
+
+        cls.__call_redis(func=_pipeline.execute, deadline_ms=0)
+
+
+    #
+    # __find_redis
+    #
+    @classmethod
+    def __find_redis(cls, tag=None, known=None):
+        '''
+        Find redis items with a tag that aren't registered with it in this process.
+        Names of items that no longer exist are removed from the tag's set
+
+        Parameters:
+            tag: The tag
+            known: A set of names already found (not checked)
+
+        Return Value:
+            set: The names of the items found
+        '''
+        assert tag
+        if not cls.__redis: return set()
+
+        _key = f"{TAG_KEY_PREFIX}{tag}"
+        _names = [ _name for _name in cls.__call_redis(
+                func=lambda: cls.__redis_read.smembers(_key)) if _name not in known ]
+        if not _names: return set()
+
+        # Items may have expired (or been deleted by another process)
+        _pipeline = cls.__redis_read.pipeline(transaction=False)
+        for _name in _names: _pipeline.exists(_name)
+        _exists = cls.__call_redis(func=_pipeline.execute)
+
+        _missing = [ _name for _name, _found in zip(_names, _exists) if not _found ]
+        if _missing: cls.__call_redis(func=lambda: cls.__redis.srem(_key, *_missing),
+                deadline_ms=0)
+
+        return { _name for _name, _found in zip(_names, _exists) if _found }
+
+
+    ###########################################################################
+    #
+    # Transactions
+    #
+    ###########################################################################
+    #
+    # transaction
+    #
+    @classmethod
+    def transaction(cls):
+        '''
+        Stage changes to a number of items and apply them together.  Each change is
+        checked when it is staged (and again before any are applied).  Local items are
+        changed under a single lock acquisition (in one generation), and redis items in
+        a single MULTI/EXEC.
+
+        Use as a context manager (the changes are discarded if an exception is raised):
+            with Config.transaction() as txn:
+                txn.set(name="...", value="...")
+                txn.delete(name="...")
+
+        Parameters:
+            None
+
+        Return Value:
+            ConfigTransactionClass: The transaction
+        '''
+        return ConfigTransactionClass(config=cls)
+
+
+    #
+    # _check_change
+    #
+    @classmethod
+    def _check_change(cls, name=None, value=None, conf_meta=None):
+        '''
+        Check a change can be made to an item
+
+        Parameters:
+            name: Name of the config item
+            value: The new value (_MISSING to delete the item)
+            conf_meta: The registration the change is made with, if the item is being
+                registered again (None = its current registration)
+
+        Return Value:
+            None
+        '''
+        assert name
+
+        # Maintenance is left to the caller (to check many items quickly)
+        _current_meta = cls.__conf_meta.get(name, None)
+
+        # Is this a constant?
+        if _current_meta and _current_meta.constant:
+            raise TypeError(f"'{name}' is defined as a constant")
+
+        _conf_meta = conf_meta or _current_meta
+        if not _conf_meta: return
+
+        if _conf_meta.binary and value is not _MISSING: cls.__check_binary(values=[ value ])
+
+        if _conf_meta.backing_store in ( "redis", "sqlite" ):
+            if _conf_meta.backing_store == "redis" and not cls.__redis:
+                raise RuntimeError("Redis connection has not been configured")
+
+            if _conf_meta.backing_store == "sqlite" and not cls.__sqlite:
+                raise RuntimeError("SQLite database has not been configured")
+
+            # Encrypted values are converted to strings
+            if value is not _MISSING and not _conf_meta.encrypt and not _conf_meta.binary \
+                    and not isinstance(value, str):
+                raise TypeError(f"Variable type not supported: {type(value)}")
+
+
+    #
+    # _commit_changes
+    #
+    @classmethod
+    def _commit_changes(cls, changes=None, registrations=None):
+        '''
+        Apply a number of changes together
+
+        Parameters:
+            changes: A dict of name -> value (_MISSING to delete the item)
+            registrations: A dict of name -> ConfigMetaClass, for items in 'changes'
+                that are registered (again) along with the changes.  The registrations
+                are put in place with the local items, under the same lock acquisition
+
+        Return Value:
+            None
+        '''
+        assert changes is not None
+        if not changes: return
+        if registrations is None: registrations = {}
+
+        # Run the item maintenance
+        cls.__item_maintenance()
+
+        # Check everything before changing anything (registrations may have changed
+        # since the changes were staged)
+        _local = []
+        _redis = []
+        _sqlite = []
+        _encrypt = []
+        _retag = []
+        _unregistered = ConfigMetaClass()
+        for _name, _value in changes.items():
+            _conf_meta = registrations.get(_name, None)
+            cls._check_change(name=_name, value=_value, conf_meta=_conf_meta)
+
+            if _conf_meta:
+                # The redis tag sets follow the new registration (as with 'register')
+                _old_meta = cls.__conf_meta.get(_name, None)
+                _old_tags = _old_meta.tags if _old_meta and _old_meta.backing_store == "redis" \
+                        else frozenset()
+                _tags = _conf_meta.tags if _conf_meta.backing_store == "redis" else frozenset()
+                if _old_tags or _tags: _retag.append(( _name, _old_tags, _tags ))
+
+            _conf_meta = _conf_meta or cls.__conf_meta.get(_name, None) or _unregistered
+            if _conf_meta.backing_store == "redis":
+                _redis.append(( _name, _value, _conf_meta ))
+            elif _conf_meta.backing_store == "sqlite":
+                _sqlite.append(( _name, _value, _conf_meta ))
+            else:
+                _local.append(( _name, _value, _conf_meta ))
+
+            if _value is not _MISSING and ( _conf_meta.encrypt or _conf_meta.compress ):
+                _encrypt.append(( _name, _conf_meta ))
+
+        # Compress/encrypt the values outside of the lock
+        if _encrypt:
+            def _encrypt_change(value):
+                _name, _conf_meta = value
+                return cls.__encode_value(value=changes[_name], encrypt=_conf_meta.encrypt,
+                        compress=_conf_meta.compress, binary=_conf_meta.backing_store == "local")
+
+            _encrypted = dict(zip([ _name for _name, _ in _encrypt ],
+                    cls.__crypt_many(func=_encrypt_change, values=_encrypt)))
+            _local = [ ( _name, _encrypted.get(_name, _value), _meta )
+                    for _name, _value, _meta in _local ]
+            _redis = [ ( _name, _encrypted.get(_name, _value), _meta )
+                    for _name, _value, _meta in _redis ]
+            _sqlite = [ ( _name, _encrypted.get(_name, _value), _meta )
+                    for _name, _value, _meta in _sqlite ]
+
+            # Binary items that aren't encrypted are stored as bytes
+            for _name, _value, _conf_meta in _redis + _sqlite:
+                if _value is _MISSING or isinstance(_value, str): continue
+                if _conf_meta.binary and cls.__is_binary(value=_value): continue
+
+                raise TypeError(f"Variable type not supported: {type(_value)}")
+
+        # Local items are sized before anything is written (an item may be too large)
+        _values = [ ( _name, _value if _value is _MISSING or _conf_meta.by_reference
+                else copy.deepcopy(_value), _conf_meta ) for _name, _value, _conf_meta in _local ]
+
+        if cls.__mem_track:
+            _sizes = [ ( _name, None if _value is _MISSING else
+                    cls.__check_size(name=_name, value=_value) ) for _name, _value, _ in _values ]
+
+        # Redis items first (in a MULTI/EXEC), so a failure leaves the local store unchanged
+        if _redis:
+            _names = [ _name for _name, _, _ in _redis ]
+            if cls.__redis_cluster and len(cls._group_by_slot(names=_names)) > 1:
+                raise ValueError("Redis items in a transaction must be in the same hash slot")
+
+            # Buffered writes would overwrite the values once sent
+            for _name, _, _ in _redis: cls.__wb_discard(name=_name)
+
+            # Deleted items are removed from the tag sets in the same MULTI (except
+            # with a cluster, where the tag sets are in other hash slots)
+            _untag = []
+            _pipeline = cls.__redis.pipeline(transaction=True)
+            for _name, _value, _conf_meta in _redis:
+                if _value is _MISSING:
+                    _pipeline.delete(_name)
+                    if cls.__redis_cluster:
+                        if _conf_meta.tags: _untag.append(( _name, _conf_meta.tags ))
+                    else:
+                        for _tag in _conf_meta.tags:
+                            _pipeline.srem(f"{TAG_KEY_PREFIX}{_tag}", _name)
+
+                    continue
+
+                if cls.__is_binary(value=_value): _value = cls.__to_buffer(value=_value)
+                _pipeline.set(_name, _value, px=cls.__redis_px(timeout=_conf_meta.timeout))
+
+            cls.__call_redis(func=_pipeline.execute, deadline_ms=0)
+            cls.__shadow_update(items=[ ( _name, _value ) for _name, _value, _ in _redis ])
+
+            for _name, _tags in _untag:
+                cls.__set_redis_tags(names=[ _name ], old_tags=_tags)
+
+        # SQLite items in a single database transaction
+        if _sqlite:
+            cls.__sqlite.commit(
+                items=[ ( _name, cls.__to_bytes(value=_value) ) for _name, _value, _ in _sqlite
+                        if _value is not _MISSING ],
+                deletes=[ _name for _name, _value, _ in _sqlite if _value is _MISSING ],
+                timeouts={ _name: _conf_meta.timeout for _name, _, _conf_meta in _sqlite })
+
+        # Local items (and the registrations) under a single lock acquisition
+        cls.__lock.acquire()
+        try:
+            for _name, _conf_meta in registrations.items():
+                cls.__set_registration(name=_name, conf_meta=_conf_meta)
+
+            if _values: cls.__generation += 1
+
+            for _name, _value, _conf_meta in _values:
+                if _value is _MISSING and _name not in cls.__conf: continue
+
+                if cls.__snapshots: cls.__record_history(name=_name)
+
+                if _value is _MISSING:
+                    del cls.__conf[_name]
+                else:
+                    cls.__conf[_name] = _value
+
+            # Deleted items lose their registration (as with 'delete'), and items with a
+            # timeout are set to expire
+            for _name, _value, _conf_meta in _local + _redis + _sqlite:
+                if _value is _MISSING:
+                    cls.__drop_registration(name=_name)
+                    cls.__expiry_deadlines.pop(_name, None)
+                else:
+                    cls.__schedule_expiry(name=_name, backing_store=_conf_meta.backing_store,
+                            deadline=cls.__deadline(timeout=_conf_meta.timeout))
+
+            _evicted = cls.__mem_update(sizes=_sizes) if cls.__mem_track and _values else []
+
+        finally:
+            cls.__lock.release()
+
+        for _name, _old_tags, _tags in _retag:
+            cls.__set_redis_tags(names=[ _name ], old_tags=_old_tags, tags=_tags)
+
+        cls.__invalidate_many(names=list(changes.keys()) + _evicted)
+
+
+    ###########################################################################
+    #
+    # Computed items
+    #
+    ###########################################################################
+    #
+    # get_or_compute
+    #
+    @classmethod
+    def get_or_compute(cls, name=None, func=None, timeout=0, stale=0, encrypt=False,
+                       backing_store="local"):
+        '''
+        Get a config item, or compute (and register) it if it doesn't exist.  Only one
+        thread computes an item at a time - others wanting it wait for the result.
+
+        With 'stale', the item is kept for 'stale' seconds after 'timeout'.  In that
+        time the old value is returned while a background thread computes a new one.
+        If that fails, the old value is still returned (and the error is kept - see
+        'compute_error'), and the next call tries again.
+
+        Unlike 'get', values that are False, 0, "" etc are returned as is.
+
+        Parameters:
+            name: Name of the config item
+            func: Function (taking no arguments) to compute the value
+            timeout: Number of seconds before the value must be computed again
+                (0 = never)
+            stale: Number of seconds after 'timeout' the old value can still be returned
+            encrypt: If true, the item is encrypted (or the name of a cipher - see 'register')
+            backing_store: Where the item is stored (local, redis or sqlite)
+
+        Return Value:
+            The config item value
+        '''
+        assert name
+        assert callable(func)
+        if stale and not timeout: raise ValueError("'stale' requires a 'timeout'")
+
+        while True:
+            # Run the item maintenance
+            cls.__item_maintenance()
+
+            _value = cls.__lookup(name=name)
+            if _value is not _MISSING:
+                # Past its timeout (but still within 'stale') - refresh in the background
+                _refresh_at = cls.__refresh_at.get(name, 0)
+                if _refresh_at and time.monotonic() >= _refresh_at:
+                    cls.__compute(name=name, func=func, timeout=timeout, stale=stale,
+                            encrypt=encrypt, backing_store=backing_store, background=True)
+
+                return _value
+
+            _value = cls.__compute(name=name, func=func, timeout=timeout, stale=stale,
+                    encrypt=encrypt, backing_store=backing_store)
+            if _value is not _MISSING: return _value
+
+            # Another thread computed the value - get it (or compute it if that failed)
+
+
+    #
+    # memoize
+    #
+    @classmethod
+    def memoize(cls, timeout=0, stale=0, encrypt=False, backing_store="local"):
+        '''
+        Decorator to keep the results of a function as config items (see
+        'get_or_compute').  Results are kept for each set of arguments, identified by
+        their repr (so the arguments should have a stable repr).
+
+            @Config.memoize(timeout=60)
+            def lookup(key): ...
+
+        Parameters:
+            timeout: Number of seconds before a result must be computed again (0 = never)
+            stale: Number of seconds after 'timeout' the old result can still be returned
+            encrypt: If true, the results are encrypted (or the name of a cipher - see 'register')
+            backing_store: Where the results are stored (local, redis or sqlite)
+
+        Return Value:
+            function: The decorator
+        '''
+        def _decorator(func):
+            _prefix = f"memoize.{func.__module__}.{func.__qualname__}"
+
+            @functools.wraps(func)
+            def _wrapper(*args, **kwargs):
+                _key = hashlib.sha256(repr(( args, sorted(kwargs.items()) )).encode()).hexdigest()
+
+                return cls.get_or_compute(name=f"{_prefix}:{_key}",
+                        func=lambda: func(*args, **kwargs), timeout=timeout, stale=stale,
+                        encrypt=encrypt, backing_store=backing_store)
+
+            return _wrapper
+
+        return _decorator
+
+
+    #
+    # compute_error
+    #
+    @classmethod
+    def compute_error(cls, name=None):
+        '''
+        Get the error from the last background refresh of an item (see 'get_or_compute')
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Exception: The error raised computing the value (None if the last refresh
+                worked)
+        '''
+        assert name
+
+        return cls.__compute_errors.get(name, None)
+
+
+    #
+    # __lookup
+    #
+    @classmethod
+    def __lookup(cls, name=None):
+        '''
+        Get a config item, without replacing False, 0, "" etc with a default
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            The config item value, or _MISSING if the item doesn't exist
+        '''
+        assert name
+
+        _conf_meta = cls.__conf_meta.get(name, None)
+        if _conf_meta and _conf_meta.backing_store == "redis":
+            _value = cls.__get_redis_value(name=name)
+            if _value is None: return _MISSING
+
+        elif _conf_meta and _conf_meta.backing_store == "sqlite":
+            _value = cls._get_sqlite(name=name)
+            if _value is None: return _MISSING
+
+        elif name in cls.__conf:
+            _value = cls._get_local(name=name,
+                    by_reference=_conf_meta.by_reference if _conf_meta else True)
+
+        else:
+            return _MISSING
+
+        _value = cls.__decode_value(value=_value, conf_meta=_conf_meta, name=name)
 
         return _value
 
 
     #
-    # _delete_local
+    # __compute
     #
     @classmethod
-    def _delete_local(cls, name=None):
+    def __compute(cls, name=None, func=None, timeout=0, stale=0, encrypt=False,
+                  backing_store="local", background=False):
         '''
-        Delete a value from redis
+        Compute and register an item, unless another thread is already computing it
 
         Parameters:
             name: Name of the config item
+            func: Function (taking no arguments) to compute the value
+            timeout: Number of seconds before the value must be computed again
+            stale: Number of seconds after 'timeout' the old value can still be returned
+            encrypt: If true, the item is encrypted (or the name of a cipher - see 'register')
+            backing_store: Where the item is stored (local, redis or sqlite)
+            background: If True, compute the value in a new thread and return
 
         Return Value:
-            Boolean: True is successful, False Otherwise (exception will be raised)
+            The value computed, or _MISSING if another thread computed it (or it is
+            being computed in the background)
         '''
         assert name
 
-        # Delete the item
-        if cls._has_item_local(name=name):
-            cls.__lock.acquire()
-            del cls.__conf[name]
-            cls.__lock.release()
+        cls.__lock_compute.acquire()
+        _event = cls.__computing.get(name, None)
+        if not _event: cls.__computing[name] = Event()
+        cls.__lock_compute.release()
 
-        return True
+        if _event:
+            # Someone else is computing it
+            if not background: _event.wait()
+            return _MISSING
+
+        def _compute():
+            try:
+                _value = func()
+                cls.register(name=name, value=_value, overwrite=True, timeout=timeout + stale,
+                        encrypt=encrypt, backing_store=backing_store)
+
+                if stale:
+                    cls.__refresh_at[name] = time.monotonic() + timeout
+                else:
+                    cls.__refresh_at.pop(name, None)
+
+                cls.__compute_errors.pop(name, None)
+                return _value
 
+            except Exception as err:
+                if not background: raise
 
+                # The old value is still returned, and the refresh is tried again on
+                # the next call (as the refresh time has passed)
+                cls.__compute_errors[name] = err
+                return _MISSING
+
+            finally:
+                cls.__lock_compute.acquire()
+                cls.__computing.pop(name).set()
+                cls.__lock_compute.release()
+
+        if background:
+            Thread(target=_compute, daemon=True).start()
+            return _MISSING
+
+        return _compute()
+
+
+    ###########################################################################
     #
-    # _has_item_local
+    # Snapshots
+    #
+    ###########################################################################
+    #
+    # generation
     #
     @classmethod
-    def _has_item_local(cls, name=None):
+    def generation(cls):
         '''
-        Get a value in redis
+        Get the generation of the local store (incremented on each change)
+
+        Parameters:
+            None
+
+        Return Value:
+            int: The current generation
+        '''
+        return cls.__generation
+
+
+    #
+    # snapshot
+    #
+    @classmethod
+    def snapshot(cls):
+        '''
+        Get a consistent, read only view of the local store as it is now.  Writers are
+        not blocked - the values they replace are kept until the snapshot is closed.
+
+        Values stored by reference are not copied, so changing them in place is seen
+        by the snapshot.  Items in redis are not part of the snapshot.
+
+        Use as a context manager:
+            with Config.snapshot() as snap:
+                snap.get(name="...")
+
+        Parameters:
+            None
+
+        Return Value:
+            ConfigSnapshotClass: The snapshot
+        '''
+        cls.__lock.acquire()
+        _generation = cls.__generation
+        cls.__snapshots[_generation] = cls.__snapshots.get(_generation, 0) + 1
+        cls.__lock.release()
+
+        return ConfigSnapshotClass(config=cls, generation=_generation)
+
+
+    #
+    # _get_snapshot
+    #
+    @classmethod
+    def _get_snapshot(cls, name=None, generation=0):
+        '''
+        Get the value of a local item as it was at a generation
 
         Parameters:
             name: Name of the config item
+            generation: The generation of the snapshot
 
         Return Value:
-            Boolean: True is item exists, False Otherwise
+            value: The config item value, or _MISSING if it didn't exist
         '''
         assert name
 
-        if name in cls.__conf:
-            return True
-        
-        return False
+        cls.__lock.acquire()
+
+        # The first change after the snapshot holds the value (and the registration it
+        # was stored with) at the snapshot
+        for _generation, _old_value, _old_meta in cls.__history.get(name, []):
+            if _generation > generation:
+                _value, _conf_meta = _old_value, _old_meta
+                break
+        else:
+            _value, _conf_meta = cls.__conf.get(name, _MISSING), cls.__conf_meta.get(name, None)
+
+        cls.__lock.release()
+
+        if _value is _MISSING: return _MISSING
+
+        _value = cls.__decode_value(value=_value, conf_meta=_conf_meta)
+        if _conf_meta and not _conf_meta.by_reference: _value = copy.deepcopy(_value)
+
+        return _value
+
+
+    #
+    # _release_snapshot
+    #
+    @classmethod
+    def _release_snapshot(cls, generation=0):
+        '''
+        Close a snapshot, and drop any history no longer needed
+
+        Parameters:
+            generation: The generation of the snapshot
+
+        Return Value:
+            None
+        '''
+        cls.__lock.acquire()
+
+        if cls.__snapshots.get(generation, 0) > 1:
+            cls.__snapshots[generation] -= 1
+        else:
+            cls.__snapshots.pop(generation, None)
+
+        if not cls.__snapshots:
+            cls.__history = {}
+
+        else:
+            # Only changes after the oldest open snapshot are still needed
+            _oldest = min(cls.__snapshots.keys())
+            for _name in list(cls.__history.keys()):
+                _history = [ _entry for _entry in cls.__history[_name] if _entry[0] > _oldest ]
+                if _history:
+                    cls.__history[_name] = _history
+                else:
+                    del cls.__history[_name]
+
+        cls.__lock.release()
 
 
     ###########################################################################
     #
-    # Access methods for Redis
+    # Layered lookup
     #
     ###########################################################################
     #
-    # _set_redis
+    # configure_layers
     #
     @classmethod
-    def _set_redis(cls, name=None, value=None, timeout=0):
+    def configure_layers(cls, layers=None, env_prefix=None):
         '''
-        Set a value in redis
+        Configure the sources used by 'resolve'
+
+        Parameters:
+            layers: The sources to look in, highest precedence first.  Any of
+                "override", "redis", "sqlite", "env", "local" and "default" (None = no
+                change)
+            env_prefix: Prefix for environment variable names (None = no change)
+
+        Return Value:
+            None
+        '''
+        if layers is not None:
+            for _layer in layers:
+                if _layer not in LAYERS:
+                    raise ValueError(f"'layers' must only contain values from {LAYERS}")
+
+            cls.__layers = tuple(layers)
+
+        if env_prefix is not None:
+            cls.__env_prefix = env_prefix
+
+        cls.__invalidate_all()
+
+
+    #
+    # set_override
+    #
+    @classmethod
+    def set_override(cls, name=None, value=None):
+        '''
+        Set an in-memory override for a config item (used by 'resolve')
 
         Parameters:
             name: Name of the config item
-            value: The config item value
-            timeout: Number of seconds before the item should be deleted (0 = never)
+            value: The value
 
         Return Value:
-            Boolean: True is successful, False Otherwise (exception will be raised)
+            None
         '''
         assert name
-        assert timeout >= 0
-        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
 
-        # Check the type of the value
-        if isinstance(value, str):
-            # String
-            cls.__redis.set(name, value)
+        cls.__overrides[name] = value
+        cls.__invalidate(name=name)
+
+
+    #
+    # delete_override
+    #
+    @classmethod
+    def delete_override(cls, name=None):
+        '''
+        Delete the in-memory override for a config item
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            None
+        '''
+        assert name
+
+        cls.__overrides.pop(name, None)
+        cls.__invalidate(name=name)
+
+
+    #
+    # set_default
+    #
+    @classmethod
+    def set_default(cls, name=None, value=None):
+        '''
+        Set the default value for a config item (used by 'resolve')
+
+        Parameters:
+            name: Name of the config item
+            value: The default value
+
+        Return Value:
+            None
+        '''
+        assert name
+
+        cls.__defaults[name] = value
+        cls.__invalidate(name=name)
+
+
+    #
+    # delete_default
+    #
+    @classmethod
+    def delete_default(cls, name=None):
+        '''
+        Delete the default value for a config item
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            None
+        '''
+        assert name
+
+        cls.__defaults.pop(name, None)
+        cls.__invalidate(name=name)
+
+
+    #
+    # env_name
+    #
+    @classmethod
+    def env_name(cls, name=None):
+        '''
+        The environment variable used for a config item by 'resolve'
+        (eg 'service.db.host' -> '<env_prefix>SERVICE_DB_HOST')
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            string: The name of the environment variable
+        '''
+        assert name
+
+        return cls.__env_prefix + name.upper().replace(".", "_").replace("-", "_")
+
+
+    #
+    # resolve
+    #
+    @classmethod
+    def resolve(cls, name=None, default=None):
+        '''
+        Look up a config item in each of the configured sources (see configure_layers)
+        and return the value from the first one it is found in.
+
+        The result is cached until the item changes in any of the sources, so repeated
+        lookups cost a single dict lookup.  Values are shared between callers and
+        should not be modified.  Changes made to redis or sqlite by other processes, or to
+        environment variables other than with 'setenv', are not seen until the item is
+        changed locally (or 'refresh' is called).
+
+        Parameters:
+            name: Name of the config item
+            default: The value to use if the item isn't found in any source
+
+        Return Value:
+            The config item value
+        '''
+        assert name
+
+        # Expired items need to be removed before using the cache
+        if cls.__conf_expiry: cls.__item_maintenance()
+
+        _value = cls.__resolved.get(name, _MISSING)
+        if _value is _MISSING:
+            _version = cls.__resolve_version
+            _value = cls.__resolve_layers(name=name)
+
+            # Don't cache the value if anything changed while it was being looked up
+            cls.__lock_resolve.acquire()
+            if cls.__resolve_version == _version: cls.__resolved[name] = _value
+            cls.__lock_resolve.release()
+
+        if _value is _NOT_FOUND: return default
+        return _value
+
+
+    #
+    # refresh
+    #
+    @classmethod
+    def refresh(cls, name=None):
+        '''
+        Clear the cached result of 'resolve' for a config item (or all items)
+
+        Parameters:
+            name: Name of the config item (None = all items)
+
+        Return Value:
+            None
+        '''
+        if name:
+            cls.__invalidate(name=name)
+        else:
+            cls.__invalidate_all()
+
+
+    #
+    # __resolve_layers
+    #
+    @classmethod
+    def __resolve_layers(cls, name=None):
+        '''
+        Look up a config item in each of the configured sources
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            The config item value (_NOT_FOUND if not found)
+        '''
+        _conf_meta = cls.__conf_meta.get(name, None)
+        _backing_store = _conf_meta.backing_store if _conf_meta else "local"
+
+        for _layer in cls.__layers:
+            if _layer == "override":
+                if name in cls.__overrides: return cls.__overrides[name]
+
+            elif _layer == "default":
+                if name in cls.__defaults: return cls.__defaults[name]
+
+            elif _layer == "env":
+                _env_name = cls.env_name(name=name)
+
+                # Remember the variable, so changes to it can clear the cached value
+                cls.__lock_resolve.acquire()
+                cls.__resolved_env.setdefault(_env_name, set()).add(name)
+                cls.__lock_resolve.release()
+
+                if _env_name in os.environ: return os.environ[_env_name]
+
+            elif _layer == "redis":
+                if _backing_store != "redis" or not cls.__redis: continue
+
+                _value = cls.__get_redis_value(name=name)
+                if _value is None: continue
+
+                return cls.__decode_value(value=_value, conf_meta=_conf_meta, name=name)
+
+            elif _layer == "sqlite":
+                if _backing_store != "sqlite" or not cls.__sqlite: continue
+
+                _value = cls._get_sqlite(name=name)
+                if _value is None: continue
+
+                return cls.__decode_value(value=_value, conf_meta=_conf_meta, name=name)
+
+            elif _layer == "local":
+                if _backing_store != "local" or not cls._has_item_local(name=name): continue
 
-        else:
-            raise TypeError(f"Variable type not supported: {type(value)}")
+                _value = cls._get_local(name=name,
+                        by_reference=_conf_meta.by_reference if _conf_meta else True)
 
-        # Set the expire value
-        if timeout: 
-            # Set variable expiry in Redis (Add 1 second to make sure Metadata expires first)
-            cls.__redis.expire(name, timeout + 1)
+                return cls.__decode_value(value=_value, conf_meta=_conf_meta, name=name)
 
-            # Set metadata to xpire
-            cls.__lock.acquire()
-            _timestamp = cls.__timestamp(offset=timeout)
-            cls.__conf_expiry[_timestamp] = ConfigExpiryClass(name=name,
-                    backing_store="redis")
-            cls.__lock.release()
+        return _NOT_FOUND
 
 
     #
-    # _get_redis
+    # __invalidate
     #
     @classmethod
-    def _get_redis(cls, name=None):
+    def __invalidate(cls, name=None):
         '''
-        Get a value from redis
+        Clear the cached result of 'resolve' for a config item
 
         Parameters:
             name: Name of the config item
 
         Return Value:
-            value: The config item value (exception will be raised on error), None if not found
+            None
         '''
-        assert name
-        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
-
-        _value = None
-
-        # Check if the value exists
-        if cls._has_item_redis(name=name):
-            # Check the type of the value
-            _value_type = cls.__redis.type(name)
-            if _value_type == "string":
-                # String
-                _value = cls.__redis.get(name)
-
-            else:
-                raise TypeError(f"Redis variable type not supported: {_value_type}")
-
-        return _value
+        cls.__lock_resolve.acquire()
+        cls.__resolve_version += 1
+        cls.__resolved.pop(name, None)
+        cls.__lock_resolve.release()
 
 
     #
-    # _delete_redis
+    # __invalidate_many
     #
     @classmethod
-    def _delete_redis(cls, name=None):
+    def __invalidate_many(cls, names=None):
         '''
-        Delete a value from redis
+        Clear the cached result of 'resolve' for a number of config items
 
         Parameters:
-            name: Name of the config item
+            names: A list of config item names
 
         Return Value:
-            Boolean: True is successful, False Otherwise (exception will be raised)
+            None
         '''
-        assert name
-        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
-
-        if not cls._has_item_redis(name=name):
-            raise KeyError(f"'{name}' item does not exist in Redis")
-        
-        # 'delete' should raise an exception if there is a problem
-        cls.__redis.delete(name)
-        return True
+        cls.__lock_resolve.acquire()
+        cls.__resolve_version += 1
+        if cls.__resolved:
+            for _name in names:
+                cls.__resolved.pop(_name, None)
 
+        cls.__lock_resolve.release()
 
 
     #
-    # _has_item_redis
+    # __invalidate_all
     #
     @classmethod
-    def _has_item_redis(cls, name=None):
+    def __invalidate_all(cls):
         '''
-        Get a value in redis
+        Clear all cached results of 'resolve'
 
         Parameters:
-            name: Name of the config item
+            None
 
         Return Value:
-            Boolean: True is item exists, False Otherwise
+            None
         '''
-        assert name
-        if not cls.__redis: raise RuntimeError("Redis connection has not been configured")
-
-        # 'exists' returns a number and our return is boolen, so be explicit
-        if cls.__redis.exists(name):
-            return True
-        else:
-            return False
+        cls.__lock_resolve.acquire()
+        cls.__resolve_version += 1
+        cls.__resolved.clear()
+        cls.__resolved_env.clear()
+        cls.__lock_resolve.release()
 
 
     ###########################################################################
     #
-    # Access methods for config data
+    # Access methods for Environment Variables
     #
     ###########################################################################
     #
-    # register
+    # getenv
     #
     @classmethod
-    def register(cls, name=None, value=None, by_reference=True, overwrite=False,
-                 constant=False, timeout=0, encrypt=False, backing_store="local"):
+    def getenv(cls, name=None, default=None, type=None):
         '''
-        Register complex data types to identify how to handle them
+        Get an environment variable
+
+        Parsed values are cached until the variable is changed, so repeated calls
+        don't parse the value again.  Parsed JSON values are shared between callers
+        and should not be modified.
 
         Parameters:
-            name: Name of the config item
-            value: The config item value
-            by_reference: Store a reference to the object or a deep copy
-                When backing store is redis, this is ignored (always a copy)
-            overwrite: Allow overwrite of existing config item if it exists
-            constant: Can the value be overwritten at any time?
-            timeout: Number of seconds before the item is deleted
-            encrypt: If true, the item is encrypted on set, and decrypted on get
-            backing_store: Allow the data to be store in an alternate backing store
-                Valid Values: local, redis
+            name: Name of the environment variable
+            default: The default value to use if the item doesn't exist
+            type: Parse the value as this type - str, int, float, bool or "json"
+                (None = return the string)
 
         Return Value:
-            Boolean: True is successful, False Otherwise (exception will be raised)
+            The environment variable value or None
         '''
         assert name
 
-        # Run the item maintenance
-        cls.__item_maintenance()
-
-        _valid_backing_stores = ( "local", "redis" )
-        if backing_store not in _valid_backing_stores:
-            raise ValueError(f"'backing_store' must be one of {_valid_backing_stores}")
-
-        if name in cls.__conf_meta:
-            if cls.__conf_meta[name].constant:
-                raise TypeError(f"'{name}' is defined as a constant")
+        _raw_value = os.environ.get(name, None)
+        if _raw_value is None: return default
+        if type is None or type is str: return _raw_value
 
-        if name in cls.__conf and not overwrite:
-            raise KeyError(f"'{name}' already exists")
+        # Use the cached value if the variable hasn't changed since it was parsed
+        _cached = cls.__env_cache.get(name, {}).get(type, None)
+        if _cached and _cached[0] == _raw_value: return _cached[1]
 
-        # Variable cannot be stored by reference in Redis
-        if backing_store == "redis": by_reference = False
+        _value = cls.__parse_env(name=name, value=_raw_value, type=type)
 
-        # Update the meta info
-        cls.__lock.acquire()
-        cls.__conf_meta[name] = ConfigMetaClass(backing_store=backing_store,
-                by_reference=by_reference, constant=constant, encrypt=encrypt,
-                timeout=timeout)
-        cls.__lock.release()
+        cls.__lock_env.acquire()
+        cls.__env_cache.setdefault(name, {})[type] = (_raw_value, _value)
+        cls.__lock_env.release()
 
-        if encrypt:
-            # Make sure we are dealing with a string (try to convert to JSON)
-            _json_value = cls.to_json(data=value)
-            if _json_value:
-                value = cls.__encrypt(data=_json_value)
+        return _value
 
-        if backing_store == "redis":
-            # Store tha value in Redis
-            cls._set_redis(name=name, value=value, timeout=timeout)
-        
-        else:
-            # Store the value locally
-            cls._set_local(name=name, value=value, by_reference=by_reference, timeout=timeout)
 
-        return True
+    #
+    # get_env - alias for getenv
+    #
+    get_env = getenv
 
 
     #
-    # get_registration
+    # getenv_int
     #
     @classmethod
-    def get_registration(cls, name=None):
+    def getenv_int(cls, name=None, default=None):
         '''
-        Register complex data types to identify how to handle them
+        Get an environment variable as an integer
 
         Parameters:
-            name: Name of the config item
+            name: Name of the environment variable
+            default: The default value to use if the item doesn't exist
 
         Return Value:
-            ConfigMetaClass: The registration info for the variable (None if not registered)
+            int: The environment variable value or the default
         '''
-        assert name
-
-        # Run the item maintenance
-        cls.__item_maintenance()
-
-        if name in cls.__conf_meta:
-            return cls.__conf_meta[name]
-        else:
-            return None
+        return cls.getenv(name=name, default=default, type=int)
 
 
     #
-    # set
+    # getenv_float
     #
     @classmethod
-    def set(cls, name=None, value=None):
+    def getenv_float(cls, name=None, default=None):
         '''
-        Set a config item
-        Note - Complex data types are copied by reference
-        User the 'register' method to make a copy of objects
+        Get an environment variable as a float
 
         Parameters:
-            name: Name of the config item
-            value: The config item value
+            name: Name of the environment variable
+            default: The default value to use if the item doesn't exist
 
         Return Value:
-            None
+            float: The environment variable value or the default
         '''
-        assert name
-
-        # Run the item maintenance
-        cls.__item_maintenance()
-
-        _conf_meta = cls.get_registration(name=name)
-        if _conf_meta:
-            # Is this a constant?
-            if _conf_meta.constant: raise TypeError(f"'{name}' is defined as a constant")
-
-            _backing_store = _conf_meta.backing_store
-            _by_reference = _conf_meta.by_reference
-            _timeout = _conf_meta.timeout
-            _encrypt = _conf_meta.encrypt
-        else:
-            _backing_store = "local"
-            _by_reference = True
-            _timeout = 0
-            _encrypt = False
-
-        if _encrypt:
-            # Make sure we are dealing with a string (try to convert to JSON)
-            _json_value = cls.to_json(data=value)
-            if _json_value:
-                value = cls.__encrypt(data=_json_value)
-
-        if _backing_store == "redis":
-            # Value is stored in redis
-            cls._set_redis(name=name, value=value, timeout=_timeout)
-        
-        else:
-            # Value stored in the local store
-            cls._set_local(name=name, value=value, by_reference=_by_reference, timeout=_timeout)
+        return cls.getenv(name=name, default=default, type=float)
 
 
     #
-    # get
+    # getenv_bool
     #
     @classmethod
-    def get(cls, name=None, default=None):
+    def getenv_bool(cls, name=None, default=None):
         '''
-        Get a config item
+        Get an environment variable as a boolean
 
         Parameters:
-            name: Name of the config item
+            name: Name of the environment variable
             default: The default value to use if the item doesn't exist
 
         Return Value:
-            The config item value
+            bool: The environment variable value or the default
         '''
-        assert name
-
-        # Run the item maintenance
-        cls.__item_maintenance()
-
-        _conf_meta = cls.get_registration(name=name)
-        if _conf_meta:
-            _backing_store = _conf_meta.backing_store
-            _by_reference = _conf_meta.by_reference
-            _encrypt = _conf_meta.encrypt
-        else:
-            _backing_store = "local"
-            _by_reference = True
-            _encrypt = False
-
-        # Get the value
-        if _backing_store == "redis":
-            # Value is stored in redis
-            _value = cls._get_redis(name=name)
-
-        else:
-            # Value is stored locally
-            _value = cls._get_local(name=name, by_reference=_by_reference)
-
-        if _encrypt:
-            if _value:
-                _decryped_data = cls.__decrypt(data=_value)
-
-                # Try to convert the value from JSON (if data is a string it will be untouched)
-                _value = cls.from_json(data=_decryped_data)
-
-        # Return the default if value not found
-        if not _value: _value = default
-        return _value
+        return cls.getenv(name=name, default=default, type=bool)
 
 
     #
-    # delete
+    # getenv_json
     #
     @classmethod
-    def delete(cls, name=None):
+    def getenv_json(cls, name=None, default=None):
         '''
-        Delete an item
+        Get an environment variable containing JSON
 
         Parameters:
-            name: Name of the config item to be deleted
+            name: Name of the environment variable
+            default: The default value to use if the item doesn't exist
 
         Return Value:
-            None
+            obj: The python representation of the environment variable or the default
         '''
-        assert name
-
-        # Run the item maintenance
-        cls.__item_maintenance()
-
-        _conf_meta = cls.get_registration(name=name)
-        if _conf_meta:
-            _backing_store = _conf_meta.backing_store
-        else:
-            _backing_store = "local"
-
-        if _backing_store == "redis":
-            # Value is stored in redis
-            cls._delete_redis(name=name)
-
-        else:
-            cls._delete_local(name=name)
-
-        # Delete the item meta information if it exists
-        if name in cls.__conf_meta:
-            cls.__lock.acquire()
-            del cls.__conf_meta[name]
-            cls.__lock.release()
+        return cls.getenv(name=name, default=default, type="json")
 
 
     #
-    # has_item
+    # __parse_env
     #
-    @classmethod
-    def has_item(cls, name=None):
+    @staticmethod
+    def __parse_env(name="", value="", type=None):
         '''
-        Determine if an item exists
+        Parse an environment variable value
 
         Parameters:
-            name: Name of the config item
+            name: Name of the environment variable
+            value: The environment variable value
+            type: The type to parse the value as - str, int, float, bool or "json"
 
         Return Value:
-            Boolean: True if exists exists, False otherwise
+            The parsed value (ValueError is raised if it can't be parsed)
         '''
-        assert name
+        try:
+            if type is None or type is str:
+                return value
 
-        # Run the item maintenance
-        cls.__item_maintenance()
+            elif type is bool:
+                if value.strip().lower() in ENV_TRUE_VALUES: return True
+                if value.strip().lower() in ENV_FALSE_VALUES: return False
+                raise ValueError(value)
 
-        _conf_meta = cls.get_registration(name=name)
-        if _conf_meta:
-            _backing_store = _conf_meta.backing_store
-        else:
-            _backing_store = "local"
+            elif type is int or type is float:
+                return type(value)
 
-        if _backing_store == "redis":
-            # Value is stored in redis
-            return cls._has_item_redis(name=name)
-        
-        else:
-            # Value is stored locally
-            return cls._has_item_local(name=name)
+            elif type == "json":
+                return json.loads(value)
+
+        except ValueError:
+            raise ValueError(f"'{name}' environment variable is not a valid {type}")
+
+        raise ValueError(f"Type not supported: {type}")
 
 
-    ###########################################################################
-    #
-    # Access methods for Environment Variables
-    #
-    ###########################################################################
     #
-    # getenv
+    # load_env
     #
     @classmethod
-    def getenv(cls, name=None, default=None):
+    def load_env(cls, prefix="APP_", strip_prefix=True, type=None, overwrite=True,
+                 backing_store="local"):
         '''
-        Get an environment variable
+        Register the environment variables starting with a prefix as config items
 
         Parameters:
-            name: Name of the environment variable
-            default: The default value to use if the item doesn't exist
+            prefix: Only environment variables starting with this are loaded
+            strip_prefix: Remove the prefix from the config item names
+            type: Parse the values as this type (see getenv)
+            overwrite: Allow overwrite of existing config items
+            backing_store: Where the config items are stored (see register)
 
         Return Value:
-            The environment variable value or None
+            dict: The result of the registration (see register_many)
         '''
-        assert name
+        # Take a copy of the matching variables in a single pass
+        cls.__lock_env.acquire()
+        _env = [ (_name, _value) for _name, _value in os.environ.items()
+                if _name.startswith(prefix) ]
+        cls.__lock_env.release()
 
-        # Run the item maintenance
-        cls.__item_maintenance()
+        _items = []
+        for _name, _value in _env:
+            _item_name = _name[len(prefix):] if strip_prefix else _name
+            if not _item_name: continue
 
-        return os.getenv(name, default=default)
+            _items.append((_item_name, cls.__parse_env(name=_name, value=_value, type=type)))
 
+        return cls.register_many(items=_items, overwrite=overwrite, backing_store=backing_store)
 
-    #
-    # get_env - alias for getenv
-    #
-    get_env = getenv
 
     #
     # set
@@ -953,8 +6793,11 @@ class ApplicationConfig():
 
         cls.__lock_env.acquire()
         os.environ[name] = value
+        cls.__env_cache.pop(name, None)
         cls.__lock_env.release()
 
+        cls.__invalidate_many(names=cls.__resolved_env.get(name, ()))
+
 
     #
     # set_env - alias for setenv
@@ -987,8 +6830,11 @@ class ApplicationConfig():
         # Delete the item
         cls.__lock_env.acquire()
         del os.environ[name]
+        cls.__env_cache.pop(name, None)
         cls.__lock_env.release()
 
+        cls.__invalidate_many(names=cls.__resolved_env.get(name, ()))
+
 
     #
     # env_has_item
@@ -1023,6 +6869,12 @@ class ApplicationConfig():
 ###########################################################################
 Config = ApplicationConfig()
 
+# Give forked children their own locks and redis connections
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=ApplicationConfig._before_fork,
+            after_in_parent=ApplicationConfig._after_fork_in_parent,
+            after_in_child=ApplicationConfig._after_fork_in_child)
+
 
 ###########################################################################
 #
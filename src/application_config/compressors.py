@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+'''
+* compressors.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Compression of config item values
+*
+'''
+import base64
+
+#
+# Constants
+#
+# Compression algorithms ('zstd' and 'lz4' need the 'zstandard' and 'lz4' packages)
+COMPRESSORS = ( "zlib", "lzma", "zstd", "lz4" )
+
+# Values smaller than this (in characters, once converted to JSON) aren't compressed
+COMPRESS_THRESHOLD = 1024
+
+# Compressed values start with a header - the magic bytes, the algorithm and flags.
+# Backing stores that only hold strings get the base64 of it after a text prefix.
+# Values that start like this are always compressed, so are never mistaken for one
+_MAGIC = b"\x1fZ"
+_TEXT_PREFIX = "\x1fz"
+_ALGORITHM_IDS = { "zlib": 1, "lzma": 2, "zstd": 3, "lz4": 4 }
+_HEADER_SIZE = len(_MAGIC) + 2
+
+# Flags - the value was converted to JSON (rather than being a string)
+_FLAG_JSON = 0x01
+
+
+###########################################################################
+#
+# Algorithms
+#
+###########################################################################
+#
+# _codec
+#
+def _codec(algorithm=""):
+    '''
+    Get the compress and decompress functions for an algorithm
+
+    Parameters:
+        algorithm: The algorithm (one of COMPRESSORS)
+
+    Return Value:
+        tuple: (compress function, decompress function)
+    '''
+    if algorithm == "zlib":
+        import zlib
+        return ( lambda data: zlib.compress(data, 6), zlib.decompress )
+
+    if algorithm == "lzma":
+        import lzma
+        return ( lzma.compress, lzma.decompress )
+
+    if algorithm == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("The 'zstandard' package is required for zstd compression")
+
+        return ( zstandard.ZstdCompressor().compress,
+                lambda data: zstandard.ZstdDecompressor().decompress(data) )
+
+    if algorithm == "lz4":
+        try:
+            import lz4.frame
+        except ImportError:
+            raise ImportError("The 'lz4' package is required for lz4 compression")
+
+        return ( lz4.frame.compress, lz4.frame.decompress )
+
+    raise ValueError(f"'algorithm' must be one of {COMPRESSORS}")
+
+
+#
+# check_algorithm
+#
+def check_algorithm(algorithm=""):
+    '''
+    Make sure an algorithm is known and can be used
+
+    Parameters:
+        algorithm: The algorithm (one of COMPRESSORS)
+
+    Return Value:
+        None
+    '''
+    _codec(algorithm=algorithm)
+
+
+###########################################################################
+#
+# Compression
+#
+###########################################################################
+#
+# compress
+#
+def compress(data="", algorithm="zlib", is_json=False):
+    '''
+    Compress a string
+
+    Parameters:
+        data: The string to compress
+        algorithm: The algorithm (one of COMPRESSORS)
+        is_json: Is the string the JSON representation of the value?
+
+    Return Value:
+        bytes: The header and the compressed data
+    '''
+    _compress, _ = _codec(algorithm=algorithm)
+    _header = _MAGIC + bytes(( _ALGORITHM_IDS[algorithm], _FLAG_JSON if is_json else 0 ))
+
+    return _header + _compress(data.encode())
+
+
+#
+# decompress
+#
+def decompress(data=b""):
+    '''
+    Decompress a value
+
+    Parameters:
+        data: The compressed value (bytes, or the text form from 'to_text')
+
+    Return Value:
+        tuple: (the string, True if it is the JSON representation of the value)
+    '''
+    if isinstance(data, str): data = from_text(data=data)
+
+    for _algorithm, _algorithm_id in _ALGORITHM_IDS.items():
+        if _algorithm_id == data[len(_MAGIC)]: break
+    else:
+        raise ValueError(f"Unknown compression algorithm: {data[len(_MAGIC)]}")
+
+    _, _decompress = _codec(algorithm=_algorithm)
+    _flags = data[len(_MAGIC) + 1]
+
+    return ( _decompress(bytes(data[_HEADER_SIZE:])).decode(), bool(_flags & _FLAG_JSON) )
+
+
+#
+# is_compressed
+#
+def is_compressed(data=None):
+    '''
+    Determine if a value is compressed
+
+    Parameters:
+        data: The value
+
+    Return Value:
+        Boolean: True if the value is compressed (bytes, or the text form), False otherwise
+    '''
+    if isinstance(data, (bytes, bytearray)): return data[:len(_MAGIC)] == _MAGIC
+    if isinstance(data, str): return data.startswith(_TEXT_PREFIX)
+
+    return False
+
+
+#
+# to_text
+#
+def to_text(data=b""):
+    '''
+    Convert a compressed value to a string (for backing stores that only hold strings)
+
+    Parameters:
+        data: The compressed value
+
+    Return Value:
+        string: The text form of the value
+    '''
+    return _TEXT_PREFIX + base64.b64encode(data).decode()
+
+
+#
+# from_text
+#
+def from_text(data=""):
+    '''
+    Convert the text form of a compressed value back to bytes
+
+    Parameters:
+        data: The text form of the value
+
+    Return Value:
+        bytes: The compressed value
+    '''
+    return base64.b64decode(data[len(_TEXT_PREFIX):])
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+'''
+* loaders.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Parsers for loading config items from files
+*
+'''
+import os
+import json
+import re
+
+#
+# Constants
+#
+# Default number of characters read at a time when streaming JSON
+JSON_CHUNK_SIZE = 65536
+
+# JSON files smaller than this (in bytes) are parsed in one go rather than streamed
+JSON_STREAM_THRESHOLD = 16 * 1024 * 1024
+
+# File extensions for each supported format
+FORMAT_EXTENSIONS = {
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".toml": "toml",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".env": "env",
+}
+FORMATS = ( "json", "ndjson", "toml", "yaml", "env" )
+
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_JSON_END = _JSON_WHITESPACE + ",:}"
+
+# Escape sequences in double quoted '.env' values (others are left as they are)
+_ENV_ESCAPES = { "n": "\n", '"': '"', "\\": "\\" }
+_ENV_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+###########################################################################
+#
+# Format detection
+#
+###########################################################################
+#
+# detect_format
+#
+def detect_format(path=""):
+    '''
+    Determine the format of a config file from its name
+
+    Parameters:
+        path: Path of the config file
+
+    Return Value:
+        string: The format of the file (one of FORMATS)
+    '''
+    assert path
+
+    _base_name = os.path.basename(path)
+
+    # '.env' files are often just called '.env' (or '.env.production' etc)
+    if _base_name == ".env" or _base_name.startswith(".env."):
+        return "env"
+
+    _, _extension = os.path.splitext(_base_name)
+    if _extension.lower() not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Unable to determine the format of '{path}' - must be one of {FORMATS}")
+
+    return FORMAT_EXTENSIONS[_extension.lower()]
+
+
+###########################################################################
+#
+# Parsers
+#
+###########################################################################
+#
+# iter_items
+#
+def iter_items(path="", format=None, chunk_size=JSON_CHUNK_SIZE,
+               stream_threshold=JSON_STREAM_THRESHOLD):
+    '''
+    Iterate over the top level items in a config file
+
+    NDJSON files, and JSON files larger than 'stream_threshold' bytes, are streamed so
+    only one item is held in memory at a time.  Other files are parsed in full.
+
+    Parameters:
+        path: Path of the config file
+        format: The format of the file (None = determine from the file name)
+        chunk_size: Number of characters to read at a time when streaming JSON
+        stream_threshold: JSON files of at least this many bytes are streamed
+
+    Return Value:
+        iterator: (name, value) tuples
+    '''
+    assert path
+
+    if not format: format = detect_format(path=path)
+    if format not in FORMATS:
+        raise ValueError(f"'format' must be one of {FORMATS}")
+
+    if format == "toml":
+        yield from _load_toml(path=path).items()
+        return
+
+    if format == "yaml":
+        yield from _load_yaml(path=path).items()
+        return
+
+    with open(path, "r", encoding="utf-8") as _file:
+        if format == "json" and os.fstat(_file.fileno()).st_size < stream_threshold:
+            # Small enough to parse in one go (which is much quicker)
+            _data = json.load(_file)
+            if not isinstance(_data, dict): raise ValueError(f"'{path}' does not contain an object")
+            yield from _data.items()
+
+        elif format == "json":
+            yield from _iter_json_object(file=_file, chunk_size=chunk_size)
+
+        elif format == "ndjson":
+            yield from _iter_ndjson(file=_file)
+
+        else:
+            yield from _iter_env(file=_file)
+
+
+#
+# _iter_json_object
+#
+def _iter_json_object(file=None, chunk_size=JSON_CHUNK_SIZE):
+    '''
+    Stream the members of the top level JSON object in a file
+
+    Parameters:
+        file: The open file
+        chunk_size: Number of characters to read at a time
+
+    Return Value:
+        iterator: (name, value) tuples
+    '''
+    assert file
+
+    _decoder = json.JSONDecoder()
+    _state = { "buffer": "", "pos": 0, "eof": False }
+
+    def _fill():
+        # Drop what has been consumed, then read more (at least doubling the buffer so
+        # large values aren't re-parsed too many times)
+        _buffer = _state["buffer"][_state["pos"]:]
+        _data = file.read(max(chunk_size, len(_buffer)))
+        if not _data: _state["eof"] = True
+
+        _state["buffer"] = _buffer + _data
+        _state["pos"] = 0
+
+    def _next_char():
+        # Skip whitespace and return the next character (without consuming it)
+        while True:
+            _buffer = _state["buffer"]
+            _pos = _JSON_WHITESPACE_RE.match(_buffer, _state["pos"]).end()
+            _state["pos"] = _pos
+
+            if _pos < len(_buffer): return _buffer[_pos]
+            if _state["eof"]: return ""
+            _fill()
+
+    def _expect(chars=""):
+        _char = _next_char()
+        if not _char or _char not in chars:
+            raise ValueError(f"Invalid JSON - expected one of '{chars}', got '{_char}'")
+
+        _state["pos"] += 1
+        return _char
+
+    def _decode():
+        # Decode a value.  It is only complete once the character that ends it has been
+        # read (otherwise a number split across reads, such as '0.' + '25', would be
+        # decoded early)
+        _next_char()
+        while True:
+            try:
+                _buffer = _state["buffer"]
+                _value, _end = _decoder.raw_decode(_buffer, _state["pos"])
+
+                if _state["eof"] or (_end < len(_buffer) and _buffer[_end] in _JSON_END):
+                    _state["pos"] = _end
+                    return _value
+
+            except json.JSONDecodeError:
+                if _state["eof"]: raise
+
+            _fill()
+
+    _expect(chars="{")
+    if _next_char() == "}": return
+
+    while True:
+        _name = _decode()
+        if not isinstance(_name, str): raise ValueError("Invalid JSON - expected a name")
+
+        _expect(chars=":")
+        yield (_name, _decode())
+
+        if _expect(chars=",}") == "}": return
+
+
+#
+# _iter_ndjson
+#
+def _iter_ndjson(file=None):
+    '''
+    Stream the items from a newline delimited JSON file.  Each line is a JSON object
+    containing one or more items
+
+    Parameters:
+        file: The open file
+
+    Return Value:
+        iterator: (name, value) tuples
+    '''
+    assert file
+
+    for _line_no, _line in enumerate(file, start=1):
+        _line = _line.strip()
+        if not _line: continue
+
+        _object = json.loads(_line)
+        if not isinstance(_object, dict):
+            raise ValueError(f"Invalid NDJSON - line {_line_no} is not an object")
+
+        yield from _object.items()
+
+
+#
+# _iter_env
+#
+def _iter_env(file=None):
+    '''
+    Parse a '.env' file (lines of NAME=value)
+
+    Parameters:
+        file: The open file
+
+    Return Value:
+        iterator: (name, value) tuples
+    '''
+    assert file
+
+    for _line_no, _line in enumerate(file, start=1):
+        _line = _line.strip()
+        if not _line or _line.startswith("#"): continue
+
+        if _line.startswith("export "): _line = _line[len("export "):].lstrip()
+
+        _name, _sep, _value = _line.partition("=")
+        _name = _name.strip()
+        if not _sep or not _name:
+            raise ValueError(f"Invalid .env file - line {_line_no} is not NAME=value")
+
+        _value = _value.strip()
+        if len(_value) >= 2 and _value[0] == _value[-1] and _value[0] in ( "'", '"' ):
+            _quote = _value[0]
+            _value = _value[1:-1]
+
+            # Only double quoted values have escape sequences (replaced in one pass, so
+            # an escaped backslash isn't taken as the start of another sequence)
+            if _quote == '"':
+                _value = _ENV_ESCAPE_RE.sub(
+                        lambda _match: _ENV_ESCAPES.get(_match.group(1), _match.group(0)), _value)
+
+        elif " #" in _value:
+            # Remove a trailing comment
+            _value = _value[:_value.index(" #")].rstrip()
+
+        yield (_name, _value)
+
+
+#
+# _load_toml
+#
+def _load_toml(path=""):
+    '''
+    Load a TOML file
+
+    Parameters:
+        path: Path of the file
+
+    Return Value:
+        dict: The contents of the file
+    '''
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError("The 'tomli' package is required to load TOML files "
+                    "(before Python 3.11)")
+
+    with open(path, "rb") as _file:
+        return tomllib.load(_file)
+
+
+#
+# _load_yaml
+#
+def _load_yaml(path=""):
+    '''
+    Load a YAML file
+
+    Parameters:
+        path: Path of the file
+
+    Return Value:
+        dict: The contents of the file
+    '''
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("The 'PyYAML' package is required to load YAML files")
+
+    with open(path, "r", encoding="utf-8") as _file:
+        _data = yaml.safe_load(_file)
+
+    if _data is None: return {}
+    if not isinstance(_data, dict): raise ValueError(f"'{path}' does not contain a mapping")
+
+    return _data
@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+'''
+* sqlite_store.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* SQLite backing store for config items
+*
+'''
+from threading import Lock, Timer, current_thread
+import sqlite3
+import time
+
+#
+# Constants
+#
+# Writes are committed together once this many are waiting, or after this many seconds
+SQLITE_BATCH_SIZE = 500
+SQLITE_BATCH_INTERVAL = 0.05
+
+_SQL_CREATE = (
+    "CREATE TABLE IF NOT EXISTS config_items ("
+    " name TEXT PRIMARY KEY,"
+    " value TEXT NOT NULL,"
+    " expires_at INTEGER)",
+    "CREATE INDEX IF NOT EXISTS config_items_expires_at"
+    " ON config_items (expires_at) WHERE expires_at IS NOT NULL",
+)
+_SQL_UPSERT = "INSERT OR REPLACE INTO config_items (name, value, expires_at) VALUES (?, ?, ?)"
+_SQL_DELETE = "DELETE FROM config_items WHERE name = ?"
+_SQL_SELECT = ("SELECT value, expires_at FROM config_items WHERE name = ?"
+    " AND (expires_at IS NULL OR expires_at > ?)")
+_SQL_REAP = "DELETE FROM config_items WHERE expires_at IS NOT NULL AND expires_at <= ?"
+
+# Marker for names that aren't in the cache
+_MISSING = object()
+
+
+###########################################################################
+#
+# SQLiteStore Class
+#
+###########################################################################
+class SQLiteStore():
+    '''
+    Config items in a SQLite database (in WAL mode, so other processes can read it
+    while it is being written)
+
+    Writes are added to a batch which is committed in a single transaction when it is
+    full, after a short interval, or on 'flush'.  Reads are served from a cache, which
+    is cleared when another connection changes the database (checked at most once per
+    batch interval, so changes made elsewhere may take that long to be seen).
+
+    Expiry times are stored (in milliseconds since the epoch, so they mean the same
+    in every process) in an indexed column.
+    '''
+    #
+    # __init__
+    #
+    def __init__(self, *args, path="", batch_size=SQLITE_BATCH_SIZE,
+                 batch_interval=SQLITE_BATCH_INTERVAL, **kwargs):
+        '''
+        Class Constructor
+
+        Parameters:
+            args: Unannamed arguments
+            path: Path of the database file
+            batch_size: Number of writes that are committed together
+            batch_interval: Seconds a write may wait to be committed
+            kwargs: Named arguments.
+
+        Return Value:
+            None
+        '''
+        assert path
+        if batch_size < 1: raise ValueError("'batch_size' must be at least 1")
+
+        # Call the parent class initiator
+        super().__init__(*args, **kwargs)
+
+        self.path = path
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+
+        self.__open()
+
+
+    #
+    # __open
+    #
+    def __open(self):
+        '''
+        Open the database
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        # The connection is shared by all threads (under the lock).  Transactions are
+        # started explicitly.  The SQL statements are constant strings, so sqlite3
+        # prepares each one once and reuses it from its statement cache
+        self.__lock = Lock()
+        self.__connection = sqlite3.connect(self.path, check_same_thread=False,
+                isolation_level=None)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        for _sql in _SQL_CREATE: self.__connection.execute(_sql)
+
+        # Cache of name -> (value, expires_at), or None for a delete not yet committed
+        # (items that don't exist aren't cached).  The data version is checked at most
+        # once per batch interval
+        self.__cache = {}
+        self.__data_version = self.__get_data_version()
+        self.__checked_at = time.monotonic()
+
+        # Writes waiting to be committed - name -> (value, expires_at), or None to delete
+        self.__pending = {}
+        self.__timer = None
+
+
+    #
+    # after_fork
+    #
+    def after_fork(self):
+        '''
+        Open a new connection in a forked child (a connection must not be used in more
+        than one process).  Writes waiting in the parent are left for the parent to
+        commit
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        self.__open()
+
+
+    #
+    # __get_data_version
+    #
+    def __get_data_version(self):
+        ''' Get the data version (changes when another connection commits) '''
+        return self.__connection.execute("PRAGMA data_version").fetchone()[0]
+
+
+    #
+    # __check_cache
+    #
+    def __check_cache(self):
+        '''
+        Clear the cache if another connection has changed the database (unless it was
+        checked within the batch interval).  Must be called with the lock held
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        _now = time.monotonic()
+        if _now - self.__checked_at < self.batch_interval: return
+        self.__checked_at = _now
+
+        _data_version = self.__get_data_version()
+        if _data_version != self.__data_version:
+            # Writes not yet committed are still the latest values
+            self.__cache = dict(self.__pending)
+            self.__data_version = _data_version
+
+
+    #
+    # __expires_at
+    #
+    @staticmethod
+    def __expires_at(timeout=0):
+        ''' Convert a timeout (seconds) to an expiry time in ms since the epoch '''
+        if not timeout: return None
+
+        return int((time.time() + timeout) * 1000)
+
+
+    #
+    # __live
+    #
+    @staticmethod
+    def __live(entry=None):
+        ''' Is a cache entry for an item that exists (and hasn't expired)? '''
+        if entry is None: return False
+
+        return entry[1] is None or entry[1] > time.time() * 1000
+
+
+    #
+    # set
+    #
+    def set(self, name=None, value=None, timeout=0):
+        '''
+        Set an item (committed with the next batch)
+
+        Parameters:
+            name: Name of the config item
+            value: The config item value (a string, or bytes)
+            timeout: Number of seconds before the item expires (0 = never)
+
+        Return Value:
+            None
+        '''
+        self.set_many(items=[ ( name, value ) ], timeout=timeout)
+
+
+    #
+    # set_many
+    #
+    def set_many(self, items=None, timeout=0):
+        '''
+        Set a number of items (committed with the next batch)
+
+        Parameters:
+            items: A list of (name, value) tuples
+            timeout: Number of seconds before the items expire (0 = never)
+
+        Return Value:
+            None
+        '''
+        assert items is not None
+
+        for _, _value in items:
+            if not isinstance(_value, (str, bytes)):
+                raise TypeError(f"Variable type not supported: {type(_value)}")
+
+        _expires_at = self.__expires_at(timeout=timeout)
+
+        self.__lock.acquire()
+        for _name, _value in items:
+            self.__pending[_name] = ( _value, _expires_at )
+            self.__cache[_name] = ( _value, _expires_at )
+        self.__lock.release()
+
+        self.__batch_written()
+
+
+    #
+    # replace
+    #
+    def replace(self, name=None, value=None, expected=None):
+        '''
+        Replace the value of an item if it hasn't changed, keeping its expiry time
+        (committed with the next batch)
+
+        Parameters:
+            name: Name of the config item
+            value: The new value (a string, or bytes)
+            expected: The value the item must still have
+
+        Return Value:
+            Boolean: True if the value was replaced, False otherwise
+        '''
+        assert name
+        if not isinstance(value, (str, bytes)):
+            raise TypeError(f"Variable type not supported: {type(value)}")
+
+        # Make sure the item is in the cache
+        if self.get(name=name) != expected: return False
+
+        self.__lock.acquire()
+        _entry = self.__cache.get(name, None)
+        _replaced = self.__live(entry=_entry) and _entry[0] == expected
+        if _replaced:
+            self.__pending[name] = ( value, _entry[1] )
+            self.__cache[name] = ( value, _entry[1] )
+        self.__lock.release()
+
+        if _replaced: self.__batch_written()
+
+        return _replaced
+
+
+    #
+    # delete
+    #
+    def delete(self, name=None):
+        '''
+        Delete an item (committed with the next batch)
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True if the item existed, False otherwise
+        '''
+        assert name
+
+        _exists = self.has_item(name=name)
+
+        self.__lock.acquire()
+        self.__pending[name] = None
+        self.__cache[name] = None
+        self.__lock.release()
+
+        self.__batch_written()
+
+        return _exists
+
+
+    #
+    # get
+    #
+    def get(self, name=None):
+        '''
+        Get an item
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            The value (a string, or bytes), None if the item doesn't exist
+        '''
+        assert name
+
+        self.__lock.acquire()
+        try:
+            self.__check_cache()
+
+            _entry = self.__cache.get(name, _MISSING)
+            if _entry is _MISSING:
+                _row = self.__connection.execute(_SQL_SELECT,
+                        ( name, int(time.time() * 1000) )).fetchone()
+
+                # Only items that exist are cached
+                _entry = tuple(_row) if _row else None
+                if _entry: self.__cache[name] = _entry
+
+        finally:
+            self.__lock.release()
+
+        return _entry[0] if self.__live(entry=_entry) else None
+
+
+    #
+    # get_many
+    #
+    def get_many(self, names=None):
+        '''
+        Get a number of items
+
+        Parameters:
+            names: A list of config item names
+
+        Return Value:
+            dict: The values, indexed by name (None if not found)
+        '''
+        assert names is not None
+
+        return { _name: self.get(name=_name) for _name in names }
+
+
+    #
+    # has_item
+    #
+    def has_item(self, name=None):
+        '''
+        Determine if an item exists
+
+        Parameters:
+            name: Name of the config item
+
+        Return Value:
+            Boolean: True if the item exists, False otherwise
+        '''
+        return self.get(name=name) is not None
+
+
+    #
+    # reap
+    #
+    def reap(self):
+        '''
+        Delete all expired items (in a single query on the indexed expiry column)
+
+        Parameters:
+            None
+
+        Return Value:
+            int: The number of items deleted
+        '''
+        self.flush()
+
+        _now = int(time.time() * 1000)
+
+        self.__lock.acquire()
+        try:
+            _count = self.__connection.execute(_SQL_REAP, ( _now, )).rowcount
+
+            # Drop expired items from the cache
+            for _name in [ _name for _name, _entry in self.__cache.items()
+                    if _entry is not None and not self.__live(entry=_entry) ]:
+                del self.__cache[_name]
+
+            self.__data_version = self.__get_data_version()
+
+        finally:
+            self.__lock.release()
+
+        return _count
+
+
+    #
+    # flush
+    #
+    def flush(self):
+        '''
+        Commit the waiting writes (in a single transaction)
+
+        Parameters:
+            None
+
+        Return Value:
+            int: The number of writes committed
+        '''
+        self.__lock.acquire()
+        try:
+            if self.__timer:
+                self.__timer.cancel()
+                self.__timer = None
+
+            _pending = self.__pending
+            if not _pending: return 0
+            self.__pending = {}
+
+            _upserts = [ ( _name, _entry[0], _entry[1] )
+                    for _name, _entry in _pending.items() if _entry is not None ]
+            _deletes = [ ( _name, ) for _name, _entry in _pending.items() if _entry is None ]
+
+            self.__connection.execute("BEGIN IMMEDIATE")
+            try:
+                if _upserts: self.__connection.executemany(_SQL_UPSERT, _upserts)
+                if _deletes: self.__connection.executemany(_SQL_DELETE, _deletes)
+                self.__connection.execute("COMMIT")
+
+            except Exception:
+                self.__connection.execute("ROLLBACK")
+
+                # Keep the writes (unless written again since) to retry
+                for _name, _entry in _pending.items():
+                    self.__pending.setdefault(_name, _entry)
+                raise
+
+            # Committed deletes no longer need to be in the cache (unless written again)
+            for _name, in _deletes:
+                if _name not in self.__pending: self.__cache.pop(_name, None)
+
+            # Our own commit doesn't change the data version
+            return len(_pending)
+
+        finally:
+            self.__lock.release()
+
+
+    #
+    # commit
+    #
+    def commit(self, items=None, deletes=None, timeouts=None):
+        '''
+        Write and delete a number of items in a single transaction now (along with any
+        waiting writes)
+
+        Parameters:
+            items: A list of (name, value) tuples to write
+            deletes: A list of names to delete
+            timeouts: A dict of name -> timeout (seconds) for items that expire
+
+        Return Value:
+            None
+        '''
+        items = items or []
+        timeouts = timeouts or {}
+
+        for _, _value in items:
+            if not isinstance(_value, (str, bytes)):
+                raise TypeError(f"Variable type not supported: {type(_value)}")
+
+        self.__lock.acquire()
+        for _name, _value in items:
+            _entry = ( _value, self.__expires_at(timeout=timeouts.get(_name, 0)) )
+            self.__pending[_name] = _entry
+            self.__cache[_name] = _entry
+
+        for _name in deletes or []:
+            self.__pending[_name] = None
+            self.__cache[_name] = None
+        self.__lock.release()
+
+        self.flush()
+
+
+    #
+    # close
+    #
+    def close(self):
+        '''
+        Commit any waiting writes, and close the database
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        self.flush()
+
+        self.__lock.acquire()
+        self.__connection.close()
+        self.__lock.release()
+
+
+    #
+    # __batch_written
+    #
+    def __batch_written(self):
+        '''
+        Commit the batch if it is full, otherwise make sure it is committed soon
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        if len(self.__pending) >= self.batch_size:
+            self.flush()
+            return
+
+        self.__lock.acquire()
+        self.__start_timer()
+        self.__lock.release()
+
+
+    #
+    # __start_timer
+    #
+    def __start_timer(self):
+        '''
+        Start the timer to commit the batch (if there are waiting writes and it isn't
+        running).  Must be called with the lock held
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        if self.__pending and not self.__timer:
+            self.__timer = Timer(self.batch_interval, self.__timed_flush)
+            self.__timer.daemon = True
+            self.__timer.start()
+
+
+    #
+    # __timed_flush
+    #
+    def __timed_flush(self):
+        '''
+        Commit the batch once the interval is up (in the timer's thread)
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        try:
+            self.flush()
+
+        except Exception:
+            # The writes are kept - try again after the interval
+            self.__lock.acquire()
+            if self.__timer is current_thread(): self.__timer = None
+            self.__start_timer()
+            self.__lock.release()
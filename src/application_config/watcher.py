@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+'''
+* watcher.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Watch config files for changes
+*
+'''
+from threading import Lock, Thread, Event
+import os
+import logging
+
+#
+# Constants
+#
+# Seconds between checks of the files (the most a change can wait with inotify)
+WATCH_INTERVAL = 1.0
+
+# Milliseconds to wait for more inotify events (an editor may write a file in steps)
+_INOTIFY_DELAY = 50
+
+_logger = logging.getLogger(__name__)
+
+
+###########################################################################
+#
+# Functions
+#
+###########################################################################
+#
+# log_error
+#
+def log_error(path="", error=None):
+    '''
+    Report a file that couldn't be reloaded (the default for 'on_error')
+
+    Parameters:
+        path: Path of the file
+        error: The exception raised by the callback
+
+    Return Value:
+        None
+    '''
+    _logger.error("Reloading '%s' failed: %s", path, error, exc_info=error)
+
+
+###########################################################################
+#
+# FileWatcher Class
+#
+###########################################################################
+class FileWatcher():
+    '''
+    Watch a number of files, and call a function when one changes
+
+    A background thread checks the size, modification time and inode of each file.
+    If the 'inotify_simple' package is installed (on Linux) the directories of the
+    files are watched, so a change is noticed straight away.  Otherwise the files
+    are checked every 'interval' seconds.
+
+    If the callback fails, the file is tried again at the next check (the file may
+    have been partly written, or the store may be unavailable).  The failure is passed
+    to 'on_error', once for each version of the file.
+    '''
+    #
+    # __init__
+    #
+    def __init__(self, *args, callback=None, interval=WATCH_INTERVAL, on_error=log_error,
+                 **kwargs):
+        '''
+        Class Constructor
+
+        Parameters:
+            args: Unannamed arguments
+            callback: Function called (with the path) when a file changes
+            interval: Seconds between checks of the files
+            on_error: Function called (with the path and the exception) when the callback
+                fails (by default, the error is logged)
+            kwargs: Named arguments.
+
+        Return Value:
+            None
+        '''
+        assert callback
+        if interval <= 0: raise ValueError("'interval' must be greater than 0")
+
+        # Call the parent class initiator
+        super().__init__(*args, **kwargs)
+
+        self.callback = callback
+        self.on_error = on_error
+        self.__interval = interval
+
+        # Path -> the file's signature when last loaded, and the signature of the files
+        # whose last reload failed
+        self.__files = {}
+        self.__failed = {}
+        self.__open()
+
+
+    #
+    # __open
+    #
+    def __open(self):
+        '''
+        Set up the watcher state (without starting the thread)
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        self.__lock = Lock()
+        self.__thread = None
+        self.__wake = Event()
+
+        try:
+            import inotify_simple
+            self.__inotify = inotify_simple.INotify()
+            self.__inotify_mask = inotify_simple.flags.CLOSE_WRITE | \
+                    inotify_simple.flags.MOVED_TO | inotify_simple.flags.CREATE | \
+                    inotify_simple.flags.DELETE | inotify_simple.flags.ATTRIB
+
+        except (ImportError, OSError):
+            # Fall back to polling
+            self.__inotify = None
+
+        # Directory -> inotify watch descriptor
+        self.__dirs = {}
+
+
+    #
+    # after_fork
+    #
+    def after_fork(self):
+        '''
+        Start again in a forked child (the thread doesn't exist in the child, and the
+        inotify descriptor is shared with the parent)
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        self.__open()
+
+        self.__lock.acquire()
+        for _path in self.__files: self.__watch_dir(path=_path)
+        if self.__files: self.__start()
+        self.__lock.release()
+
+
+    #
+    # interval
+    #
+    @property
+    def interval(self):
+        ''' Seconds between checks of the files '''
+        return self.__interval
+
+
+    @interval.setter
+    def interval(self, interval):
+        if interval <= 0: raise ValueError("'interval' must be greater than 0")
+
+        # Start waiting again with the new interval
+        self.__interval = interval
+        self.__wake.set()
+
+
+    #
+    # using_inotify
+    #
+    @property
+    def using_inotify(self):
+        ''' True if changes are noticed with inotify, False if the files are polled '''
+        return self.__inotify is not None
+
+
+    #
+    # __signature
+    #
+    @staticmethod
+    def __signature(path=""):
+        ''' Get the signature of a file (None if it doesn't exist) '''
+        try:
+            _stat = os.stat(path)
+        except OSError:
+            return None
+
+        return ( _stat.st_ino, _stat.st_size, _stat.st_mtime_ns )
+
+
+    #
+    # add
+    #
+    def add(self, path=""):
+        '''
+        Start watching a file
+
+        Parameters:
+            path: Path of the file
+
+        Return Value:
+            None
+        '''
+        assert path
+
+        self.__lock.acquire()
+        self.__files[path] = self.__signature(path=path)
+        self.__watch_dir(path=path)
+        self.__start()
+        self.__lock.release()
+
+
+    #
+    # remove
+    #
+    def remove(self, path=""):
+        '''
+        Stop watching a file
+
+        Parameters:
+            path: Path of the file
+
+        Return Value:
+            Boolean: True if the file was being watched, False otherwise
+        '''
+        assert path
+
+        self.__lock.acquire()
+        _watched = path in self.__files
+        self.__files.pop(path, None)
+        self.__failed.pop(path, None)
+        self.__lock.release()
+
+        return _watched
+
+
+    #
+    # __watch_dir
+    #
+    def __watch_dir(self, path=""):
+        '''
+        Watch the directory of a file with inotify (editors often replace a file
+        rather than writing to it).  Must be called with the lock held
+
+        Parameters:
+            path: Path of the file
+
+        Return Value:
+            None
+        '''
+        if not self.__inotify: return
+
+        _dir = os.path.dirname(path) or "."
+        if _dir in self.__dirs: return
+
+        try:
+            self.__dirs[_dir] = self.__inotify.add_watch(_dir, self.__inotify_mask)
+        except OSError:
+            # Polling still notices the changes
+            pass
+
+
+    #
+    # __start
+    #
+    def __start(self):
+        '''
+        Start the thread if it isn't running.  Must be called with the lock held
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        if self.__thread: return
+
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+
+    #
+    # __wait
+    #
+    def __wait(self):
+        '''
+        Wait until a file may have changed (or the interval is up)
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        if self.__inotify:
+            try:
+                self.__inotify.read(timeout=int(self.__interval * 1000),
+                        read_delay=_INOTIFY_DELAY)
+                return
+            except OSError:
+                # Closed - fall back to polling
+                self.__inotify = None
+
+        self.__wake.wait(timeout=self.__interval)
+        self.__wake.clear()
+
+
+    #
+    # __run
+    #
+    def __run(self):
+        '''
+        Background thread to check the files
+
+        Parameters:
+            None
+
+        Return Value:
+            None
+        '''
+        while True:
+            self.__wait()
+
+            # Find the changed files
+            self.__lock.acquire()
+            if not self.__files:
+                # Nothing left to watch - a new thread is started by 'add'
+                self.__thread = None
+                self.__lock.release()
+                return
+
+            _changed = []
+            for _path, _signature in self.__files.items():
+                _new_signature = self.__signature(path=_path)
+                if _new_signature != _signature: _changed.append(( _path, _new_signature ))
+
+            self.__lock.release()
+
+            for _path, _signature in _changed:
+                # A deleted file (or one part way through being replaced) is left as is
+                if _signature is not None:
+                    try:
+                        self.callback(_path)
+
+                    except Exception as _error:
+                        # Tried again at the next check (the signature isn't updated)
+                        self.__report(path=_path, signature=_signature, error=_error)
+                        continue
+
+                # Remember the new signature (unless the file is no longer watched)
+                self.__lock.acquire()
+                if _path in self.__files: self.__files[_path] = _signature
+                self.__failed.pop(_path, None)
+                self.__lock.release()
+
+
+    #
+    # __report
+    #
+    def __report(self, path="", signature=None, error=None):
+        '''
+        Pass a failed reload to 'on_error' (once for each version of the file)
+
+        Parameters:
+            path: Path of the file
+            signature: The signature of the file that failed to reload
+            error: The exception raised by the callback
+
+        Return Value:
+            None
+        '''
+        self.__lock.acquire()
+        _reported = self.__failed.get(path, None) == signature
+        self.__failed[path] = signature
+        self.__lock.release()
+
+        if _reported: return
+
+        if not self.on_error: return
+
+        try:
+            self.on_error(path, error)
+        except Exception:
+            # The thread carries on regardless
+            pass
@@ -46,3 +46,15 @@ def redis_config():
 
     return _redis_config
 
+
+
+#
+# sqlite_config
+#
+@pytest.fixture(scope="function")
+def sqlite_config(tmp_path):
+    _sqlite_config = ApplicationConfig(sqlite_path=str(tmp_path / "config.db"))
+
+    yield _sqlite_config
+
+    _sqlite_config._close_sqlite()
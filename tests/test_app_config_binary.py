@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_binary.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Binary values
+*
+'''
+import pytest
+import array
+
+#
+# Constants
+#
+# Not valid UTF-8, so it can't pass through a connection that decodes responses
+BINARY_VALUE = bytes(range(256)) * 4
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigBinary():
+    #
+    # Local binary items are stored as they are, and viewed without a copy
+    #
+    def test_binary_local(self):
+        _var_name = "binary_local_var"
+        _var_value = bytearray(BINARY_VALUE)
+
+        pytest.appconfig.register(name=_var_name, value=_var_value, binary=True)
+        assert pytest.appconfig.get(name=_var_name) is _var_value
+
+        _buffer = pytest.appconfig.get_buffer(name=_var_name)
+        assert isinstance(_buffer, memoryview)
+        assert _buffer == BINARY_VALUE
+
+        # The view refers to the stored value
+        _var_value[0] = 255
+        assert _buffer[0] == 255
+
+        # Any object supporting the buffer protocol
+        _array = array.array("d", [ 1.5, 2.5, 3.5 ])
+        pytest.appconfig.set(name=_var_name, value=_array)
+        assert pytest.appconfig.get_buffer(name=_var_name).tobytes() == _array.tobytes()
+
+        with pytest.raises(TypeError):
+            pytest.appconfig.set(name=_var_name, value="not binary")
+
+        assert pytest.appconfig.get_buffer(name="binary_missing_var") is None
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
+
+
+    #
+    # Binary items are stored in redis as bytes, and read back as bytes
+    #
+    def test_binary_redis(self, redis_config):
+        _var_name = "binary_redis_var"
+
+        redis_config.register(name=_var_name, value=memoryview(BINARY_VALUE), binary=True,
+                backing_store="redis")
+        redis_config.register(name="binary_redis_str", value="text", backing_store="redis")
+
+        assert redis_config._get_redis(name=_var_name) == BINARY_VALUE
+        assert redis_config.get(name=_var_name) == BINARY_VALUE
+        assert redis_config.get_buffer(name=_var_name) == BINARY_VALUE
+        assert redis_config.get_many(names=[ "binary_redis_str", _var_name ]) == \
+                { "binary_redis_str": "text", _var_name: BINARY_VALUE }
+
+        # The raw bytes of a buffer are stored (not a string or JSON version)
+        _array = array.array("i", range(100))
+        redis_config.set(name=_var_name, value=_array)
+        assert redis_config.get(name=_var_name) == _array.tobytes()
+
+        with redis_config.transaction() as _txn:
+            _txn.set(name=_var_name, value=bytearray(b"\xff\x00"))
+        assert redis_config.get(name=_var_name) == b"\xff\x00"
+
+        # Delete the Items
+        redis_config.delete(name=_var_name)
+        redis_config.delete(name="binary_redis_str")
+
+
+    #
+    # Buffered writes are copies of the value
+    #
+    def test_binary_write_behind(self, redis_config):
+        _var_name = "binary_write_behind_var"
+        _var_value = bytearray(b"\x00\x01\x02")
+
+        redis_config.configure_write_behind(interval=60)
+        redis_config.register(name=_var_name, value=b"", binary=True, backing_store="redis",
+                write_behind=True)
+        redis_config.set(name=_var_name, value=_var_value)
+        _var_value[0] = 255
+
+        redis_config.flush()
+        assert redis_config.get(name=_var_name) == b"\x00\x01\x02"
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+
+
+    #
+    # Binary items in the SQLite database
+    #
+    def test_binary_sqlite(self, sqlite_config):
+        _var_name = "binary_sqlite_var"
+
+        sqlite_config.register(name=_var_name, value=bytearray(BINARY_VALUE), binary=True,
+                backing_store="sqlite")
+        sqlite_config.flush()
+
+        assert sqlite_config.get(name=_var_name) == BINARY_VALUE
+        assert sqlite_config.get_buffer(name=_var_name) == BINARY_VALUE
+
+        # Delete the Item
+        sqlite_config.delete(name=_var_name)
+
+
+    #
+    # Binary items encrypted with an AEAD cipher
+    #
+    def test_binary_encrypted(self, redis_config):
+        redis_config._init_encryption(password="binary_password")
+
+        redis_config.register(name="binary_encrypted_local", value=BINARY_VALUE, binary=True,
+                encrypt="aes-gcm")
+        assert redis_config.get(name="binary_encrypted_local") == BINARY_VALUE
+
+        redis_config.register(name="binary_encrypted_redis", value=BINARY_VALUE, binary=True,
+                encrypt="chacha20-poly1305", backing_store="redis")
+        assert isinstance(redis_config._get_redis(name="binary_encrypted_redis"), str)
+        assert redis_config.get_buffer(name="binary_encrypted_redis") == BINARY_VALUE
+        assert redis_config.get_many(names=[ "binary_encrypted_local",
+                "binary_encrypted_redis" ]) == { "binary_encrypted_local": BINARY_VALUE,
+                "binary_encrypted_redis": BINARY_VALUE }
+
+        # Delete the Items
+        redis_config.delete(name="binary_encrypted_local")
+        redis_config.delete(name="binary_encrypted_redis")
+
+
+    #
+    # Settings that can't be used with binary items
+    #
+    def test_binary_invalid(self):
+        _var_name = "binary_invalid_var"
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.register(name=_var_name, value=b"x", binary=True, encrypt=True)
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.register(name=_var_name, value=b"x", binary=True, compress=True)
+
+        with pytest.raises(TypeError):
+            pytest.appconfig.register(name=_var_name, value="x", binary=True)
+
+        pytest.appconfig.register(name=_var_name, value="x")
+        with pytest.raises(TypeError):
+            pytest.appconfig.get_buffer(name=_var_name)
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
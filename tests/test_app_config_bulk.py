@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_bulk.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Bulk operations
+*
+'''
+import pytest
+
+#
+# Constants
+#
+BULK_COUNT = 200
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigBulk():
+    #
+    # Build a set of items to register
+    #
+    def _items(self, prefix=""):
+        return { f"{prefix}_{_idx}": f"{prefix}_string_{_idx}" for _idx in range(BULK_COUNT) }
+
+
+    #
+    # Check the items and then delete them
+    #
+    def _check_and_delete(self, config, items=None):
+        _values = config.get_many(names=list(items.keys()))
+        assert _values == items
+
+        for _name in items.keys():
+            config.delete(name=_name)
+            assert not config.has_item(name=_name)
+
+
+    #
+    # Bulk registration (local)
+    #
+    def test_register_many_local(self):
+        _items = self._items(prefix="bulk_local")
+
+        _result = pytest.appconfig.register_many(items=_items)
+        assert _result["count"] == BULK_COUNT
+        assert _result["items_per_second"] > 0
+
+        # Single item access should work as normal
+        assert pytest.appconfig.get(name="bulk_local_0") == "bulk_local_string_0"
+
+        self._check_and_delete(pytest.appconfig, items=_items)
+
+
+    #
+    # Bulk registration should check all items before registering any
+    #
+    def test_register_many_checks(self):
+        _items = self._items(prefix="bulk_checks")
+
+        pytest.appconfig.register(name="bulk_checks_10", value="constant", constant=True)
+
+        with pytest.raises(TypeError, match=pytest.EXCEPTION_MATCH_CONSTANT):
+            pytest.appconfig.register_many(items=_items, overwrite=True)
+
+        assert not pytest.appconfig.has_item(name="bulk_checks_0")
+
+        pytest.appconfig.delete(name="bulk_checks_10")
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.register_many(items=_items, backing_store="unknown")
+
+
+    #
+    # Bulk registration of encrypted items (uses the thread pool)
+    #
+    def test_register_many_encrypted(self):
+        _items = self._items(prefix="bulk_encrypted")
+
+        pytest.appconfig._init_encryption(password="bulk_password")
+        pytest.appconfig.register_many(items=_items, encrypt=True, workers=4)
+
+        # Values should be stored encrypted
+        assert pytest.appconfig._get_local(name="bulk_encrypted_0") != _items["bulk_encrypted_0"]
+
+        self._check_and_delete(pytest.appconfig, items=_items)
+
+
+    #
+    # Bulk registration (redis)
+    #
+    def test_register_many_redis(self, redis_config):
+        _items = self._items(prefix="bulk_redis")
+
+        redis_config.register_many(items=_items, backing_store="redis")
+        assert redis_config.get_registration(name="bulk_redis_0").backing_store == "redis"
+
+        self._check_and_delete(redis_config, items=_items)
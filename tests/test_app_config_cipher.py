@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_cipher.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Encryption ciphers
+*
+'''
+import pytest
+import base64
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigCipher():
+    #
+    # AEAD encrypted items are kept as bytes locally
+    #
+    @pytest.mark.parametrize("cipher", ( "aes-gcm", "chacha20-poly1305" ))
+    def test_cipher_local(self, cipher):
+        _var_name = f"cipher_local_{cipher}"
+        _var_value = { "db": { "password": "secret" } }
+
+        pytest.appconfig._init_encryption(password="cipher_password")
+        pytest.appconfig.register(name=_var_name, value=_var_value, encrypt=cipher)
+
+        _raw = pytest.appconfig._get_local(name=_var_name)
+        assert isinstance(_raw, bytes)
+        assert b"secret" not in _raw
+
+        assert pytest.appconfig.get(name=_var_name) == _var_value
+        assert pytest.appconfig.get_path(path=f"{_var_name}.db.password") == "secret"
+
+        pytest.appconfig.set(name=_var_name, value="changed")
+        assert isinstance(pytest.appconfig._get_local(name=_var_name), bytes)
+        assert pytest.appconfig.get_many(names=[ _var_name ]) == { _var_name: "changed" }
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
+
+
+    #
+    # AEAD encrypted items are base64 encoded in redis, and smaller than Fernet tokens
+    #
+    def test_cipher_redis(self, redis_config):
+        _var_value = "x" * 1000
+
+        redis_config._init_encryption(password="cipher_password")
+        redis_config.register(name="cipher_redis_fernet", value=_var_value, encrypt=True,
+                backing_store="redis")
+        redis_config.register(name="cipher_redis_aes", value=_var_value, encrypt="aes-gcm",
+                backing_store="redis")
+
+        _fernet = redis_config._get_redis(name="cipher_redis_fernet")
+        _aes = redis_config._get_redis(name="cipher_redis_aes")
+        assert len(base64.b64decode(_aes)) == len(_var_value) + 34
+        assert len(_aes) < len(_fernet)
+
+        assert redis_config.get(name="cipher_redis_fernet") == _var_value
+        assert redis_config.get(name="cipher_redis_aes") == _var_value
+
+        # Delete the Items
+        redis_config.delete(name="cipher_redis_fernet")
+        redis_config.delete(name="cipher_redis_aes")
+
+
+    #
+    # Modified values and unknown ciphers are rejected
+    #
+    def test_cipher_invalid(self):
+        _var_name = "cipher_invalid_var"
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.register(name=_var_name, value="value", encrypt="rot13")
+        assert not pytest.appconfig.has_item(name=_var_name)
+
+        pytest.appconfig._init_encryption(password="cipher_password")
+        pytest.appconfig.register(name=_var_name, value="value", encrypt="aes-gcm")
+
+        _raw = bytearray(pytest.appconfig._get_local(name=_var_name))
+        _raw[-1] ^= 1
+        pytest.appconfig._set_local(name=_var_name, value=bytes(_raw))
+
+        from cryptography.exceptions import InvalidTag
+        with pytest.raises(InvalidTag):
+            pytest.appconfig.get(name=_var_name)
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_compression.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Compression
+*
+'''
+import pytest
+
+from src.application_config import compressors
+from src.application_config.application_config import ApplicationConfig
+
+#
+# Constants
+#
+LARGE_VALUE = { "hosts": [ f"host-{_idx}.example.com" for _idx in range(500) ] }
+LARGE_STRING = "compress me " * 500
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigCompression():
+    #
+    # Large values are compressed locally, small values are left alone
+    #
+    def test_compression_local(self):
+        _var_name = "compression_local_var"
+
+        pytest.appconfig.register(name=_var_name, value=LARGE_VALUE, compress=True)
+
+        _raw = pytest.appconfig._get_local(name=_var_name)
+        assert compressors.is_compressed(data=_raw)
+        assert len(_raw) < len(str(LARGE_VALUE))
+
+        assert pytest.appconfig.get(name=_var_name) == LARGE_VALUE
+        assert pytest.appconfig.get_many(names=[ _var_name ]) == { _var_name: LARGE_VALUE }
+        assert pytest.appconfig.get_path(path=f"{_var_name}.hosts.1") == "host-1.example.com"
+
+        # Strings round trip as strings
+        pytest.appconfig.set(name=_var_name, value=LARGE_STRING)
+        assert compressors.is_compressed(data=pytest.appconfig._get_local(name=_var_name))
+        assert pytest.appconfig.get(name=_var_name) == LARGE_STRING
+
+        pytest.appconfig.set(name=_var_name, value="small")
+        assert pytest.appconfig._get_local(name=_var_name) == "small"
+        assert pytest.appconfig.get(name=_var_name) == "small"
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
+
+
+    #
+    # Redis only holds strings, so the text form is stored
+    #
+    def test_compression_redis(self, redis_config):
+        _var_name = "compression_redis_var"
+
+        redis_config.register(name=_var_name, value=LARGE_STRING, backing_store="redis",
+                compress="lzma")
+
+        _raw = redis_config._get_redis(name=_var_name)
+        assert isinstance(_raw, str)
+        assert compressors.is_compressed(data=_raw)
+        assert len(_raw) < len(LARGE_STRING)
+        assert redis_config.get(name=_var_name) == LARGE_STRING
+
+        # Short values that look compressed
+        redis_config.set(name=_var_name, value="\x1fzhello")
+        assert redis_config.get(name=_var_name) == "\x1fzhello"
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+
+
+    #
+    # Values are compressed before they are encrypted
+    #
+    @pytest.mark.parametrize("cipher", ( True, "aes-gcm" ))
+    def test_compression_encrypted(self, cipher):
+        _var_name = f"compression_encrypted_{cipher}"
+
+        pytest.appconfig._init_encryption(password="compression_password")
+        pytest.appconfig.register(name=_var_name, value=LARGE_VALUE, encrypt=cipher,
+                compress=True)
+
+        assert len(pytest.appconfig._get_local(name=_var_name)) < len(str(LARGE_VALUE))
+        assert pytest.appconfig.get(name=_var_name) == LARGE_VALUE
+
+        with pytest.appconfig.transaction() as _txn:
+            _txn.set(name=_var_name, value=LARGE_STRING)
+        assert pytest.appconfig.get(name=_var_name) == LARGE_STRING
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
+
+
+    #
+    # Fernet may return the text form of the compressed value as bytes
+    #
+    def test_compression_fernet_bytes(self, monkeypatch):
+        _var_name = "compression_fernet_bytes"
+
+        pytest.appconfig._init_encryption(password="compression_password")
+        pytest.appconfig.register(name=_var_name, value=LARGE_VALUE, encrypt=True,
+                compress=True)
+
+        _decrypt_data = ApplicationConfig._ApplicationConfig__decrypt_data
+        monkeypatch.setattr(ApplicationConfig, "_ApplicationConfig__decrypt_data",
+                staticmethod(lambda data=None: _decrypt_data(data=data).encode()))
+        assert pytest.appconfig.get(name=_var_name) == LARGE_VALUE
+
+        monkeypatch.undo()
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
+
+
+    #
+    # Only items registered with 'compress' are checked for compressed data, and short
+    # values of those that look compressed aren't mistaken for compressed values
+    #
+    @pytest.mark.parametrize("cipher", ( False, True, "aes-gcm" ))
+    def test_compression_prefix(self, cipher):
+        _var_name = f"compression_prefix_{cipher}"
+        _value = compressors.to_text(data=b"not compressed")
+
+        pytest.appconfig._init_encryption(password="compression_password")
+        pytest.appconfig.register(name=_var_name, value=_value, encrypt=cipher)
+        assert pytest.appconfig.get(name=_var_name) == _value
+        assert pytest.appconfig.get_many(names=[ _var_name ]) == { _var_name: _value }
+
+        pytest.appconfig.register(name=_var_name, value="\x1fzhello", encrypt=cipher,
+                compress=True, overwrite=True)
+        assert pytest.appconfig.get(name=_var_name) == "\x1fzhello"
+        assert pytest.appconfig.get_many(names=[ _var_name ]) == { _var_name: "\x1fzhello" }
+
+        with pytest.appconfig.transaction() as _txn:
+            _txn.set(name=_var_name, value=_value)
+        assert pytest.appconfig.get(name=_var_name) == _value
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
+
+
+    #
+    # The threshold and default algorithm can be changed
+    #
+    def test_compression_configure(self):
+        _var_name = "compression_configure_var"
+
+        pytest.appconfig.configure_compression(threshold=10, algorithm="lzma")
+        try:
+            pytest.appconfig.register(name=_var_name, value="a" * 20, compress=True)
+            assert compressors.is_compressed(data=pytest.appconfig._get_local(name=_var_name))
+
+        finally:
+            pytest.appconfig.configure_compression(threshold=compressors.COMPRESS_THRESHOLD,
+                    algorithm="zlib")
+
+        # Values stored with the old settings can still be read
+        assert pytest.appconfig.get(name=_var_name) == "a" * 20
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
+
+
+    #
+    # Unknown algorithms are rejected
+    #
+    def test_compression_invalid(self):
+        with pytest.raises(ValueError):
+            pytest.appconfig.register(name="compression_invalid_var", value="x",
+                    compress="unknown")
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.configure_compression(algorithm="unknown")
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.configure_compression(threshold=-1)
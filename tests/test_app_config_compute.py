@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_compute.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Computed items
+*
+'''
+import pytest
+import threading
+import time
+
+from src.application_config.application_config import ApplicationConfig
+
+#
+# Constants
+#
+THREAD_COUNT = 8
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigCompute():
+    #
+    # The value is computed once, even with many threads wanting it
+    #
+    def test_get_or_compute(self):
+        _calls = []
+        _results = []
+
+        def _compute():
+            _calls.append(1)
+            time.sleep(0.2)
+            return 0
+
+        def _get():
+            _results.append(pytest.appconfig.get_or_compute(name="compute_var", func=_compute))
+
+        _threads = [ threading.Thread(target=_get) for _ in range(THREAD_COUNT) ]
+        for _thread in _threads: _thread.start()
+        for _thread in _threads: _thread.join()
+
+        # Falsy values are returned as they are
+        assert _results == [ 0 ] * THREAD_COUNT
+        assert len(_calls) == 1
+
+        assert pytest.appconfig.get_or_compute(name="compute_var", func=_compute) == 0
+        assert len(_calls) == 1
+
+        # Delete the Item
+        pytest.appconfig.delete(name="compute_var")
+
+
+    #
+    # A failed computation is tried again
+    #
+    def test_get_or_compute_error(self):
+        def _fail():
+            raise RuntimeError("compute failed")
+
+        with pytest.raises(RuntimeError):
+            pytest.appconfig.get_or_compute(name="compute_error_var", func=_fail)
+
+        assert not pytest.appconfig.has_item(name="compute_error_var")
+        assert pytest.appconfig.get_or_compute(name="compute_error_var",
+                func=lambda: "computed") == "computed"
+
+        # Delete the Item
+        pytest.appconfig.delete(name="compute_error_var")
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.get_or_compute(name="compute_error_var", func=_fail, stale=1)
+
+
+    #
+    # Stale values are returned while a new value is computed
+    #
+    def test_stale_while_revalidate(self):
+        _values = iter([ "first", "second" ])
+
+        assert pytest.appconfig.get_or_compute(name="compute_stale_var",
+                func=lambda: next(_values), timeout=1, stale=10) == "first"
+
+        time.sleep(1.1)
+
+        # Past the timeout - the old value is returned, and refreshed in the background
+        assert pytest.appconfig.get_or_compute(name="compute_stale_var",
+                func=lambda: next(_values), timeout=1, stale=10) == "first"
+
+        for _ in range(100):
+            if pytest.appconfig.get(name="compute_stale_var") == "second": break
+            time.sleep(0.01)
+
+        assert pytest.appconfig.get(name="compute_stale_var") == "second"
+
+        # Delete the Item
+        pytest.appconfig.delete(name="compute_stale_var")
+
+
+    #
+    # A failed background refresh keeps the old value, and is tried again
+    #
+    def test_stale_refresh_error(self):
+        _results = iter([ "first", RuntimeError("refresh failed"), "third" ])
+
+        def _compute():
+            _result = next(_results)
+            if isinstance(_result, Exception): raise _result
+            return _result
+
+        assert pytest.appconfig.get_or_compute(name="compute_refresh_var", func=_compute,
+                timeout=0.2, stale=10) == "first"
+        assert pytest.appconfig.compute_error(name="compute_refresh_var") is None
+
+        time.sleep(0.3)
+        assert pytest.appconfig.get_or_compute(name="compute_refresh_var", func=_compute,
+                timeout=0.2, stale=10) == "first"
+
+        for _ in range(100):
+            if pytest.appconfig.compute_error(name="compute_refresh_var"): break
+            time.sleep(0.01)
+
+        assert str(pytest.appconfig.compute_error(name="compute_refresh_var")) == \
+                "refresh failed"
+        assert pytest.appconfig.get(name="compute_refresh_var") == "first"
+
+        # The next call tries again
+        assert pytest.appconfig.get_or_compute(name="compute_refresh_var", func=_compute,
+                timeout=0.2, stale=10) == "first"
+
+        for _ in range(100):
+            if pytest.appconfig.get(name="compute_refresh_var") == "third": break
+            time.sleep(0.01)
+
+        assert pytest.appconfig.get(name="compute_refresh_var") == "third"
+        assert pytest.appconfig.compute_error(name="compute_refresh_var") is None
+
+        # Delete the Item
+        pytest.appconfig.delete(name="compute_refresh_var")
+
+
+    #
+    # The refresh time is dropped when the item is deleted or expires
+    #
+    def test_stale_dropped(self):
+        _refresh_at = ApplicationConfig._ApplicationConfig__refresh_at
+
+        pytest.appconfig.get_or_compute(name="compute_deleted_var", func=lambda: "value",
+                timeout=10, stale=10)
+        pytest.appconfig.get_or_compute(name="compute_expired_var", func=lambda: "value",
+                timeout=0.1, stale=0.1)
+        assert "compute_deleted_var" in _refresh_at
+        assert "compute_expired_var" in _refresh_at
+
+        pytest.appconfig.delete(name="compute_deleted_var")
+        assert "compute_deleted_var" not in _refresh_at
+
+        time.sleep(0.3)
+        assert not pytest.appconfig.has_item(name="compute_expired_var")
+        assert "compute_expired_var" not in _refresh_at
+
+
+    #
+    # Function results kept per set of arguments
+    #
+    def test_memoize(self):
+        _calls = []
+
+        @pytest.appconfig.memoize(timeout=60)
+        def _square(value, offset=0):
+            _calls.append(value)
+            return value * value + offset
+
+        assert _square(3) == 9
+        assert _square(3) == 9
+        assert _square(4) == 16
+        assert _square(3, offset=1) == 10
+        assert _calls == [ 3, 4, 3 ]
+        assert _square.__name__ == "_square"
@@ -99,3 +99,58 @@ class TestAppConfigEnv():
 
         # Delete the Item
         self._env_delete(name=_var_name)
+
+
+    #
+    # Typed Environment Vars
+    #
+    def test_typed_env_variable(self):
+        _var_name = "typed_environment_var"
+
+        # Make sure the value doesn't exist
+        assert not pytest.appconfig.env_has_item(_var_name)
+        assert pytest.appconfig.getenv_int(name=_var_name, default=5) == 5
+
+        pytest.appconfig.set_env(name=_var_name, value="42")
+        assert pytest.appconfig.getenv_int(name=_var_name) == 42
+        assert pytest.appconfig.getenv_float(name=_var_name) == 42.0
+        assert pytest.appconfig.get_env(name=_var_name, type=int) == 42
+        assert pytest.appconfig.get_env(name=_var_name) == "42"
+
+        # Cached value should be replaced when the variable changes
+        pytest.appconfig.set_env(name=_var_name, value="yes")
+        assert pytest.appconfig.getenv_bool(name=_var_name) is True
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.getenv_int(name=_var_name)
+
+        pytest.appconfig.set_env(name=_var_name, value='{"a": [1, 2]}')
+        assert pytest.appconfig.getenv_json(name=_var_name) == { "a": [ 1, 2 ] }
+
+        # Delete the Item
+        self._env_delete(name=_var_name)
+        assert pytest.appconfig.getenv_json(name=_var_name) is None
+
+
+    #
+    # Load Environment Vars in to the config
+    #
+    def test_load_env(self):
+        _prefix = "LOAD_ENV_TEST_"
+        _vars = { f"{_prefix}ONE": "1", f"{_prefix}TWO": "2" }
+
+        for _name, _value in _vars.items():
+            pytest.appconfig.set_env(name=_name, value=_value)
+
+        _result = pytest.appconfig.load_env(prefix=_prefix, type=int)
+        assert _result["count"] == len(_vars)
+
+        assert pytest.appconfig.get(name="ONE") == 1
+        assert pytest.appconfig.get(name="TWO") == 2
+
+        # Delete the Items
+        for _name in _vars.keys():
+            pytest.appconfig.delete_env(name=_name)
+
+        pytest.appconfig.delete(name="ONE")
+        pytest.appconfig.delete(name="TWO")
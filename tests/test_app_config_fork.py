@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_fork.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Forked processes
+*
+'''
+import pytest
+import os
+import signal
+import threading
+import time
+
+from src.application_config.application_config import ApplicationConfig, FORK_LOCK_TIMEOUT
+
+#
+# Constants
+#
+CHILD_TIMEOUT = 10
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+class TestAppConfigFork():
+    #
+    # Run a function in a forked child, and return its exit code
+    #
+    def _run_in_child(self, func=None):
+        _pid = os.fork()
+        if _pid == 0:
+            # Fail (rather than hang) if the child deadlocks
+            signal.alarm(CHILD_TIMEOUT)
+            try:
+                os._exit(0 if func() else 1)
+            except BaseException:
+                os._exit(2)
+
+        _, _status = os.waitpid(_pid, 0)
+        return os.waitstatus_to_exitcode(_status) if hasattr(os, "waitstatus_to_exitcode") \
+                else _status >> 8
+
+
+    #
+    # Local items are kept, and locks held in the parent don't block the child
+    #
+    def test_fork_keep(self, redis_config):
+        redis_config.register(name="fork_local", value="local_value")
+        redis_config.register(name="fork_redis", value="redis_value", backing_store="redis")
+
+        def _child():
+            assert redis_config.get(name="fork_local") == "local_value"
+            assert redis_config.get(name="fork_redis") == "redis_value"
+
+            redis_config.set(name="fork_local", value="child_value")
+            return redis_config.resolve(name="fork_local") == "child_value"
+
+        # Hold a lock, as if another thread was using it when the fork happened
+        _lock = ApplicationConfig._ApplicationConfig__lock_resolve
+        _lock.acquire()
+        try:
+            assert self._run_in_child(func=_child) == 0
+        finally:
+            _lock.release()
+
+        # The parent is unchanged
+        assert redis_config.get(name="fork_local") == "local_value"
+        assert redis_config.get(name="fork_redis") == "redis_value"
+
+        # Delete the Items
+        redis_config.delete(name="fork_local")
+        redis_config.delete(name="fork_redis")
+
+
+    #
+    # Forking while another thread is writing (the locks are taken for the fork)
+    #
+    def test_fork_writing(self):
+        _stop = threading.Event()
+
+        def _writer():
+            _idx = 0
+            while not _stop.is_set():
+                pytest.appconfig.register(name=f"fork_writing_{_idx % 10}", value=_idx,
+                        overwrite=True)
+                pytest.appconfig.set_override(name="fork_writing_0", value=_idx)
+                _idx += 1
+
+        def _child():
+            pytest.appconfig.register(name="fork_writing_child", value="child")
+            return pytest.appconfig.get(name="fork_writing_child") == "child" and \
+                    pytest.appconfig.resolve(name="fork_writing_0") is not None
+
+        _thread = threading.Thread(target=_writer, daemon=True)
+        _thread.start()
+        try:
+            for _ in range(5):
+                assert self._run_in_child(func=_child) == 0
+        finally:
+            _stop.set()
+            _thread.join()
+
+        # Delete the Items
+        pytest.appconfig.delete_override(name="fork_writing_0")
+        for _idx in range(10):
+            pytest.appconfig.delete(name=f"fork_writing_{_idx}")
+
+
+    #
+    # Forking from code that holds a lock doesn't deadlock (and the lock left is logged)
+    #
+    def test_fork_lock_held(self, caplog):
+        pytest.appconfig.register(name="fork_held", value="held")
+
+        def _child():
+            return pytest.appconfig.get(name="fork_held") == "held"
+
+        _lock = ApplicationConfig._ApplicationConfig__lock_env
+        _lock.acquire()
+        try:
+            with caplog.at_level("WARNING", logger="src.application_config.application_config"):
+                assert self._run_in_child(func=_child) == 0
+        finally:
+            _lock.release()
+
+        assert "The env lock is still held" in caplog.text
+
+        # The parent can still use the lock
+        pytest.appconfig.set(name="fork_held", value="parent")
+        assert pytest.appconfig.get(name="fork_held") == "parent"
+
+        # Delete the Item
+        pytest.appconfig.delete(name="fork_held")
+
+
+    #
+    # The fork waits for a change to the store to finish, however long it takes
+    #
+    def test_fork_store_lock(self):
+        pytest.appconfig.register(name="fork_store_a", value="before")
+        pytest.appconfig.register(name="fork_store_b", value="before")
+        _locked = threading.Event()
+
+        def _writer():
+            # A change made under the store lock, that outlasts FORK_LOCK_TIMEOUT
+            _lock = ApplicationConfig._ApplicationConfig__lock
+            _conf = ApplicationConfig._ApplicationConfig__conf
+            _lock.acquire()
+            try:
+                _conf["fork_store_a"] = "after"
+                _locked.set()
+                time.sleep(FORK_LOCK_TIMEOUT * 1.5)
+                _conf["fork_store_b"] = "after"
+            finally:
+                _lock.release()
+
+        def _child():
+            return pytest.appconfig.get(name="fork_store_a") == "after" and \
+                    pytest.appconfig.get(name="fork_store_b") == "after"
+
+        _thread = threading.Thread(target=_writer)
+        _thread.start()
+        _locked.wait()
+        try:
+            assert self._run_in_child(func=_child) == 0
+        finally:
+            _thread.join()
+
+        # Delete the Items
+        pytest.appconfig.delete(name="fork_store_a")
+        pytest.appconfig.delete(name="fork_store_b")
+
+
+    #
+    # Local items are dropped in the child
+    #
+    def test_fork_clear(self, redis_config):
+        redis_config.register(name="fork_clear_local", value="local_value")
+        redis_config.register(name="fork_clear_redis", value="redis_value",
+                backing_store="redis")
+
+        def _child():
+            return not redis_config.has_item(name="fork_clear_local") and \
+                    redis_config.get(name="fork_clear_redis") == "redis_value"
+
+        redis_config.configure_fork(local_state="clear")
+        try:
+            assert self._run_in_child(func=_child) == 0
+        finally:
+            redis_config.configure_fork(local_state="keep")
+
+        assert redis_config.get(name="fork_clear_local") == "local_value"
+
+        with pytest.raises(ValueError):
+            redis_config.configure_fork(local_state="unknown")
+
+        # Delete the Items
+        redis_config.delete(name="fork_clear_local")
+        redis_config.delete(name="fork_clear_redis")
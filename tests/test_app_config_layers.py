@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_layers.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Layered lookup
+*
+'''
+import pytest
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigLayers():
+    #
+    # Each layer should take precedence over those below it
+    #
+    def test_layer_precedence(self):
+        _var_name = "layers.precedence"
+        _env_name = pytest.appconfig.env_name(name=_var_name)
+        assert _env_name == "LAYERS_PRECEDENCE"
+
+        # Not found anywhere
+        assert pytest.appconfig.resolve(name=_var_name, default="missing") == "missing"
+
+        pytest.appconfig.set_default(name=_var_name, value="default_value")
+        assert pytest.appconfig.resolve(name=_var_name) == "default_value"
+
+        pytest.appconfig.set(name=_var_name, value="local_value")
+        assert pytest.appconfig.resolve(name=_var_name) == "local_value"
+
+        pytest.appconfig.set_env(name=_env_name, value="env_value")
+        assert pytest.appconfig.resolve(name=_var_name) == "env_value"
+
+        pytest.appconfig.set_override(name=_var_name, value="override_value")
+        assert pytest.appconfig.resolve(name=_var_name) == "override_value"
+
+        # Removing each layer should reveal the one below
+        pytest.appconfig.delete_override(name=_var_name)
+        assert pytest.appconfig.resolve(name=_var_name) == "env_value"
+
+        pytest.appconfig.delete_env(name=_env_name)
+        assert pytest.appconfig.resolve(name=_var_name) == "local_value"
+
+        pytest.appconfig.set(name=_var_name, value="new_local_value")
+        assert pytest.appconfig.resolve(name=_var_name) == "new_local_value"
+
+        pytest.appconfig.delete(name=_var_name)
+        assert pytest.appconfig.resolve(name=_var_name) == "default_value"
+
+        pytest.appconfig.delete_default(name=_var_name)
+        assert pytest.appconfig.resolve(name=_var_name) is None
+
+
+    #
+    # Changing the layer order and environment prefix
+    #
+    def test_layer_configuration(self):
+        _var_name = "layers.config"
+
+        pytest.appconfig.configure_layers(layers=[ "local", "env" ], env_prefix="LAYERS_TEST_")
+        _env_name = pytest.appconfig.env_name(name=_var_name)
+        assert _env_name == "LAYERS_TEST_LAYERS_CONFIG"
+
+        pytest.appconfig.set_env(name=_env_name, value="env_value")
+        pytest.appconfig.set(name=_var_name, value="local_value")
+        assert pytest.appconfig.resolve(name=_var_name) == "local_value"
+
+        pytest.appconfig.delete(name=_var_name)
+        assert pytest.appconfig.resolve(name=_var_name) == "env_value"
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.configure_layers(layers=[ "unknown" ])
+
+        # Restore the defaults
+        pytest.appconfig.delete_env(name=_env_name)
+        pytest.appconfig.configure_layers(layers=[ "override", "redis", "env", "local", "default" ],
+                env_prefix="")
+
+
+    #
+    # Redis layer
+    #
+    def test_redis_layer(self, redis_config):
+        _var_name = "layers.redis"
+
+        redis_config.set_default(name=_var_name, value="default_value")
+        redis_config.register(name=_var_name, value="redis_value", backing_store="redis")
+        assert redis_config.resolve(name=_var_name) == "redis_value"
+
+        redis_config.set(name=_var_name, value="new_redis_value")
+        assert redis_config.resolve(name=_var_name) == "new_redis_value"
+
+        redis_config.delete(name=_var_name)
+        assert redis_config.resolve(name=_var_name) == "default_value"
+
+        redis_config.delete_default(name=_var_name)
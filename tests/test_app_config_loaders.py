@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_loaders.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Loading config files
+*
+'''
+import pytest
+import json
+
+from src.application_config import loaders
+
+#
+# Constants
+#
+CONFIG_VALUES = {
+    "name": "loader_test",
+    "count": 12345678901234567890,
+    "ratio": 0.25,
+    "enabled": True,
+    "service": { "db": { "host": "localhost", "pool": { "size": 10 } } },
+    "hosts": [ "a", "b", "c" ],
+}
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigLoaders():
+    #
+    # Load a file and check the items
+    #
+    def _load_and_check(self, path="", values=None, namespace="loader"):
+        _result = pytest.appconfig.load_file(path=path, namespace=namespace)
+        assert _result["count"] == len(values)
+
+        for _name, _value in values.items():
+            assert pytest.appconfig.get(name=f"{namespace}.{_name}") == _value
+
+        # Delete the Items
+        for _name in values.keys():
+            pytest.appconfig.delete(name=f"{namespace}.{_name}")
+            assert not pytest.appconfig.has_item(name=f"{namespace}.{_name}")
+
+
+    def test_load_json(self, tmp_path):
+        _path = tmp_path / "config.json"
+        _path.write_text(json.dumps(CONFIG_VALUES, indent=4))
+
+        self._load_and_check(path=str(_path), values=CONFIG_VALUES)
+
+
+    def test_stream_json(self, tmp_path):
+        _path = tmp_path / "config.json"
+        _path.write_text(json.dumps(CONFIG_VALUES, indent=4))
+
+        # Read a few characters at a time so values are split across reads
+        for _chunk_size in ( 1, 3, 7 ):
+            _items = dict(loaders.iter_items(path=str(_path), chunk_size=_chunk_size,
+                    stream_threshold=0))
+            assert _items == CONFIG_VALUES
+
+        _path.write_text(" { } ")
+        assert list(loaders.iter_items(path=str(_path), chunk_size=1, stream_threshold=0)) == []
+
+        _path.write_text('{ "a": 1, }')
+        with pytest.raises(ValueError):
+            list(loaders.iter_items(path=str(_path), stream_threshold=0))
+
+
+    def test_load_ndjson(self, tmp_path):
+        _path = tmp_path / "config.ndjson"
+        _path.write_text("\n".join([ json.dumps({ _name: _value })
+                for _name, _value in CONFIG_VALUES.items() ]))
+
+        self._load_and_check(path=str(_path), values=CONFIG_VALUES)
+
+
+    def test_load_toml(self, tmp_path):
+        _path = tmp_path / "config.toml"
+        _path.write_text("\n".join([
+            'name = "loader_test"',
+            'ratio = 0.25',
+            'hosts = [ "a", "b", "c" ]',
+            '[service.db]',
+            'host = "localhost"',
+            'pool = { size = 10 }',
+        ]))
+
+        self._load_and_check(path=str(_path), values={
+            "name": "loader_test",
+            "ratio": 0.25,
+            "hosts": [ "a", "b", "c" ],
+            "service": { "db": { "host": "localhost", "pool": { "size": 10 } } },
+        })
+
+
+    def test_load_yaml(self, tmp_path):
+        pytest.importorskip("yaml")
+
+        _path = tmp_path / "config.yaml"
+        _path.write_text(json.dumps(CONFIG_VALUES))
+
+        self._load_and_check(path=str(_path), values=CONFIG_VALUES)
+
+
+    def test_load_env(self, tmp_path):
+        _path = tmp_path / ".env"
+        _path.write_text("\n".join([
+            '# A comment',
+            'PLAIN=value',
+            'export EXPORTED=exported value',
+            'QUOTED="quoted # not a comment\\nline 2"',
+            "SINGLE='single'",
+            'BACKSLASH="a\\\\nb"',
+            'ESCAPED="say \\"hi\\" \\t"',
+            '',
+            'COMMENT=value # a comment',
+        ]))
+
+        self._load_and_check(path=str(_path), values={
+            "PLAIN": "value",
+            "EXPORTED": "exported value",
+            "QUOTED": "quoted # not a comment\nline 2",
+            "SINGLE": "single",
+            "BACKSLASH": "a\\nb",
+            "ESCAPED": 'say "hi" \\t',
+            "COMMENT": "value",
+        }, namespace="env")
+
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            pytest.appconfig.load_file(path=str(tmp_path / "config.ini"))
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_memory.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Memory budget
+*
+'''
+import pytest
+import sys
+import threading
+
+#
+# Constants
+#
+VALUE_SIZE = 1000
+ITEM_SIZE = sys.getsizeof("x" * VALUE_SIZE)
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigMemory():
+    #
+    # Stop tracking after each test
+    #
+    @pytest.fixture(autouse=True)
+    def _reset_memory(self):
+        yield
+        pytest.appconfig.configure_memory(track=False)
+
+
+    #
+    # Least recently used items are evicted from a namespace over its budget
+    #
+    def test_memory_lru(self):
+        pytest.appconfig.configure_memory(namespace_budgets={ "mem_lru": ITEM_SIZE * 3 })
+
+        pytest.appconfig.register(name="mem_lru.constant", value="c" * VALUE_SIZE,
+                constant=True)
+        pytest.appconfig.set(name="mem_lru.a", value="a" * VALUE_SIZE)
+        pytest.appconfig.set(name="mem_lru.b", value="b" * VALUE_SIZE)
+
+        # Reading 'a' makes 'b' the least recently used
+        assert pytest.appconfig.get(name="mem_lru.a")
+        pytest.appconfig.set(name="mem_lru.c", value="c" * VALUE_SIZE)
+
+        assert pytest.appconfig.has_item(name="mem_lru.constant")
+        assert pytest.appconfig.has_item(name="mem_lru.a")
+        assert not pytest.appconfig.has_item(name="mem_lru.b")
+        assert pytest.appconfig.has_item(name="mem_lru.c")
+
+        _stats = pytest.appconfig.memory_stats()
+        assert _stats["tracking"]
+        assert _stats["evictions"] >= 1
+        assert _stats["namespaces"]["mem_lru"] == {
+            "bytes": ITEM_SIZE * 3, "items": 3, "budget": ITEM_SIZE * 3 }
+
+        # Items over the budget on their own are rejected
+        with pytest.raises(ValueError):
+            pytest.appconfig.set(name="mem_lru.large", value="x" * VALUE_SIZE * 4)
+
+        # Delete the Items
+        for _name in ( "mem_lru.a", "mem_lru.c", "mem_lru.constant" ):
+            pytest.appconfig.delete(name=_name)
+
+        assert "mem_lru" not in pytest.appconfig.memory_stats()["namespaces"]
+
+
+    #
+    # Least frequently used items are evicted first
+    #
+    def test_memory_lfu(self):
+        pytest.appconfig.configure_memory(namespace_budgets={ "mem_lfu": ITEM_SIZE * 2 },
+                policy="lfu")
+
+        pytest.appconfig.set(name="mem_lfu.a", value="a" * VALUE_SIZE)
+        pytest.appconfig.set(name="mem_lfu.b", value="b" * VALUE_SIZE)
+
+        # 'a' is read more often (but less recently) than 'b'
+        for _ in range(3): pytest.appconfig.get(name="mem_lfu.a")
+        pytest.appconfig.get(name="mem_lfu.b")
+
+        pytest.appconfig.set(name="mem_lfu.c", value="c" * VALUE_SIZE)
+
+        assert pytest.appconfig.has_item(name="mem_lfu.a")
+        assert not pytest.appconfig.has_item(name="mem_lfu.b")
+
+        # Delete the Items
+        pytest.appconfig.delete(name="mem_lfu.a")
+        pytest.appconfig.delete(name="mem_lfu.c")
+
+
+    #
+    # Items already in the store are counted when tracking starts
+    #
+    def test_memory_existing(self):
+        pytest.appconfig.set(name="mem_existing.a", value="a" * VALUE_SIZE)
+        pytest.appconfig.configure_memory()
+
+        _stats = pytest.appconfig.memory_stats()
+        assert _stats["namespaces"]["mem_existing"]["bytes"] == ITEM_SIZE
+        assert _stats["bytes"] >= ITEM_SIZE
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.configure_memory(policy="unknown")
+
+        # Delete the Item
+        pytest.appconfig.delete(name="mem_existing.a")
+
+
+    #
+    # Reads while items are being evicted
+    #
+    @pytest.mark.parametrize("policy", [ "lru", "lfu" ])
+    def test_memory_concurrent(self, policy):
+        pytest.appconfig.configure_memory(namespace_budgets={ "mem_threads": ITEM_SIZE * 5 },
+                policy=policy)
+        _names = [ f"mem_threads.{_idx}" for _idx in range(20) ]
+        _errors = []
+        _stop = threading.Event()
+
+        def _reader():
+            try:
+                while not _stop.is_set():
+                    for _name in _names: pytest.appconfig.get(name=_name)
+            except Exception as err:
+                _errors.append(err)
+
+        def _writer():
+            try:
+                for _idx in range(2000):
+                    pytest.appconfig.set(name=_names[_idx % len(_names)], value="x" * VALUE_SIZE)
+            except Exception as err:
+                _errors.append(err)
+
+        _readers = [ threading.Thread(target=_reader) for _ in range(3) ]
+        for _thread in _readers: _thread.start()
+        _writer_thread = threading.Thread(target=_writer)
+        _writer_thread.start()
+        _writer_thread.join()
+        _stop.set()
+        for _thread in _readers: _thread.join()
+
+        assert _errors == []
+
+        # The lock isn't left held
+        _stats = pytest.appconfig.memory_stats()
+        assert _stats["namespaces"]["mem_threads"]["items"] <= 5
+
+        # Delete the Items
+        for _name in _names:
+            if pytest.appconfig.has_item(name=_name): pytest.appconfig.delete(name=_name)
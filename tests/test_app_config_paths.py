@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_paths.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Paths within items
+*
+'''
+import pytest
+import json
+
+#
+# Constants
+#
+SERVICE_VALUE = {
+    "db": { "host": "localhost", "pool": { "size": 10, "timeout": 0 } },
+    "hosts": [ "a", { "name": "b" } ],
+}
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigPaths():
+    #
+    # Paths within a local item
+    #
+    def test_local_path(self):
+        pytest.appconfig.register(name="paths", value=SERVICE_VALUE, by_reference=False)
+
+        assert pytest.appconfig.get_path(path="paths.db.pool.size") == 10
+        assert pytest.appconfig.get_path(path="paths.db.pool.timeout", default=5) == 0
+        assert pytest.appconfig.get_path(path="paths.hosts.1.name") == "b"
+        assert pytest.appconfig.get_path(path="paths.db.missing", default="x") == "x"
+        assert pytest.appconfig.get_path(path="paths.hosts.9", default="x") == "x"
+        assert pytest.appconfig.get_path(path="paths") == SERVICE_VALUE
+        assert pytest.appconfig.get_path(path="missing.path") is None
+
+        # Items not stored by reference should return a copy
+        _pool = pytest.appconfig.get_path(path="paths.db.pool")
+        _pool["size"] = 20
+        assert pytest.appconfig.get_path(path="paths.db.pool.size") == 10
+
+        # A longer item name should take precedence
+        pytest.appconfig.register(name="paths.db", value={ "pool": { "size": 30 } })
+        assert pytest.appconfig.get_path(path="paths.db.pool.size") == 30
+
+        pytest.appconfig.delete(name="paths.db")
+        assert pytest.appconfig.get_path(path="paths.db.pool.size") == 10
+
+        # Delete the Item
+        pytest.appconfig.delete(name="paths")
+        assert pytest.appconfig.get_path(path="paths.db.pool.size") is None
+
+
+    #
+    # Paths within an encrypted item
+    #
+    def test_encrypted_path(self):
+        pytest.appconfig._init_encryption(password="paths_password")
+        pytest.appconfig.register(name="encrypted_paths", value=SERVICE_VALUE, encrypt=True)
+
+        assert pytest.appconfig.get_path(path="encrypted_paths.db.host") == "localhost"
+
+        # Delete the Item
+        pytest.appconfig.delete(name="encrypted_paths")
+
+
+    #
+    # Paths within a redis item (stored as JSON)
+    #
+    def test_redis_path(self, redis_config):
+        redis_config.register(name="redis_paths", value=json.dumps(SERVICE_VALUE),
+                backing_store="redis")
+
+        assert redis_config.get_path(path="redis_paths.db.pool.size") == 10
+        assert redis_config.get_path(path="redis_paths.hosts.0") == "a"
+
+        # Delete the Item
+        redis_config.delete(name="redis_paths")
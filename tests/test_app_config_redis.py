@@ -147,3 +147,13 @@ class TestAppConfigRedis():
 
         # Try to get the value (checking that we get the default)
         self._redis_missing_get(redis_config, name=_var_name, default_value=_var_default)
+
+
+    def test_redis_group_by_slot(self):
+        # Keys with the same hash tag are in the same slot
+        _names = [ "{tenant1}.a", "plain", "{tenant1}.b", "{tenant2}.a", "{tenant1}.c" ]
+
+        _slots = pytest.appconfig._group_by_slot(names=_names)
+
+        assert sorted([ _name for _group in _slots.values() for _name in _group ]) == sorted(_names)
+        assert [ "{tenant1}.a", "{tenant1}.b", "{tenant1}.c" ] in _slots.values()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_resilience.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Redis resilience
+*
+'''
+import pytest
+import time
+
+import redis
+
+from src.application_config.application_config import REDIS_FAILURE_THRESHOLD, \
+        REDIS_RESET_TIMEOUT, REDIS_DEADLINE_WORKERS, REDIS_STALE_MAX_BYTES
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigResilience():
+    #
+    # Make redis fail (or respond slowly) - counting the calls that get through
+    #
+    def _break_redis(self, monkeypatch, delay=0, method="exists"):
+        _calls = []
+        _method = getattr(redis.Redis, method)
+
+        def _broken_method(self, *args, **kwargs):
+            _calls.append(args)
+            if not delay: raise redis.exceptions.ConnectionError("Redis is down")
+
+            time.sleep(delay)
+            return _method(self, *args, **kwargs)
+
+        monkeypatch.setattr(redis.Redis, method, _broken_method)
+        return _calls
+
+
+    #
+    # Let redis calls through again (closing the breaker), and put the defaults back
+    #
+    def _recover(self, redis_config, monkeypatch):
+        monkeypatch.undo()
+        redis_config.configure_resilience(failure_threshold=REDIS_FAILURE_THRESHOLD,
+                reset_timeout=0, deadline_ms=0, serve_stale=False,
+                stale_max_bytes=REDIS_STALE_MAX_BYTES)
+        redis_config._get_redis(name="resilience_recover")
+        redis_config.configure_resilience(reset_timeout=REDIS_RESET_TIMEOUT)
+
+        assert redis_config.resilience_stats()["state"] == "closed"
+
+
+    #
+    # Reads give up on redis once the deadline passes
+    #
+    def test_deadline(self, redis_config, monkeypatch):
+        _var_name = "resilience_deadline_var"
+        redis_config.register(name=_var_name, value="value", backing_store="redis")
+        assert redis_config.get(name=_var_name, deadline_ms=1000) == "value"
+
+        self._break_redis(monkeypatch, delay=0.5)
+
+        _start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            redis_config.get(name=_var_name, deadline_ms=50)
+        assert time.monotonic() - _start < 0.4
+
+        # The default deadline
+        redis_config.configure_resilience(deadline_ms=50)
+        with pytest.raises(TimeoutError):
+            redis_config.get(name=_var_name)
+
+        # No deadline - wait for redis
+        assert redis_config.get(name=_var_name, deadline_ms=0) == "value"
+
+        # Writes don't have a deadline (one that timed out could still be applied)
+        self._break_redis(monkeypatch, delay=0.2, method="set")
+        redis_config.set(name=_var_name, value="new value")
+        assert redis_config.get(name=_var_name, deadline_ms=0) == "new value"
+
+        self._recover(redis_config, monkeypatch)
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+
+
+    #
+    # Calls that missed their deadline hold their thread, and calls don't queue behind them
+    #
+    def test_deadline_limit(self, redis_config, monkeypatch):
+        _var_name = "resilience_limit_var"
+        redis_config.register(name=_var_name, value="value", backing_store="redis")
+        redis_config.configure_resilience(failure_threshold=1000)
+
+        _calls = self._break_redis(monkeypatch, delay=1)
+        for _ in range(REDIS_DEADLINE_WORKERS):
+            with pytest.raises(TimeoutError, match="No response"):
+                redis_config.get(name=_var_name, deadline_ms=10)
+
+        _start = time.monotonic()
+        with pytest.raises(TimeoutError, match="Too many"):
+            redis_config.get(name=_var_name, deadline_ms=500)
+        assert time.monotonic() - _start < 0.1
+        assert len(_calls) == REDIS_DEADLINE_WORKERS
+
+        # Once redis answers, the threads are free again
+        monkeypatch.undo()
+        time.sleep(1.5)
+        assert redis_config.get(name=_var_name, deadline_ms=500) == "value"
+
+        self._recover(redis_config, monkeypatch)
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+
+
+    #
+    # The breaker opens after consecutive failures, and closes when a trial call works
+    #
+    def test_breaker(self, redis_config, monkeypatch):
+        _var_name = "resilience_breaker_var"
+        redis_config.register(name=_var_name, value="value", backing_store="redis")
+        redis_config.configure_resilience(failure_threshold=3, reset_timeout=0.2)
+
+        _calls = self._break_redis(monkeypatch)
+        for _ in range(3):
+            with pytest.raises(redis.exceptions.ConnectionError):
+                redis_config.get(name=_var_name)
+
+        assert redis_config.resilience_stats() == { "state": "open", "failures": 3,
+                "stale_items": 0, "stale_bytes": 0 }
+
+        # Calls fail without trying redis (writes as well)
+        with pytest.raises(ConnectionError, match="circuit breaker is open"):
+            redis_config.get(name=_var_name)
+        with pytest.raises(ConnectionError, match="circuit breaker is open"):
+            redis_config.set(name=_var_name, value="new value")
+        assert len(_calls) == 3
+
+        # A failed trial opens it again
+        time.sleep(0.25)
+        assert redis_config.resilience_stats()["state"] == "half-open"
+        with pytest.raises(redis.exceptions.ConnectionError):
+            redis_config.get(name=_var_name)
+        assert redis_config.resilience_stats()["state"] == "open"
+
+        # A successful trial closes it
+        monkeypatch.undo()
+        time.sleep(0.25)
+        assert redis_config.get(name=_var_name) == "value"
+        assert redis_config.resilience_stats()["state"] == "closed"
+        assert redis_config.resilience_stats()["failures"] == 0
+
+        self._recover(redis_config, monkeypatch)
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+
+
+    #
+    # Tags, streams and existence checks go through the breaker as well
+    #
+    def test_breaker_other_calls(self, redis_config, monkeypatch):
+        _var_name = "resilience_other_var"
+        redis_config.register(name=_var_name, value="value", backing_store="redis",
+                tags="resilience_tag")
+        redis_config.set_stream(name="resilience_stream", data=b"stream")
+        redis_config.configure_resilience(failure_threshold=1)
+
+        self._break_redis(monkeypatch)
+        with pytest.raises(redis.exceptions.ConnectionError):
+            redis_config.get(name=_var_name)
+        monkeypatch.undo()
+        assert redis_config.resilience_stats()["state"] == "open"
+
+        # Redis is back, but the breaker is still open
+        _calls = [
+            lambda: redis_config._has_item_redis(name=_var_name),
+            lambda: redis_config.find(tag="resilience_tag"),
+            lambda: redis_config.delete_by_tag(tag="resilience_tag"),
+            lambda: redis_config.set_stream(name="resilience_stream", data=b"new"),
+            lambda: redis_config.get_stream(name="resilience_stream"),
+            lambda: redis_config.delete_stream(name="resilience_stream"),
+        ]
+        for _call in _calls:
+            with pytest.raises(ConnectionError, match="circuit breaker is open"):
+                _call()
+
+        self._recover(redis_config, monkeypatch)
+        assert b"".join(redis_config.get_stream(name="resilience_stream")) == b"stream"
+
+        # Delete the Items
+        redis_config.delete(name=_var_name)
+        redis_config.delete_stream(name="resilience_stream")
+
+
+    #
+    # The last known value is served while redis is unavailable
+    #
+    def test_serve_stale(self, redis_config, monkeypatch):
+        _var_name = "resilience_stale_var"
+        redis_config.register(name="resilience_no_stale_var", value="other",
+                backing_store="redis")
+
+        redis_config.configure_resilience(failure_threshold=1, serve_stale=True)
+        redis_config.register(name=_var_name, value="value", backing_store="redis")
+        redis_config._init_encryption(password="resilience_password")
+        redis_config.register(name="resilience_stale_encrypted", value="secret",
+                encrypt="aes-gcm", backing_store="redis")
+        assert redis_config.resilience_stats()["stale_items"] == 2
+
+        self._break_redis(monkeypatch)
+        assert redis_config.get(name=_var_name) == "value"
+        assert redis_config.resilience_stats()["state"] == "open"
+
+        # While the breaker is open
+        assert redis_config.get(name=_var_name) == "value"
+        assert redis_config.get(name="resilience_stale_encrypted") == "secret"
+        assert redis_config.get_many(names=[ _var_name, "resilience_stale_encrypted" ]) == \
+                { _var_name: "value", "resilience_stale_encrypted": "secret" }
+
+        # Items without a stale value
+        with pytest.raises(ConnectionError):
+            redis_config.get(name="resilience_no_stale_var")
+        with pytest.raises(ConnectionError):
+            redis_config.get_many(names=[ _var_name, "resilience_no_stale_var" ])
+
+        # Turning it off drops the stale values
+        redis_config.configure_resilience(serve_stale=False)
+        assert redis_config.resilience_stats()["stale_items"] == 0
+        with pytest.raises(ConnectionError):
+            redis_config.get(name=_var_name)
+
+        self._recover(redis_config, monkeypatch)
+
+        # Delete the Items
+        redis_config.delete(name=_var_name)
+        redis_config.delete(name="resilience_no_stale_var")
+        redis_config.delete(name="resilience_stale_encrypted")
+
+
+    #
+    # Stale values are dropped when the item is deleted or expires, and are limited in size
+    #
+    def test_stale_dropped(self, redis_config, monkeypatch):
+        redis_config.configure_resilience(failure_threshold=1, serve_stale=True)
+        redis_config.register(name="resilience_deleted", value="value", backing_store="redis")
+        redis_config.register(name="resilience_expired", value="value", backing_store="redis",
+                timeout=0.2)
+        redis_config.register(name="resilience_kept", value="value", backing_store="redis")
+        assert redis_config.resilience_stats()["stale_items"] == 3
+
+        redis_config.delete(name="resilience_deleted")
+        assert redis_config.resilience_stats()["stale_items"] == 2
+
+        time.sleep(0.3)
+        assert redis_config.get(name="resilience_expired") is None
+        assert redis_config.resilience_stats()["stale_items"] == 1
+
+        # The least recently updated are dropped first
+        redis_config.configure_resilience(stale_max_bytes=2000)
+        redis_config.register(name="resilience_large_1", value="x" * 1500,
+                backing_store="redis")
+        assert redis_config.resilience_stats()["stale_items"] == 2
+        redis_config.register(name="resilience_large_2", value="y" * 1500,
+                backing_store="redis")
+        assert redis_config.resilience_stats()["stale_items"] == 1
+        assert redis_config.resilience_stats()["stale_bytes"] <= 2000
+
+        self._break_redis(monkeypatch)
+        assert redis_config.get(name="resilience_large_2") == "y" * 1500
+        with pytest.raises(ConnectionError):
+            redis_config.get(name="resilience_kept")
+
+        self._recover(redis_config, monkeypatch)
+
+        # Delete the Items
+        redis_config.delete(name="resilience_kept")
+        redis_config.delete(name="resilience_large_1")
+        redis_config.delete(name="resilience_large_2")
+
+
+    #
+    # Invalid settings
+    #
+    def test_resilience_invalid(self, redis_config):
+        with pytest.raises(ValueError):
+            redis_config.configure_resilience(failure_threshold=0)
+
+        with pytest.raises(ValueError):
+            redis_config.configure_resilience(reset_timeout=-1)
+
+        with pytest.raises(ValueError):
+            redis_config.configure_resilience(deadline_ms=-1)
+
+        with pytest.raises(ValueError):
+            redis_config.configure_resilience(stale_max_bytes=-1)
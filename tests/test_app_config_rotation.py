@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_rotation.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Key rotation
+*
+'''
+import pytest
+import redis
+import time
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigRotation():
+    #
+    # Items are re-encrypted with the new key as they are read
+    #
+    def test_rotate_on_read(self):
+        _items = { "rotation_fernet": True, "rotation_aes": "aes-gcm" }
+
+        pytest.appconfig._init_encryption(password="rotation_old")
+        for _name, _cipher in _items.items():
+            pytest.appconfig.register(name=_name, value={ "name": _name }, encrypt=_cipher)
+
+        _old_values = { _name: pytest.appconfig._get_local(name=_name) for _name in _items }
+
+        pytest.appconfig.configure_rekey(interval=0)
+        pytest.appconfig.rotate_key(password="rotation_new")
+
+        for _name in _items:
+            assert pytest.appconfig.get(name=_name) == { "name": _name }
+
+        # Wait for the background thread
+        for _ in range(100):
+            if all(pytest.appconfig._get_local(name=_name) != _old_values[_name]
+                    for _name in _items):
+                break
+            time.sleep(0.05)
+
+        # Only the new key is needed now
+        pytest.appconfig._init_encryption(password="rotation_new")
+        for _name in _items:
+            assert pytest.appconfig.get(name=_name) == { "name": _name }
+
+        # Delete the Items
+        for _name in _items:
+            pytest.appconfig.delete(name=_name)
+
+        pytest.appconfig.configure_rekey(interval=0.1)
+
+
+    #
+    # Old passwords decrypt values from before a rotation
+    #
+    def test_old_passwords(self):
+        _var_name = "rotation_old_passwords"
+
+        pytest.appconfig._init_encryption(password="rotation_old")
+        pytest.appconfig.register(name=_var_name, value="value", encrypt="chacha20-poly1305")
+
+        # The old key isn't available
+        pytest.appconfig._init_encryption(password="rotation_new")
+        with pytest.raises(ValueError):
+            pytest.appconfig.get(name=_var_name)
+
+        pytest.appconfig._init_encryption(password="rotation_new",
+                old_passwords=[ "rotation_old" ])
+        assert pytest.appconfig.get(name=_var_name) == "value"
+
+        # Reading the item also queued it, so it may already be done
+        pytest.appconfig.rekey(background=False)
+        assert pytest.appconfig.rekey(background=False) == 0
+
+        pytest.appconfig._init_encryption(password="rotation_new")
+        assert pytest.appconfig.get(name=_var_name) == "value"
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
+
+
+    #
+    # Redis items keep their timeout when re-encrypted
+    #
+    def test_rekey_redis(self, redis_config):
+        _var_name = "rotation_redis"
+        _client = redis.Redis(host="localhost", decode_responses=True)
+
+        redis_config._init_encryption(password="rotation_old")
+        redis_config.register(name=_var_name, value="value", encrypt=True, timeout=60,
+                backing_store="redis")
+        _old_value = _client.get(_var_name)
+
+        redis_config.rotate_key(password="rotation_new")
+        assert redis_config.rekey(background=False) == 1
+
+        assert _client.get(_var_name) != _old_value
+        assert 0 < _client.pttl(_var_name) <= 60000
+
+        redis_config._init_encryption(password="rotation_new")
+        assert redis_config.get(name=_var_name) == "value"
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+        _client.close()
+
+
+    #
+    # Encrypted binary items in redis are re-encrypted too
+    #
+    def test_rekey_redis_binary(self, redis_config):
+        _var_name = "rotation_redis_binary"
+        _value = b"\x00\x01\xff binary"
+
+        redis_config._init_encryption(password="rotation_old")
+        redis_config.register(name=_var_name, value=_value, binary=True, encrypt="aes-gcm",
+                backing_store="redis")
+
+        redis_config.rotate_key(password="rotation_new")
+        assert redis_config.rekey(background=False) == 1
+
+        redis_config._init_encryption(password="rotation_new")
+        assert redis_config.get(name=_var_name) == _value
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+
+
+    #
+    # Items that can't be re-encrypted in the background are reported
+    #
+    def test_rekey_errors(self, redis_config, monkeypatch):
+        _var_name = "rotation_errors"
+
+        redis_config._init_encryption(password="rotation_old")
+        redis_config.register(name=_var_name, value="value", encrypt="aes-gcm",
+                backing_store="redis")
+        redis_config.configure_rekey(interval=0)
+        redis_config.rotate_key(password="rotation_new")
+
+        # Re-encryption goes through the circuit breaker
+        def _broken_pipeline(self, *args, **kwargs):
+            raise redis.exceptions.ConnectionError("Redis is down")
+
+        monkeypatch.setattr(redis.Redis, "pipeline", _broken_pipeline)
+        redis_config.rekey()
+
+        for _ in range(100):
+            if _var_name in redis_config.rekey_errors(): break
+            time.sleep(0.01)
+
+        assert isinstance(redis_config.rekey_errors()[_var_name],
+                redis.exceptions.ConnectionError)
+        assert redis_config.resilience_stats()["failures"] >= 1
+
+        # Once it works, the error is cleared
+        monkeypatch.undo()
+        redis_config.rekey()
+
+        for _ in range(100):
+            if _var_name not in redis_config.rekey_errors(): break
+            time.sleep(0.01)
+
+        assert redis_config.rekey_errors() == {}
+
+        redis_config._init_encryption(password="rotation_new")
+        assert redis_config.get(name=_var_name) == "value"
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+        redis_config.configure_rekey(interval=0.1)
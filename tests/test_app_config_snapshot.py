@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_snapshot.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Snapshots
+*
+'''
+import pytest
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigSnapshot():
+    #
+    # A snapshot doesn't see changes made after it was taken
+    #
+    def test_snapshot(self):
+        pytest.appconfig.register(name="snapshot_a", value="a_1")
+        pytest.appconfig.register(name="snapshot_b", value="b_1")
+        pytest.appconfig.register(name="snapshot_c", value="c_1")
+        _generation = pytest.appconfig.generation()
+
+        with pytest.appconfig.snapshot() as _snap:
+            assert _snap.generation == _generation
+
+            pytest.appconfig.set(name="snapshot_a", value="a_2")
+            pytest.appconfig.set(name="snapshot_a", value="a_3")
+            pytest.appconfig.delete(name="snapshot_b")
+            pytest.appconfig.register_many(items={ "snapshot_c": "c_2", "snapshot_d": "d_2" },
+                    overwrite=True)
+            assert pytest.appconfig.generation() > _generation
+
+            # The snapshot still sees the original values
+            assert _snap.get(name="snapshot_a") == "a_1"
+            assert _snap.get(name="snapshot_b") == "b_1"
+            assert _snap.get(name="snapshot_c") == "c_1"
+            assert _snap.get(name="snapshot_d", default="missing") == "missing"
+            assert not _snap.has_item(name="snapshot_d")
+
+            # A later snapshot sees the later values
+            with pytest.appconfig.snapshot() as _later:
+                assert _later.get(name="snapshot_a") == "a_3"
+                assert not _later.has_item(name="snapshot_b")
+                assert _later.get(name="snapshot_d") == "d_2"
+
+            assert _snap.get(name="snapshot_a") == "a_1"
+
+        with pytest.raises(RuntimeError):
+            _snap.get(name="snapshot_a")
+
+        # Delete the Items
+        for _name in ( "snapshot_a", "snapshot_c", "snapshot_d" ):
+            pytest.appconfig.delete(name=_name)
+
+
+    #
+    # Encrypted items are decrypted when read from a snapshot
+    #
+    def test_snapshot_encrypted(self):
+        pytest.appconfig._init_encryption(password="snapshot_password")
+        pytest.appconfig.register(name="snapshot_encrypted", value="secret_1", encrypt=True)
+
+        with pytest.appconfig.snapshot() as _snap:
+            pytest.appconfig.set(name="snapshot_encrypted", value="secret_2")
+
+            assert _snap.get(name="snapshot_encrypted") == "secret_1"
+            assert pytest.appconfig.get(name="snapshot_encrypted") == "secret_2"
+
+        # Delete the Item
+        pytest.appconfig.delete(name="snapshot_encrypted")
+
+
+    #
+    # Values are decoded with the registration they were stored with
+    #
+    def test_snapshot_registration(self):
+        pytest.appconfig._init_encryption(password="snapshot_password")
+        pytest.appconfig.register(name="snapshot_plain", value="plain_1")
+        pytest.appconfig.register(name="snapshot_secret", value="secret_1", encrypt=True)
+
+        with pytest.appconfig.snapshot() as _snap:
+            pytest.appconfig.register(name="snapshot_plain", value="plain_2", encrypt=True,
+                    overwrite=True)
+            pytest.appconfig.register(name="snapshot_secret", value="secret_2", overwrite=True)
+
+            assert _snap.get(name="snapshot_plain") == "plain_1"
+            assert _snap.get(name="snapshot_secret") == "secret_1"
+            assert pytest.appconfig.get(name="snapshot_plain") == "plain_2"
+            assert pytest.appconfig.get(name="snapshot_secret") == "secret_2"
+
+        # Delete the Items
+        pytest.appconfig.delete(name="snapshot_plain")
+        pytest.appconfig.delete(name="snapshot_secret")
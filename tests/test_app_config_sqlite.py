@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_sqlite.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - SQLite backing store
+*
+'''
+import pytest
+import json
+import sqlite3
+import time
+
+from src.application_config.sqlite_store import SQLiteStore
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigSQLite():
+    #
+    # Count the rows committed to the database
+    #
+    def _row_count(self, path=""):
+        _connection = sqlite3.connect(path)
+        _count = _connection.execute("SELECT COUNT(*) FROM config_items").fetchone()[0]
+        _connection.close()
+
+        return _count
+
+
+    #
+    # Set, get and delete an item
+    #
+    def test_sqlite(self, sqlite_config, tmp_path):
+        _var_name = "sqlite_var"
+        _path = str(tmp_path / "config.db")
+
+        sqlite_config.register(name=_var_name, value="initial", backing_store="sqlite")
+        assert sqlite_config.get(name=_var_name) == "initial"
+        assert sqlite_config.has_item(name=_var_name)
+
+        sqlite_config.set(name=_var_name, value="changed")
+        assert sqlite_config.get(name=_var_name) == "changed"
+        assert sqlite_config.get_many(names=[ _var_name ]) == { _var_name: "changed" }
+
+        # Values must be strings
+        with pytest.raises(TypeError):
+            sqlite_config.set(name=_var_name, value=1)
+
+        # Another connection sees the value once committed
+        sqlite_config.flush()
+        _store = SQLiteStore(path=_path)
+        assert _store.get(name=_var_name) == "changed"
+
+        # Delete the Item
+        sqlite_config.delete(name=_var_name)
+        assert not sqlite_config.has_item(name=_var_name)
+        with pytest.raises(KeyError, match="item does not exist in SQLite"):
+            sqlite_config._delete_sqlite(name=_var_name)
+
+        # Seen once the other connection checks for changes (after the batch interval)
+        sqlite_config.flush()
+        for _ in range(100):
+            if _store.get(name=_var_name) is None: break
+            time.sleep(0.01)
+
+        assert _store.get(name=_var_name) is None
+        _store.close()
+
+
+    #
+    # Writes are committed together
+    #
+    def test_sqlite_batch(self, sqlite_config, tmp_path):
+        _path = str(tmp_path / "config.db")
+        _items = { f"sqlite_batch_{_idx}": str(_idx) for _idx in range(10) }
+
+        sqlite_config._init_sqlite(path=_path, batch_size=1000, batch_interval=60)
+        sqlite_config.register_many(items=_items, backing_store="sqlite")
+
+        # Nothing is committed until the batch is flushed, but reads see the values
+        assert self._row_count(path=_path) == 0
+        assert sqlite_config.get_many(names=list(_items.keys())) == _items
+
+        assert sqlite_config.flush() == len(_items)
+        assert self._row_count(path=_path) == len(_items)
+
+        # A full batch is committed straight away
+        sqlite_config._init_sqlite(path=_path, batch_size=5, batch_interval=60)
+        for _idx in range(5):
+            sqlite_config.set(name=f"sqlite_batch_{_idx}", value="full")
+
+        _store = SQLiteStore(path=_path)
+        assert _store.get(name="sqlite_batch_4") == "full"
+        _store.close()
+
+        # Writes are committed after the interval
+        sqlite_config._init_sqlite(path=_path, batch_interval=0.01)
+        sqlite_config.set(name="sqlite_batch_0", value="timer")
+
+        _store = SQLiteStore(path=_path)
+        for _ in range(100):
+            if _store.get(name="sqlite_batch_0") == "timer": break
+            time.sleep(0.05)
+
+        assert _store.get(name="sqlite_batch_0") == "timer"
+        _store.close()
+
+        # Delete the Items
+        for _name in _items.keys():
+            sqlite_config.delete(name=_name)
+
+
+    #
+    # Changes made by another connection clear the cache
+    #
+    def test_sqlite_other_connection(self, sqlite_config, tmp_path):
+        _var_name = "sqlite_other_var"
+        _path = str(tmp_path / "config.db")
+
+        sqlite_config.register(name=_var_name, value="initial", backing_store="sqlite")
+        sqlite_config.flush()
+        assert sqlite_config.get(name=_var_name) == "initial"
+
+        _store = SQLiteStore(path=_path)
+        _store.set(name=_var_name, value="other")
+        _store.flush()
+        _store.close()
+
+        # The data version is checked at most once per batch interval
+        for _ in range(100):
+            if sqlite_config.get(name=_var_name) == "other": break
+            time.sleep(0.01)
+
+        assert sqlite_config.get(name=_var_name) == "other"
+
+        # Delete the Item
+        sqlite_config.delete(name=_var_name)
+
+
+    #
+    # Only items that exist are cached, and deletes only until they are committed
+    #
+    def test_sqlite_cache(self, tmp_path):
+        _store = SQLiteStore(path=str(tmp_path / "cache.db"), batch_interval=60)
+        _cache = lambda: _store._SQLiteStore__cache
+
+        assert _store.get(name="sqlite_cache_missing") is None
+        assert _cache() == {}
+
+        _store.set(name="sqlite_cache_var", value="value")
+        _store.flush()
+        assert _store.get(name="sqlite_cache_var") == "value"
+
+        _store.delete(name="sqlite_cache_var")
+        assert _store.get(name="sqlite_cache_var") is None
+        assert _cache() == { "sqlite_cache_var": None }
+
+        _store.flush()
+        assert _cache() == {}
+        assert _store.get(name="sqlite_cache_var") is None
+
+        _store.close()
+
+
+    #
+    # A commit after the interval that fails is tried again
+    #
+    def test_sqlite_timer_retry(self, tmp_path, monkeypatch):
+        _path = str(tmp_path / "retry.db")
+        _store = SQLiteStore(path=_path, batch_interval=0.01)
+        _calls = []
+        _flush = _store.flush
+
+        def _failing_flush():
+            _calls.append(1)
+            if len(_calls) == 1: raise sqlite3.OperationalError("database is locked")
+            return _flush()
+
+        monkeypatch.setattr(_store, "flush", _failing_flush)
+        _store.set(name="sqlite_retry_var", value="value")
+
+        for _ in range(100):
+            if self._row_count(path=_path) == 1: break
+            time.sleep(0.01)
+
+        assert self._row_count(path=_path) == 1
+        assert len(_calls) >= 2
+
+        monkeypatch.undo()
+        _store.close()
+
+
+    #
+    # Expired items are removed from the database
+    #
+    def test_sqlite_expiry(self, sqlite_config, tmp_path):
+        _path = str(tmp_path / "config.db")
+
+        sqlite_config.register(name="sqlite_expiry_short", value="short", timeout=0.2,
+                backing_store="sqlite")
+        sqlite_config.register(name="sqlite_expiry_long", value="long", timeout=60,
+                backing_store="sqlite")
+        sqlite_config.flush()
+        assert self._row_count(path=_path) == 2
+
+        time.sleep(0.3)
+
+        assert not sqlite_config.has_item(name="sqlite_expiry_short")
+        assert sqlite_config.get_registration(name="sqlite_expiry_short") is None
+        assert sqlite_config.get(name="sqlite_expiry_long") == "long"
+        assert self._row_count(path=_path) == 1
+
+        # Delete the Item
+        sqlite_config.delete(name="sqlite_expiry_long")
+
+
+    #
+    # Nested values and transactions
+    #
+    def test_sqlite_transaction(self, sqlite_config, tmp_path):
+        _path = str(tmp_path / "config.db")
+
+        sqlite_config.register(name="sqlite_txn_a", value="a", backing_store="sqlite")
+        sqlite_config.register(name="sqlite_txn_b", value=json.dumps({ "db": { "port": 5432 } }),
+                backing_store="sqlite")
+        assert sqlite_config.get_path(path="sqlite_txn_b.db.port") == 5432
+
+        with sqlite_config.transaction() as _txn:
+            _txn.set(name="sqlite_txn_b", value="b")
+            _txn.delete(name="sqlite_txn_a")
+
+        # Committed straight away
+        _store = SQLiteStore(path=_path)
+        assert _store.get(name="sqlite_txn_a") is None
+        assert _store.get(name="sqlite_txn_b") == "b"
+        _store.close()
+
+        with pytest.raises(TypeError):
+            with sqlite_config.transaction() as _txn:
+                _txn.set(name="sqlite_txn_b", value=1)
+
+        assert sqlite_config.get(name="sqlite_txn_b") == "b"
+
+        # Delete the Item
+        sqlite_config.delete(name="sqlite_txn_b")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_startup.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Startup (imports and key derivation)
+*
+'''
+import pytest
+import os
+import subprocess
+import sys
+
+from src.application_config.application_config import ApplicationConfig
+
+#
+# Constants
+#
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigStartup():
+    #
+    # Importing the module should not import redis or crypto_tools
+    #
+    def test_lazy_imports(self):
+        _code = "; ".join([
+            "import sys",
+            "import src.application_config",
+            "print('redis' in sys.modules, 'crypto_tools' in sys.modules)"
+        ])
+
+        _result = subprocess.run([ sys.executable, "-c", _code ], cwd=REPO_ROOT,
+                capture_output=True, text=True, check=True)
+
+        assert _result.stdout.strip() == "False False"
+
+
+    #
+    # Key derived in a background thread
+    #
+    def test_background_key_derivation(self):
+        _var_name = "background_key_var"
+        _var_value = "background_key_string"
+
+        # Make sure the value doesn't exist
+        assert not pytest.appconfig.has_item(_var_name)
+
+        ApplicationConfig(password="background_password", derive_in_background=True)
+
+        # Register the value (waits for the key if still being derived)
+        pytest.appconfig.register(name=_var_name, value=_var_value, encrypt=True)
+
+        assert pytest.appconfig.get(name=_var_name) == _var_value
+        assert pytest.appconfig._get_local(name=_var_name) != _var_value
+
+        # Delete the Item
+        pytest.appconfig.delete(name=_var_name)
+
+
+    #
+    # Derived keys are cached in the process
+    #
+    def test_key_cache(self, monkeypatch):
+        import crypto_tools
+
+        _password = "key_cache_password"
+        _derive_key = crypto_tools.fernet.derive_key
+        _calls = []
+
+        def _counting_derive_key(**kwargs):
+            _calls.append(kwargs)
+            return _derive_key(**kwargs)
+
+        monkeypatch.setattr(crypto_tools.fernet, "derive_key", _counting_derive_key)
+
+        # The first encrypted operation derives the key, later ones use the cache
+        for _ in range(3):
+            ApplicationConfig(password=_password)
+            pytest.appconfig.register(name="key_cache_var", value="key_cache_string",
+                    encrypt=True, overwrite=True)
+            assert pytest.appconfig.get(name="key_cache_var") == "key_cache_string"
+
+        assert len(_calls) == 1
+
+        # Delete the Item
+        pytest.appconfig.delete(name="key_cache_var")
+
+
+    #
+    # Derived keys shared between processes with a key file
+    #
+    def test_key_file(self, monkeypatch, tmp_path):
+        import crypto_tools
+
+        _password = "key_file_password"
+        _key_file = str(tmp_path / "keys.json")
+
+        # Derive the key and save it to the key file
+        ApplicationConfig._clear_key_cache()
+        ApplicationConfig(password=_password, key_file=_key_file)
+        pytest.appconfig.register(name="key_file_var", value="key_file_string",
+                encrypt=True)
+
+        assert os.stat(_key_file).st_mode & 0o777 == 0o600
+
+        # As if a new process - the key should come from the file
+        def _no_derive_key(**kwargs):
+            raise AssertionError("derive_key should not be called")
+
+        monkeypatch.setattr(crypto_tools.fernet, "derive_key", _no_derive_key)
+        ApplicationConfig._clear_key_cache()
+        ApplicationConfig(password=_password, key_file=_key_file)
+        assert pytest.appconfig.get(name="key_file_var") == "key_file_string"
+
+        # A key file others can read should be rejected
+        os.chmod(_key_file, 0o644)
+        ApplicationConfig._clear_key_cache()
+        ApplicationConfig(password=_password, key_file=_key_file)
+        with pytest.raises(PermissionError):
+            pytest.appconfig.get(name="key_file_var")
+
+        # Delete the Item
+        pytest.appconfig.delete(name="key_file_var")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_stream.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Streams
+*
+'''
+import pytest
+import io
+import json
+import os
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigStream():
+    #
+    # A value is split in to chunks, and read back a chunk at a time
+    #
+    def test_stream(self, redis_config):
+        _name = "stream_var"
+        _value = os.urandom(10000)
+
+        assert redis_config.set_stream(name=_name, data=_value, chunk_size=1024) == 10000
+
+        _chunks = list(redis_config.get_stream(name=_name, batch_chunks=3))
+        assert len(_chunks) == 10
+        assert all(len(_chunk) == 1024 for _chunk in _chunks[:-1])
+        assert b"".join(_chunks) == _value
+
+        # Streams aren't config items
+        assert not redis_config.has_item(name=_name)
+
+        # Delete the Stream
+        assert redis_config.delete_stream(name=_name)
+        assert redis_config.get_stream(name=_name) is None
+
+        with pytest.raises(KeyError):
+            redis_config.delete_stream(name=_name)
+
+
+    #
+    # Iterables (of any sized pieces) and files
+    #
+    def test_stream_sources(self, redis_config, tmp_path):
+        _name = "stream_sources_var"
+
+        _pieces = [ b"a" * 5, "b" * 300, bytearray(b"c" * 2000), memoryview(b"d" * 7) ]
+        assert redis_config.set_stream(name=_name, data=iter(_pieces), chunk_size=256) == 2312
+        assert b"".join(redis_config.get_stream(name=_name)) == \
+                b"a" * 5 + b"b" * 300 + b"c" * 2000 + b"d" * 7
+
+        _path = tmp_path / "stream.bin"
+        _path.write_bytes(b"file contents" * 1000)
+        with open(_path, "rb") as _file:
+            redis_config.set_stream(name=_name, data=_file, chunk_size=4096)
+        assert b"".join(redis_config.get_stream(name=_name)) == b"file contents" * 1000
+
+        redis_config.set_stream(name=_name, data=io.StringIO("text"))
+        assert list(redis_config.get_stream(name=_name)) == [ b"text" ]
+
+        redis_config.set_stream(name=_name, data=b"")
+        assert list(redis_config.get_stream(name=_name)) == []
+
+        # Delete the Stream
+        redis_config.delete_stream(name=_name)
+
+
+    #
+    # Readers of a replaced version can finish reading it
+    #
+    def test_stream_replace(self, redis_config):
+        _name = "stream_replace_var"
+
+        redis_config.set_stream(name=_name, data=b"1" * 100, chunk_size=10)
+        _old = redis_config.get_stream(name=_name, batch_chunks=1)
+        assert next(_old) == b"1" * 10
+
+        redis_config.set_stream(name=_name, data=b"2" * 100, chunk_size=10)
+        assert b"".join(_old) == b"1" * 90
+        assert b"".join(redis_config.get_stream(name=_name)) == b"2" * 100
+
+        # Delete the Stream
+        redis_config.delete_stream(name=_name)
+
+
+    #
+    # The stream expires after the timeout (the manifest no later than its chunks)
+    #
+    def test_stream_timeout(self, redis_config):
+        _name = "stream_timeout_var"
+        _redis = redis_config._ApplicationConfig__redis
+
+        redis_config.set_stream(name=_name, data=b"1" * 100, chunk_size=10, timeout=10)
+
+        _key = f"__stream__:{{{_name}}}"
+        _manifest = json.loads(_redis.get(_key))
+        _chunk_ttls = [ _redis.pttl(f"{_key}:{_manifest['version']}:{_index}")
+                for _index in range(_manifest["chunks"]) ]
+        _manifest_ttl = _redis.pttl(_key)
+        assert len(_chunk_ttls) == 10
+        assert 0 < _manifest_ttl <= 10000
+        assert all(_manifest_ttl <= _ttl <= 10000 for _ttl in _chunk_ttls)
+
+        # Delete the Stream
+        redis_config.delete_stream(name=_name)
+        assert not _redis.exists(_key, *[ f"{_key}:{_manifest['version']}:{_index}"
+                for _index in range(_manifest["chunks"]) ])
+
+
+    #
+    # Invalid arguments
+    #
+    def test_stream_invalid(self, redis_config):
+        with pytest.raises(ValueError):
+            redis_config.set_stream(name="stream_invalid_var", data=b"x", chunk_size=0)
+
+        with pytest.raises(TypeError):
+            redis_config.set_stream(name="stream_invalid_var", data=[ 1, 2, 3 ])
+
+        assert redis_config.get_stream(name="stream_invalid_var") is None
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_tags.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Tags
+*
+'''
+import pytest
+import redis
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigTags():
+    #
+    # Find, get and delete local items by tag
+    #
+    def test_tags_local(self):
+        pytest.appconfig.register(name="tags_a", value="a", tags=[ "tenant_x", "pricing" ])
+        pytest.appconfig.register(name="tags_b", value="b", tags="tenant_x")
+        pytest.appconfig.register_many(items={ "tags_c": "c", "tags_d": "d" }, tags="pricing")
+
+        assert pytest.appconfig.find(tag="tenant_x") == [ "tags_a", "tags_b" ]
+        assert pytest.appconfig.find(tag="pricing") == [ "tags_a", "tags_c", "tags_d" ]
+        assert pytest.appconfig.find(tag="unknown") == []
+
+        assert pytest.appconfig.get_by_tag(tag="tenant_x") == { "tags_a": "a", "tags_b": "b" }
+
+        # Registering again replaces the tags
+        pytest.appconfig.register(name="tags_b", value="b", tags="pricing", overwrite=True)
+        assert pytest.appconfig.find(tag="tenant_x") == [ "tags_a" ]
+
+        assert pytest.appconfig.delete_by_tag(tag="pricing") == 4
+        for _name in ( "tags_a", "tags_b", "tags_c", "tags_d" ):
+            assert not pytest.appconfig.has_item(name=_name)
+
+        assert pytest.appconfig.find(tag="tenant_x") == []
+
+
+    #
+    # Redis items can be found by tag from other processes
+    #
+    def test_tags_redis(self, redis_config):
+        redis_config.register(name="tags_redis_a", value="a", backing_store="redis",
+                tags="tenant_y")
+        redis_config.register(name="tags_redis_b", value="b", backing_store="redis",
+                tags="tenant_y")
+
+        # As if registered by another process
+        _other = redis.Redis(host="localhost", decode_responses=True)
+        _other.set("tags_redis_other", "other")
+        _other.sadd("__tag__:tenant_y", "tags_redis_other", "tags_redis_gone")
+
+        assert redis_config.find(tag="tenant_y") == [
+            "tags_redis_a", "tags_redis_b", "tags_redis_other" ]
+        assert redis_config.get_by_tag(tag="tenant_y") == {
+            "tags_redis_a": "a", "tags_redis_b": "b", "tags_redis_other": "other" }
+
+        # Deleting an item removes it from the tag
+        redis_config.delete(name="tags_redis_b")
+        assert redis_config.find(tag="tenant_y") == [ "tags_redis_a", "tags_redis_other" ]
+
+        assert redis_config.delete_by_tag(tag="tenant_y") == 2
+        assert redis_config._get_redis(name="tags_redis_a") is None
+        assert redis_config._get_redis(name="tags_redis_other") is None
+        assert redis_config.find(tag="tenant_y") == []
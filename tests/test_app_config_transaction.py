@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_transaction.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Transactions
+*
+'''
+import pytest
+
+import redis
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigTransaction():
+    #
+    # Changes are applied together when the block completes
+    #
+    def test_transaction_local(self):
+        pytest.appconfig.register(name="txn_a", value="a_1")
+        pytest.appconfig.register(name="txn_b", value="b_1")
+        _generation = pytest.appconfig.generation()
+
+        with pytest.appconfig.transaction() as _txn:
+            _txn.set(name="txn_a", value="a_2")
+            _txn.set(name="txn_c", value="c_2")
+            _txn.delete(name="txn_b")
+
+            # Nothing is applied until the block completes
+            assert pytest.appconfig.get(name="txn_a") == "a_1"
+            assert not pytest.appconfig.has_item(name="txn_c")
+
+        assert pytest.appconfig.generation() == _generation + 1
+        assert pytest.appconfig.get(name="txn_a") == "a_2"
+        assert pytest.appconfig.get(name="txn_c") == "c_2"
+        assert not pytest.appconfig.has_item(name="txn_b")
+        assert not pytest.appconfig.get_registration(name="txn_b")
+
+        # Delete the Items
+        pytest.appconfig.delete(name="txn_a")
+        pytest.appconfig.delete(name="txn_c")
+
+
+    #
+    # Changes are discarded on an exception, and checked when staged
+    #
+    def test_transaction_rollback(self):
+        pytest.appconfig.register(name="txn_rollback", value="original")
+        pytest.appconfig.register(name="txn_constant", value="constant", constant=True)
+
+        with pytest.raises(RuntimeError):
+            with pytest.appconfig.transaction() as _txn:
+                _txn.set(name="txn_rollback", value="changed")
+                raise RuntimeError("abort")
+
+        assert pytest.appconfig.get(name="txn_rollback") == "original"
+
+        with pytest.appconfig.transaction() as _txn:
+            _txn.set(name="txn_rollback", value="changed")
+            with pytest.raises(TypeError, match=pytest.EXCEPTION_MATCH_CONSTANT):
+                _txn.set(name="txn_constant", value="changed")
+
+        assert pytest.appconfig.get(name="txn_rollback") == "changed"
+        assert pytest.appconfig.get(name="txn_constant") == "constant"
+
+        with pytest.raises(RuntimeError):
+            _txn.set(name="txn_rollback", value="again")
+
+        # Delete the Items
+        pytest.appconfig.delete(name="txn_rollback")
+        pytest.appconfig.delete(name="txn_constant")
+
+
+    #
+    # Redis and local items in the same transaction
+    #
+    def test_transaction_redis(self, redis_config):
+        redis_config.register(name="txn_redis_a", value="a_1", backing_store="redis")
+        redis_config.register(name="txn_redis_b", value="b_1", backing_store="redis",
+                tags="txn_tag")
+        redis_config.register(name="txn_redis_c", value="c_1", backing_store="redis",
+                tags="txn_tag")
+
+        with pytest.raises(TypeError):
+            with redis_config.transaction() as _txn:
+                _txn.set(name="txn_redis_a", value=1)
+
+        with redis_config.transaction() as _txn:
+            _txn.set(name="txn_redis_a", value="a_2")
+            _txn.delete(name="txn_redis_b")
+            _txn.set(name="txn_redis_local", value="local")
+
+        assert redis_config._get_redis(name="txn_redis_a") == "a_2"
+        assert redis_config._get_redis(name="txn_redis_b") is None
+        assert not redis_config.has_item(name="txn_redis_b")
+        assert redis_config.get(name="txn_redis_local") == "local"
+
+        # Deleted items are removed from their tags in redis
+        _other = redis.Redis(host="localhost", decode_responses=True)
+        assert _other.smembers("__tag__:txn_tag") == { "txn_redis_c" }
+        assert redis_config.get_by_tag(tag="txn_tag") == { "txn_redis_c": "c_1" }
+
+        # Delete the Items
+        redis_config.delete(name="txn_redis_a")
+        redis_config.delete(name="txn_redis_c")
+        redis_config.delete(name="txn_redis_local")
+
+
+    #
+    # Binary items alongside encrypted items (which are converted to strings)
+    #
+    def test_transaction_binary(self, redis_config, sqlite_config):
+        redis_config._init_encryption(password="txn_password")
+        redis_config.register(name="txn_encrypted", value="secret_1", encrypt=True,
+                backing_store="redis")
+        redis_config.register(name="txn_binary_redis", value=b"\x00", binary=True,
+                backing_store="redis")
+        sqlite_config.register(name="txn_binary_sqlite", value=b"\x00", binary=True,
+                backing_store="sqlite")
+
+        with redis_config.transaction() as _txn:
+            _txn.set(name="txn_encrypted", value="secret_2")
+            _txn.set(name="txn_binary_redis", value=bytearray(b"\xff\x01"))
+            _txn.set(name="txn_binary_sqlite", value=memoryview(b"\xff\x02"))
+
+        assert redis_config.get(name="txn_encrypted") == "secret_2"
+        assert redis_config._get_redis(name="txn_binary_redis") == b"\xff\x01"
+        assert sqlite_config.get(name="txn_binary_sqlite") == b"\xff\x02"
+
+        # Delete the Items
+        redis_config.delete(name="txn_encrypted")
+        redis_config.delete(name="txn_binary_redis")
+        sqlite_config.delete(name="txn_binary_sqlite")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_ttl.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Expiry (timeouts)
+*
+'''
+import pytest
+import time
+
+from src.application_config.application_config import ApplicationConfig, \
+        EXPIRY_COMPACT_SIZE
+
+#
+# Constants
+#
+TIMEOUT = 0.2
+
+# How late an item may expire (allowing for a slow test machine)
+TOLERANCE = 0.1
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigTTL():
+    #
+    # Wait for an item to expire, and return how long it took
+    #
+    def _time_to_expiry(self, config, name="", start=0):
+        while config.has_item(name=name):
+            time.sleep(0.005)
+
+        return time.monotonic() - start
+
+
+    #
+    # Fractional timeouts on local items
+    #
+    def test_ttl_local(self):
+        _start = time.monotonic()
+        pytest.appconfig.register(name="ttl_local_var", value="ttl_value", timeout=TIMEOUT)
+
+        _elapsed = self._time_to_expiry(pytest.appconfig, name="ttl_local_var", start=_start)
+        assert TIMEOUT <= _elapsed < TIMEOUT + TOLERANCE
+
+
+    #
+    # Setting an item again restarts its timeout (the earlier deadline is ignored)
+    #
+    def test_ttl_reset(self):
+        pytest.appconfig.register(name="ttl_reset_var", value="ttl_value", timeout=TIMEOUT)
+        time.sleep(TIMEOUT / 2)
+
+        _start = time.monotonic()
+        pytest.appconfig.set(name="ttl_reset_var", value="ttl_value_2")
+
+        _elapsed = self._time_to_expiry(pytest.appconfig, name="ttl_reset_var", start=_start)
+        assert TIMEOUT <= _elapsed < TIMEOUT + TOLERANCE
+
+        # Registering again without a timeout clears the earlier deadline
+        pytest.appconfig.register(name="ttl_reset_var", value="ttl_value", timeout=TIMEOUT)
+        pytest.appconfig.register(name="ttl_reset_var", value="ttl_value", overwrite=True)
+        time.sleep(TIMEOUT + TOLERANCE)
+        assert pytest.appconfig.get(name="ttl_reset_var") == "ttl_value"
+
+        # Delete the Item
+        pytest.appconfig.delete(name="ttl_reset_var")
+
+
+    #
+    # Replaced deadlines don't build up in the expiry heap
+    #
+    def test_ttl_compact(self):
+        pytest.appconfig.register(name="ttl_compact_short", value="short", timeout=TIMEOUT)
+        pytest.appconfig.register(name="ttl_compact_var", value=0, timeout=3600)
+        for _idx in range(EXPIRY_COMPACT_SIZE * 3):
+            pytest.appconfig.set(name="ttl_compact_var", value=_idx)
+
+        assert len(ApplicationConfig._ApplicationConfig__conf_expiry) <= EXPIRY_COMPACT_SIZE + 1
+
+        # The latest deadlines are kept
+        time.sleep(TIMEOUT + TOLERANCE)
+        assert not pytest.appconfig.has_item(name="ttl_compact_short")
+        assert pytest.appconfig.get(name="ttl_compact_var") == EXPIRY_COMPACT_SIZE * 3 - 1
+        assert "ttl_compact_var" in ApplicationConfig._ApplicationConfig__expiry_deadlines
+
+        # Delete the Item
+        pytest.appconfig.delete(name="ttl_compact_var")
+
+
+    #
+    # Fractional timeouts on redis items (set with PX)
+    #
+    def test_ttl_redis(self, redis_config):
+        _start = time.monotonic()
+        redis_config.register(name="ttl_redis_var", value="ttl_value", timeout=TIMEOUT,
+                backing_store="redis")
+
+        assert redis_config._get_redis(name="ttl_redis_var") == "ttl_value"
+
+        _elapsed = self._time_to_expiry(redis_config, name="ttl_redis_var", start=_start)
+        assert TIMEOUT <= _elapsed < TIMEOUT + TOLERANCE
+
+        # Redis expires the key at the same time
+        time.sleep(0.05)
+        assert redis_config._get_redis(name="ttl_redis_var") is None
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_watch.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Reloading config files
+*
+'''
+import pytest
+import json
+import threading
+import time
+
+from src.application_config.application_config import ApplicationConfig
+from src.application_config.watcher import FileWatcher
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigWatch():
+    #
+    # Only the items that changed in the file are changed
+    #
+    def test_reload_file(self, tmp_path):
+        _path = tmp_path / "watch.json"
+        _values = { "name": "first", "service": { "port": 80 }, "old": "removed later" }
+        _path.write_text(json.dumps(_values))
+
+        assert pytest.appconfig.watch_file(path=str(_path), namespace="watch",
+                interval=60) == { "added": 3, "changed": 0, "removed": 0 }
+        assert pytest.appconfig.get(name="watch.name") == "first"
+
+        # Nothing has changed
+        assert pytest.appconfig.reload_file(path=str(_path)) == \
+                { "added": 0, "changed": 0, "removed": 0 }
+
+        # The unchanged item is the same object (it wasn't set again)
+        _service = pytest.appconfig.get(name="watch.service")
+        _path.write_text(json.dumps({ "name": "second", "service": { "port": 80 },
+                "new": "added" }))
+
+        assert pytest.appconfig.reload_file(path=str(_path)) == \
+                { "added": 1, "changed": 1, "removed": 1 }
+        assert pytest.appconfig.get(name="watch.name") == "second"
+        assert pytest.appconfig.get(name="watch.new") == "added"
+        assert pytest.appconfig.get(name="watch.service") is _service
+        assert not pytest.appconfig.has_item(name="watch.old")
+
+        # Stop watching - the items are left
+        assert pytest.appconfig.unwatch_file(path=str(_path))
+        assert not pytest.appconfig.unwatch_file(path=str(_path))
+        assert pytest.appconfig.get(name="watch.name") == "second"
+
+        with pytest.raises(KeyError):
+            pytest.appconfig.reload_file(path=str(_path))
+
+        # Delete the Items
+        for _name in ( "name", "service", "new" ):
+            pytest.appconfig.delete(name=f"watch.{_name}")
+
+
+    #
+    # New, changed and removed items are applied together
+    #
+    def test_reload_together(self, tmp_path):
+        _path = tmp_path / "watch.json"
+        _path.write_text(json.dumps({ "version": 0 }))
+        pytest.appconfig.watch_file(path=str(_path), namespace="watch_together", interval=60)
+
+        _errors = []
+        _stop = threading.Event()
+
+        def _reader():
+            while not _stop.is_set():
+                # A new item is only seen with the version it came with (or later)
+                for _idx in range(1, 50):
+                    if pytest.appconfig.has_item(name=f"watch_together.item_{_idx}"):
+                        if pytest.appconfig.get(name="watch_together.version") < _idx:
+                            _errors.append(_idx)
+
+        _thread = threading.Thread(target=_reader)
+        _thread.start()
+        try:
+            for _idx in range(1, 50):
+                _path.write_text(json.dumps({ "version": _idx, f"item_{_idx}": _idx }))
+                assert pytest.appconfig.reload_file(path=str(_path)) == \
+                        { "added": 1, "changed": 1, "removed": 0 if _idx == 1 else 1 }
+        finally:
+            _stop.set()
+            _thread.join()
+
+        assert _errors == []
+
+        pytest.appconfig.unwatch_file(path=str(_path))
+
+        # Delete the Items
+        pytest.appconfig.delete(name="watch_together.version")
+        pytest.appconfig.delete(name="watch_together.item_49")
+
+
+    #
+    # Redis values are put back as they were stored if a reload fails part way
+    #
+    def test_reload_undo_redis(self, redis_config, tmp_path, monkeypatch):
+        _path = tmp_path / "watch.json"
+        _path.write_text(json.dumps({ "empty": "", "zero": "0" }))
+        redis_config.watch_file(path=str(_path), namespace="watch_undo_redis",
+                backing_store="redis", interval=60)
+
+        # Registering the new item fails (after the redis items are written)
+        def _broken_registration(cls, name=None, conf_meta=None):
+            raise RuntimeError("Registration failed")
+
+        monkeypatch.setattr(ApplicationConfig, "_ApplicationConfig__set_registration",
+                classmethod(_broken_registration))
+        _path.write_text(json.dumps({ "empty": "changed", "zero": "1", "new": "new" }))
+
+        with pytest.raises(RuntimeError):
+            redis_config.reload_file(path=str(_path))
+
+        monkeypatch.undo()
+        assert redis_config._get_redis(name="watch_undo_redis.empty") == ""
+        assert redis_config._get_redis(name="watch_undo_redis.zero") == "0"
+        assert redis_config._get_redis(name="watch_undo_redis.new") is None
+        assert not redis_config.has_item(name="watch_undo_redis.new")
+
+        redis_config.unwatch_file(path=str(_path))
+
+        # Delete the Items
+        redis_config.delete(name="watch_undo_redis.empty")
+        redis_config.delete(name="watch_undo_redis.zero")
+
+
+    #
+    # A reload that fails part way leaves the config as it was
+    #
+    def test_reload_undo(self, tmp_path):
+        _path = tmp_path / "watch.json"
+        _path.write_text(json.dumps({ "a": "1" }))
+
+        pytest.appconfig.watch_file(path=str(_path), namespace="watch_undo", interval=60)
+        pytest.appconfig.register(name="watch_undo.mine", value="mine", tags="undo")
+
+        # Changing a constant fails, after the new items were registered
+        pytest.appconfig.register(name="watch_undo.a", value="1", overwrite=True,
+                constant=True)
+        _path.write_text(json.dumps({ "a": "2", "b": "new", "mine": "from file" }))
+
+        with pytest.raises(TypeError):
+            pytest.appconfig.reload_file(path=str(_path))
+
+        assert pytest.appconfig.get(name="watch_undo.a") == "1"
+        assert not pytest.appconfig.has_item(name="watch_undo.b")
+        assert pytest.appconfig.get(name="watch_undo.mine") == "mine"
+        assert pytest.appconfig.get_registration(name="watch_undo.mine").tags == { "undo" }
+
+        # Registering a new item fails (it replaces a constant), so nothing is changed
+        pytest.appconfig.delete(name="watch_undo.a")
+        pytest.appconfig.register(name="watch_undo.a", value="1")
+        pytest.appconfig.register(name="watch_undo.c", value="3", constant=True)
+        _path.write_text(json.dumps({ "a": "2", "c": "from file" }))
+
+        with pytest.raises(TypeError):
+            pytest.appconfig.reload_file(path=str(_path))
+
+        assert pytest.appconfig.get(name="watch_undo.a") == "1"
+        assert pytest.appconfig.get(name="watch_undo.c") == "3"
+
+        pytest.appconfig.unwatch_file(path=str(_path))
+
+        # Delete the Items
+        pytest.appconfig.delete(name="watch_undo.a")
+        pytest.appconfig.delete(name="watch_undo.c")
+        pytest.appconfig.delete(name="watch_undo.mine")
+
+
+    #
+    # Changes are noticed in the background
+    #
+    def test_watch_background(self, tmp_path):
+        _path = tmp_path / "watch.env"
+        _path.write_text("WATCH_VALUE=first\nWATCH_OTHER=other\n")
+
+        _errors = []
+        pytest.appconfig.watch_file(path=str(_path), namespace="watch_bg", interval=0.01,
+                on_error=lambda path, error: _errors.append(( path, error )))
+        assert pytest.appconfig.get(name="watch_bg.WATCH_VALUE") == "first"
+
+        # A file that can't be parsed is tried again, but only reported once
+        _path.write_text("WATCH_VALUE\n")
+        time.sleep(0.1)
+        assert len(_errors) == 1
+        assert _errors[0][0] == str(_path)
+        assert isinstance(_errors[0][1], ValueError)
+        _path.write_text("WATCH_VALUE=changed value\nWATCH_OTHER=other\n")
+
+        for _ in range(100):
+            if pytest.appconfig.get(name="watch_bg.WATCH_VALUE") == "changed value": break
+            time.sleep(0.05)
+
+        assert pytest.appconfig.get(name="watch_bg.WATCH_VALUE") == "changed value"
+        assert pytest.appconfig.get(name="watch_bg.WATCH_OTHER") == "other"
+
+        pytest.appconfig.unwatch_file(path=str(_path))
+
+        # Delete the Items
+        pytest.appconfig.delete(name="watch_bg.WATCH_VALUE")
+        pytest.appconfig.delete(name="watch_bg.WATCH_OTHER")
+
+
+    #
+    # A reload that fails is tried again (without the file changing)
+    #
+    def test_watch_retry(self, tmp_path):
+        _path = tmp_path / "watch.json"
+        _path.write_text("{}")
+        _calls = []
+        _errors = []
+
+        def _callback(path):
+            _calls.append(path)
+            if len(_calls) == 1: raise ConnectionError("Store unavailable")
+
+        _watcher = FileWatcher(callback=_callback, interval=0.01,
+                on_error=lambda path, error: _errors.append(error))
+        _watcher.add(path=str(_path))
+        _path.write_text('{ "a": 1 }')
+
+        for _ in range(100):
+            if len(_calls) >= 2: break
+            time.sleep(0.05)
+
+        # Not called again once the reload worked
+        time.sleep(0.1)
+        assert len(_calls) == 2
+        assert len(_errors) == 1 and isinstance(_errors[0], ConnectionError)
+
+        _watcher.remove(path=str(_path))
+
+
+    #
+    # Items in other backing stores are changed in the transaction as well
+    #
+    def test_watch_sqlite(self, sqlite_config, tmp_path):
+        _path = tmp_path / "watch.json"
+        _path.write_text(json.dumps({ "host": "localhost" }))
+
+        sqlite_config.watch_file(path=str(_path), namespace="watch_sqlite",
+                backing_store="sqlite", interval=60)
+        assert sqlite_config._get_sqlite(name="watch_sqlite.host") == "localhost"
+
+        _path.write_text(json.dumps({ "host": "remote-host" }))
+        assert sqlite_config.reload_file(path=str(_path))["changed"] == 1
+        assert sqlite_config._get_sqlite(name="watch_sqlite.host") == "remote-host"
+
+        sqlite_config.unwatch_file(path=str(_path))
+
+        # Delete the Item
+        sqlite_config.delete(name="watch_sqlite.host")
+
+
+    #
+    # A file that can't be loaded isn't watched
+    #
+    def test_watch_invalid(self, tmp_path):
+        _path = tmp_path / "watch.json"
+        _path.write_text('{ "a": ')
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.watch_file(path=str(_path))
+
+        assert not pytest.appconfig.unwatch_file(path=str(_path))
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.watch_file(path=str(tmp_path / "watch.json"), interval=0)
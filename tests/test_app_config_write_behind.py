@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+'''
+* test_app_config_write_behind.py
+*
+* Copyright (c) 2025 Iocane Pty Ltd
+*
+* @author: Jason Piszcyk
+*
+* Tests for the application config class - Write-behind for Redis
+*
+'''
+import pytest
+import time
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Status
+#
+class TestAppConfigWriteBehind():
+    #
+    # Writes are buffered, visible to reads, and coalesced when flushed
+    #
+    def test_write_behind(self, redis_config):
+        _var_name = "write_behind_var"
+
+        # Use a long interval so the flusher doesn't run during the test
+        redis_config.configure_write_behind(interval=60)
+        redis_config.register(name=_var_name, value="initial", backing_store="redis",
+                write_behind=True)
+        assert redis_config._get_redis(name=_var_name) == "initial"
+
+        for _idx in range(10):
+            redis_config.set(name=_var_name, value=f"value_{_idx}")
+
+        # Reads see the buffered value before it is sent
+        assert redis_config._get_redis(name=_var_name) == "initial"
+        assert redis_config.get(name=_var_name) == "value_9"
+        assert redis_config.get_many(names=[ _var_name ]) == { _var_name: "value_9" }
+        assert redis_config.has_item(name=_var_name)
+
+        # Only the last value is written
+        assert redis_config.flush() == 1
+        assert redis_config._get_redis(name=_var_name) == "value_9"
+        assert redis_config.flush() == 0
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+        assert not redis_config.has_item(name=_var_name)
+
+
+    #
+    # The background thread sends the buffered writes
+    #
+    def test_write_behind_background(self, redis_config):
+        _var_name = "write_behind_background_var"
+
+        redis_config.configure_write_behind(interval=0.01)
+        redis_config.register(name=_var_name, value="initial", backing_store="redis",
+                write_behind=True)
+        redis_config.set(name=_var_name, value="background")
+
+        for _ in range(100):
+            if redis_config._get_redis(name=_var_name) == "background": break
+            time.sleep(0.05)
+
+        assert redis_config._get_redis(name=_var_name) == "background"
+
+        # Delete the Item
+        redis_config.delete(name=_var_name)
+
+
+    #
+    # Deleting an item drops the buffered write
+    #
+    def test_write_behind_delete(self, redis_config):
+        _var_name = "write_behind_delete_var"
+
+        redis_config.configure_write_behind(interval=60)
+        redis_config.register(name=_var_name, value="initial", backing_store="redis",
+                write_behind=True)
+        redis_config.set(name=_var_name, value="buffered")
+
+        redis_config.delete(name=_var_name)
+        redis_config.flush()
+
+        assert not redis_config.has_item(name=_var_name)
+        assert redis_config._get_redis(name=_var_name) is None
+
+
+    #
+    # Write-behind is only for redis items
+    #
+    def test_write_behind_local(self):
+        with pytest.raises(ValueError):
+            pytest.appconfig.register(name="write_behind_local_var", value="local",
+                    write_behind=True)
+
+        with pytest.raises(ValueError):
+            pytest.appconfig.configure_write_behind(interval=0)